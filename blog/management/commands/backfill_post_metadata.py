@@ -0,0 +1,42 @@
+from django.core.management.base import BaseCommand
+from blog.models import Post
+
+
+class Command(BaseCommand):
+    help = "기존 게시글의 미리보기, 단어 수, 읽는 시간을 다시 계산합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="한 번에 갱신할 게시글 수",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        fields = ["excerpt", "word_count", "reading_time"]
+        queryset = (
+            Post.objects.only("id", "content", *fields)
+            .select_related(None)
+            .prefetch_related(None)
+            .order_by("id")
+        )
+
+        batch = []
+        updated = 0
+        for post in queryset.iterator(chunk_size=batch_size):
+            post._build_card_metadata()
+            batch.append(post)
+            if len(batch) >= batch_size:
+                Post.objects.bulk_update(batch, fields)
+                updated += len(batch)
+                batch = []
+
+        if batch:
+            Post.objects.bulk_update(batch, fields)
+            updated += len(batch)
+
+        self.stdout.write(
+            self.style.SUCCESS(f"{updated}개 게시글의 메타데이터를 갱신했습니다.")
+        )
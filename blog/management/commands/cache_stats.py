@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+from blog.services.cache_service import CacheService
+
+
+class Command(BaseCommand):
+    help = "캐시 이름별 hit/miss/recompute/stale/wait 횟수를 출력합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--reset",
+            action="store_true",
+            help="출력 후 카운터를 초기화합니다.",
+        )
+
+    def handle(self, *args, **options):
+        stats = CacheService.get_stats()
+        for name, events in sorted(stats.items()):
+            counts = ", ".join(
+                f"{event}={count}" for event, count in sorted(events.items())
+            )
+            self.stdout.write(f"{name}: {counts}")
+
+        if options["reset"]:
+            CacheService.reset_stats()
+            self.stdout.write(self.style.SUCCESS("캐시 카운터를 초기화했습니다."))
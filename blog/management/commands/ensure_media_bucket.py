@@ -0,0 +1,14 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from blog.media_store import ensure_bucket
+
+
+class Command(BaseCommand):
+    help = "미디어 버킷이 없으면 만듭니다. (서버 시작 전에 한 번 실행)"
+
+    def handle(self, *args, **options):
+        bucket = settings.AWS_STORAGE_BUCKET_NAME
+        if ensure_bucket():
+            self.stdout.write(self.style.SUCCESS(f"'{bucket}' 버킷을 만들었습니다."))
+        else:
+            self.stdout.write(f"'{bucket}' 버킷이 이미 있습니다.")
@@ -0,0 +1,27 @@
+import time
+from django.core.management.base import BaseCommand
+from blog.services.read_service import ReadService
+
+
+class Command(BaseCommand):
+    help = "Redis 버퍼에 누적된 조회수를 DB에 반영합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--interval",
+            type=int,
+            default=0,
+            help="지정하면 N초마다 반복 실행합니다. (백그라운드 플러셔)",
+        )
+
+    def handle(self, *args, **options):
+        interval = options["interval"]
+
+        while True:
+            flushed = ReadService.flush_pending_views()
+            if flushed:
+                self.stdout.write(f"{flushed}개 게시글의 조회수를 반영했습니다.")
+
+            if not interval:
+                break
+            time.sleep(interval)
@@ -0,0 +1,27 @@
+import time
+from django.core.management.base import BaseCommand
+from blog.services.image_service import ImageVariantService
+
+
+class Command(BaseCommand):
+    help = "업로드된 이미지의 반응형 변환본을 만들고 게시글에 반영합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--interval",
+            type=int,
+            default=0,
+            help="지정하면 N초마다 반복 실행합니다. (백그라운드 워커)",
+        )
+
+    def handle(self, *args, **options):
+        interval = options["interval"]
+
+        while True:
+            processed = ImageVariantService.process_pending()
+            if processed:
+                self.stdout.write(f"{processed}개 이미지의 변환본을 만들었습니다.")
+
+            if not interval:
+                break
+            time.sleep(interval)
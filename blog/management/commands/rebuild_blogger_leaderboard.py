@@ -0,0 +1,12 @@
+from django.core.management.base import BaseCommand
+from blog.services.leaderboard_service import BloggerLeaderboardService
+
+
+class Command(BaseCommand):
+    help = "인기 블로거 순위를 블로그 집계 기준으로 다시 만듭니다."
+
+    def handle(self, *args, **options):
+        ranked = BloggerLeaderboardService.rebuild()
+        self.stdout.write(
+            self.style.SUCCESS(f"{ranked}개 블로그의 인기 순위를 다시 만들었습니다.")
+        )
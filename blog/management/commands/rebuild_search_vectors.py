@@ -0,0 +1,49 @@
+from django.core.management.base import BaseCommand
+from blog.models import Post, build_search_vector, supports_full_text_search
+
+
+class Command(BaseCommand):
+    help = "기존 게시글의 전문 검색 벡터를 다시 계산합니다. (PostgreSQL 전용)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="한 번에 갱신할 게시글 수",
+        )
+
+    def handle(self, *args, **options):
+        if not supports_full_text_search():
+            self.stdout.write(
+                self.style.WARNING(
+                    "전문 검색은 PostgreSQL에서만 지원됩니다. (icontains 검색 사용 중)"
+                )
+            )
+            return
+
+        batch_size = options["batch_size"]
+        queryset = (
+            Post.objects.only("id", "title", "content")
+            .select_related(None)
+            .prefetch_related(None)
+            .order_by("id")
+        )
+
+        batch = []
+        updated = 0
+        for post in queryset.iterator(chunk_size=batch_size):
+            post.search_vector = build_search_vector(post.title, post._get_plain_text())
+            batch.append(post)
+            if len(batch) >= batch_size:
+                Post.objects.bulk_update(batch, ["search_vector"])
+                updated += len(batch)
+                batch = []
+
+        if batch:
+            Post.objects.bulk_update(batch, ["search_vector"])
+            updated += len(batch)
+
+        self.stdout.write(
+            self.style.SUCCESS(f"{updated}개 게시글의 검색 벡터를 갱신했습니다.")
+        )
@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+from blog.services.tag_cloud_service import TagCloudService
+
+
+class Command(BaseCommand):
+    help = "블로그별 태그 클라우드를 실제 게시글 기준으로 다시 만듭니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="한 번의 GROUP BY로 집계할 블로그 id 범위",
+        )
+
+    def handle(self, *args, **options):
+        rebuilt = TagCloudService.rebuild_all(batch_size=options["batch_size"])
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{rebuilt}개 블로그의 태그 클라우드를 다시 만들었습니다."
+            )
+        )
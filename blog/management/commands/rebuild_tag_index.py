@@ -0,0 +1,12 @@
+from django.core.management.base import BaseCommand
+from blog.services.tag_index_service import TagIndexService
+
+
+class Command(BaseCommand):
+    help = "태그별 게시글 목록과 인기 태그 순위를 실제 게시글 기준으로 다시 만듭니다."
+
+    def handle(self, *args, **options):
+        rebuilt = TagIndexService.rebuild_all()
+        self.stdout.write(
+            self.style.SUCCESS(f"{rebuilt}개 태그의 게시글 목록을 다시 만들었습니다.")
+        )
@@ -0,0 +1,12 @@
+from django.core.management.base import BaseCommand
+from blog.services.trending_service import TrendingService
+
+
+class Command(BaseCommand):
+    help = "DB 기준으로 트렌딩 정렬 집합을 다시 만듭니다."
+
+    def handle(self, *args, **options):
+        count = TrendingService.rebuild()
+        self.stdout.write(
+            self.style.SUCCESS(f"{count}개 게시글을 트렌딩 집합에 반영했습니다.")
+        )
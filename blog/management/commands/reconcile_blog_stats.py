@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+from blog.models import Blog
+
+
+class Command(BaseCommand):
+    help = "블로그 집계(게시글/조회수/좋아요 수)를 실제 게시글 기준으로 보정합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="한 번의 UPDATE로 보정할 블로그 id 범위",
+        )
+
+    def handle(self, *args, **options):
+        updated = Blog.objects.reconcile_stats(batch_size=options["batch_size"])
+        self.stdout.write(
+            self.style.SUCCESS(f"{updated}개 블로그의 집계를 보정했습니다.")
+        )
@@ -0,0 +1,47 @@
+import time
+from django.core.management.base import BaseCommand
+from blog import task_queue
+from blog import tasks  # noqa: F401 (작업 등록)
+
+
+class Command(BaseCommand):
+    help = "대기열의 백그라운드 작업과 주기 작업을 실행합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="실행할 수 있는 작업을 한 번만 처리하고 종료합니다.",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=1,
+            help="실행할 작업이 없을 때 대기열을 다시 확인하기까지 기다릴 시간(초)",
+        )
+        parser.add_argument(
+            "--stats",
+            action="store_true",
+            help="작업별 성공/재시도/실패 횟수를 출력하고 종료합니다.",
+        )
+
+    def handle(self, *args, **options):
+        if options["stats"]:
+            for name, results in sorted(task_queue.get_stats().items()):
+                counts = ", ".join(
+                    f"{result}={count}" for result, count in sorted(results.items())
+                )
+                self.stdout.write(f"{name}: {counts}")
+            return
+
+        while True:
+            task_queue.requeue_expired()
+            task_queue.schedule_periodic()
+            executed = task_queue.run_pending()
+            if executed:
+                self.stdout.write(f"{executed}개 작업을 실행했습니다.")
+
+            if options["once"]:
+                break
+            if not executed:
+                time.sleep(options["interval"])
@@ -0,0 +1,163 @@
+import threading
+from urllib.parse import urlparse
+import boto3
+from botocore.client import Config
+from botocore.exceptions import ClientError
+from django.conf import settings
+
+# 워커 프로세스 안에서 공유하는 S3(MinIO) 클라이언트 (boto3 클라이언트는 스레드 안전)
+_client = None
+_client_lock = threading.Lock()
+
+# 클라이언트 하나가 유지하는 최대 HTTP 연결 수
+S3_MAX_POOL_CONNECTIONS = 20
+
+
+def get_s3_client():
+    """
+    MinIO에 연결된 S3 클라이언트를 반환합니다.
+    처음 호출할 때 한 번만 만들고 이후에는 연결 풀과 함께 재사용합니다.
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = boto3.client(
+                    "s3",
+                    endpoint_url=settings.AWS_S3_ENDPOINT_URL,
+                    aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+                    aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+                    config=Config(
+                        signature_version=settings.AWS_S3_SIGNATURE_VERSION,
+                        s3={"addressing_style": settings.AWS_S3_ADDRESSING_STYLE},
+                        max_pool_connections=S3_MAX_POOL_CONNECTIONS,
+                    ),
+                    region_name=settings.AWS_S3_REGION_NAME,
+                    verify=getattr(settings, "AWS_S3_VERIFY", None),
+                )
+    return _client
+
+
+def ensure_bucket():
+    """
+    미디어 버킷이 없으면 만듭니다. 요청마다가 아니라 배포/시작 시 한 번 실행합니다.
+
+    Returns:
+        bool: 버킷을 새로 만들었으면 True
+    """
+    client = get_s3_client()
+    bucket = settings.AWS_STORAGE_BUCKET_NAME
+    try:
+        client.head_bucket(Bucket=bucket)
+        return False
+    except ClientError as e:
+        if e.response["Error"]["Code"] not in ("404", "NoSuchBucket"):
+            raise
+    client.create_bucket(Bucket=bucket)
+    return True
+
+
+def get_media_url(key):
+    """업로드한 객체의 공개 URL (버킷명 포함)"""
+    domain = (
+        getattr(settings, "AWS_S3_CUSTOM_DOMAIN", None)
+        or urlparse(settings.AWS_S3_ENDPOINT_URL).netloc
+    )
+    return f"http://{domain}/{settings.AWS_STORAGE_BUCKET_NAME}/{key}"
+
+
+def get_media_key(url):
+    """get_media_url로 만든 URL이면 객체 키를, 아니면 None을 반환"""
+    prefix = get_media_url("")
+    if url and url.startswith(prefix):
+        return url[len(prefix) :]
+    return None
+
+
+def presign_upload(key, content_type, max_size, expires):
+    """
+    브라우저가 미디어 버킷에 직접 올릴 수 있는 presigned POST 정책을 만듭니다.
+    키, Content-Type, 크기가 정책에 고정되므로 다른 객체를 올릴 수 없습니다.
+
+    Args:
+        key: 업로드할 객체 키
+        content_type: 허용할 Content-Type
+        max_size: 최대 바이트 수
+        expires: 정책 유효 시간 (초)
+
+    Returns:
+        dict: {"url", "fields"} (fields를 폼 필드로 함께 보냄)
+    """
+    policy = get_s3_client().generate_presigned_post(
+        Bucket=settings.AWS_STORAGE_BUCKET_NAME,
+        Key=key,
+        Fields={"Content-Type": content_type},
+        Conditions=[
+            {"Content-Type": content_type},
+            ["content-length-range", 1, max_size],
+        ],
+        ExpiresIn=expires,
+    )
+    # 내부 엔드포인트(minio:9000) 대신 브라우저가 접근하는 공개 주소로 보냄
+    # (POST 정책 서명은 호스트와 무관)
+    return {"url": get_media_url("").rstrip("/"), "fields": policy["fields"]}
+
+
+def head_media(key):
+    """
+    객체의 메타데이터를 반환합니다.
+
+    Returns:
+        dict: head_object 응답 (객체가 없으면 None)
+    """
+    try:
+        return get_s3_client().head_object(
+            Bucket=settings.AWS_STORAGE_BUCKET_NAME, Key=key
+        )
+    except ClientError as e:
+        if e.response["Error"]["Code"] in ("404", "NoSuchKey"):
+            return None
+        raise
+
+
+def delete_media(key):
+    get_s3_client().delete_object(Bucket=settings.AWS_STORAGE_BUCKET_NAME, Key=key)
+
+
+def download_media(key):
+    """
+    미디어 버킷에서 객체를 읽어 bytes로 반환합니다.
+
+    Args:
+        key: 객체 키
+
+    Returns:
+        bytes: 객체 내용
+    """
+    response = get_s3_client().get_object(
+        Bucket=settings.AWS_STORAGE_BUCKET_NAME, Key=key
+    )
+    return response["Body"].read()
+
+
+def upload_media(fileobj, key, content_type):
+    """
+    파일을 한 번의 스트리밍 업로드로 미디어 버킷에 저장합니다.
+    (큰 파일은 s3transfer가 멀티파트로 나누어 보냄)
+
+    Args:
+        fileobj: 읽을 수 있는 파일 객체
+        key: 저장할 객체 키
+        content_type: 응답에 쓰일 Content-Type
+
+    Returns:
+        str: 업로드한 객체의 공개 URL
+    """
+    fileobj.seek(0)
+    get_s3_client().upload_fileobj(
+        fileobj,
+        settings.AWS_STORAGE_BUCKET_NAME,
+        key,
+        ExtraArgs={"ContentType": content_type},
+    )
+    return get_media_url(key)
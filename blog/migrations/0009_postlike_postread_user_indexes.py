@@ -0,0 +1,27 @@
+# Generated by Django 5.1.6 on 2026-10-18 10:55
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("blog", "0008_post_excerpt_word_count_reading_time"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="postlike",
+            index=models.Index(
+                fields=["user", "-created_at"], name="postlike_user_created_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="postread",
+            index=models.Index(
+                fields=["user", "-updated_at"], name="postread_user_updated_idx"
+            ),
+        ),
+    ]
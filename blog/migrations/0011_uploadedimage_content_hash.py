@@ -0,0 +1,18 @@
+# Generated by Django 5.1.6 on 2026-10-18 11:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("blog", "0010_uploadedimage"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="uploadedimage",
+            name="content_hash",
+            field=models.CharField(blank=True, max_length=64, null=True, unique=True),
+        ),
+    ]
@@ -1,7 +1,10 @@
 from django.core.paginator import Paginator, PageNotAnInteger, EmptyPage
 from django.http import HttpResponse
-from user.models import Follow
+from django.shortcuts import get_object_or_404
+from user.models import CustomUser, Follow
 from django.db.models import QuerySet
+from .models import Blog
+from .pagination import CursorPaginator
 
 
 class PaginatedListMixin:
@@ -42,7 +45,135 @@ class PaginatedListMixin:
         return context
 
 
-class UserContextMixin:
+class CursorPaginationMixin:
+    """
+    ListView의 Paginator(COUNT + OFFSET)를 커서 페이지네이션으로 대체하는 Mixin.
+    템플릿에는 전체 페이지 수 대신 이전/다음 링크만 전달됩니다.
+    """
+
+    cursor_ordering = ("-created_at", "-id")
+    cursor_query_param = "cursor"
+
+    def get_cursor_paginator(self, queryset, page_size):
+        """페이지네이터 반환 (정렬 집합 등 다른 저장소는 오버라이드)"""
+        return CursorPaginator(queryset, page_size, ordering=self.cursor_ordering)
+
+    def get_cursor_url(self, token):
+        """현재 쿼리 파라미터를 유지한 채 커서만 바꾼 URL 반환"""
+        params = self.request.GET.copy()
+        params.pop("page", None)
+        params[self.cursor_query_param] = token
+        return f"?{params.urlencode()}"
+
+    def paginate_queryset(self, queryset, page_size):
+        paginator = self.get_cursor_paginator(queryset, page_size)
+        page = paginator.page(self.request.GET.get(self.cursor_query_param))
+        return paginator, page, page.object_list, page.has_other_pages()
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        page = context.get("page_obj")
+        context["cursor_pagination"] = True
+        context["next_page_url"] = (
+            self.get_cursor_url(page.next_cursor) if page and page.has_next() else None
+        )
+        context["previous_page_url"] = (
+            self.get_cursor_url(page.previous_cursor)
+            if page and page.has_previous()
+            else None
+        )
+        return context
+
+
+class LikeStatusMixin:
+    """목록 페이지 게시글들의 좋아요 상태를 한 번에 조회하기 위한 Mixin"""
+
+    like_status_context_name = "posts"
+
+    def get_context_data(self, **kwargs):
+        """현재 페이지 게시글에 has_liked 속성 추가"""
+        from .services.like_service import LikeService
+
+        context = super().get_context_data(**kwargs)
+        name = self.like_status_context_name
+        if context.get(name) is not None:
+            context[name] = LikeService.annotate_like_status(
+                self.request.user, context[name]
+            )
+        return context
+
+
+class RequestMemoMixin:
+    """
+    한 요청에서 여러 번 필요한 객체(블로그, 게시글, 소유자, 팔로우/좋아요 관계)를
+    한 번만 조회하도록 결과를 저장하는 Mixin.
+    뷰 인스턴스는 요청마다 새로 만들어지므로 저장된 값도 요청 단위입니다.
+    """
+
+    def memoize(self, name, factory):
+        """name으로 저장된 값이 없으면 factory()를 호출해 저장한 뒤 반환"""
+        memo = self.__dict__.setdefault("_request_memo", {})
+        if name not in memo:
+            memo[name] = factory()
+        return memo[name]
+
+    def get_blog(self):
+        """URL의 username에 해당하는 블로그 (소유자 포함)"""
+        return self.memoize(
+            "blog",
+            lambda: get_object_or_404(
+                Blog.objects.select_related("owner"),
+                owner__username=self.kwargs["username"],
+            ),
+        )
+
+    def get_owner(self):
+        """URL의 username에 해당하는 사용자 (블로그를 이미 조회했다면 그 소유자)"""
+
+        def resolve():
+            blog = self.__dict__.get("_request_memo", {}).get("blog")
+            if blog is not None:
+                return blog.owner
+            return get_object_or_404(CustomUser, username=self.kwargs["username"])
+
+        return self.memoize("owner", resolve)
+
+    def get_viewer_relationship(self, owner):
+        """
+        현재 사용자와 owner의 관계를 반환합니다.
+
+        Returns:
+            dict: is_owner, is_following
+        """
+
+        def resolve():
+            viewer = self.request.user
+            if not viewer.is_authenticated:
+                return {"is_owner": False, "is_following": False}
+            if viewer.pk == owner.pk:
+                return {"is_owner": True, "is_following": False}
+            return {
+                "is_owner": False,
+                "is_following": Follow.objects.filter(
+                    follower=viewer, following=owner
+                ).exists(),
+            }
+
+        return self.memoize(f"relationship:{owner.pk}", resolve)
+
+    def get_viewer_has_liked(self, post):
+        """현재 사용자의 게시글 좋아요 여부 (user_likes가 prefetch되어 있으면 그대로 사용)"""
+        from .services.like_service import LikeService
+
+        def resolve():
+            if hasattr(post, "user_likes"):
+                return bool(post.user_likes)
+            return LikeService.get_like_status(self.request.user, post)
+
+        return self.memoize(f"has_liked:{post.pk}", resolve)
+
+
+class UserContextMixin(RequestMemoMixin):
     """사용자 관련 컨텍스트 데이터 처리를 위한 Mixin"""
 
     def get_user_context(self, **kwargs):
@@ -57,18 +188,14 @@ class UserContextMixin:
             obj = self.get_object()
             if hasattr(obj, "owner") or hasattr(obj, "blog"):
                 target_user = getattr(obj, "owner", None) or getattr(obj, "blog").owner
-                if target_user and target_user != self.request.user:
-                    context["is_following"] = Follow.objects.filter(
-                        follower=self.request.user, following=target_user
-                    ).exists()
-                if target_user == self.request.user:
-                    context["is_owner"] = True
+                if target_user:
+                    context.update(self.get_viewer_relationship(target_user))
 
         # 좋아요 상태 확인 (Post 객체인 경우)
         if hasattr(self, "object") and hasattr(self.object, "liked_by"):
-            context["has_liked"] = self.object.liked_by.filter(
-                id=self.request.user.id
-            ).exists()
+            context["has_liked"] = self.get_viewer_has_liked(self.object)
+            # 템플릿의 is_liked_by 필터도 같은 값을 쓰도록
+            self.object.has_liked = context["has_liked"]
 
         return context
 
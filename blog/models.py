@@ -1,19 +1,117 @@
-from django.db import models
+from django.db import IntegrityError, connection, models, transaction
 from django.utils.text import slugify
 from tinymce.models import HTMLField
 from user.models import CustomUser
-from django.contrib.postgres.search import SearchVectorField
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    SearchVector,
+    SearchVectorField,
+)
 from django.contrib.postgres.indexes import GinIndex
-from bs4 import BeautifulSoup
+from html.parser import HTMLParser
 from taggit.managers import TaggableManager
-from django.db.models import Count, Q, Prefetch, F, Sum, ExpressionWrapper, FloatField
+from django.db.models import (
+    Count,
+    Q,
+    Prefetch,
+    F,
+    Sum,
+    ExpressionWrapper,
+    FloatField,
+    TextField,
+    Value,
+    Case,
+    When,
+    Min,
+    Max,
+)
 from django.db.models.functions import Cast
 from taggit.models import Tag
 from django.utils import timezone
 from datetime import timedelta
 from django.urls import reverse
-from django.core.cache import cache
 from django.conf import settings
+from django.utils.html import strip_tags
+from django.utils.text import Truncator
+import hashlib
+import html
+import math
+import re
+
+# 카드 미리보기 설정
+EXCERPT_WORDS = 30
+WORDS_PER_MINUTE = 200
+
+# 블록 태그 경계에서 단어가 붙지 않도록 공백으로 치환
+BLOCK_TAG_RE = re.compile(
+    r"</?(?:p|div|br|li|ul|ol|h[1-6]|pre|blockquote|table|tr|td|th)\b[^>]*>",
+    re.IGNORECASE,
+)
+
+# 썸네일 탐색 시 한 번에 파서에 넣는 content 크기
+THUMBNAIL_SCAN_CHUNK = 8192
+
+
+class _FirstImageParser(HTMLParser):
+    """첫 번째 <img> 태그를 만나면 파싱을 멈추는 파서 (전체 트리를 만들지 않음)"""
+
+    class Found(Exception):
+        pass
+
+    def __init__(self):
+        super().__init__()
+        self.src = None
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "img":
+            self.src = dict(attrs).get("src") or None
+            raise self.Found
+
+    handle_startendtag = handle_starttag
+
+
+def find_first_image_src(content):
+    """HTML에서 첫 번째 이미지의 src를 반환 (첫 <img>에서 탐색 종료)"""
+    parser = _FirstImageParser()
+    try:
+        for start in range(0, len(content), THUMBNAIL_SCAN_CHUNK):
+            parser.feed(content[start : start + THUMBNAIL_SCAN_CHUNK])
+    except _FirstImageParser.Found:
+        pass
+    return parser.src
+
+
+def content_hash(content):
+    """content 변경 여부 비교용 해시"""
+    return hashlib.blake2b((content or "").encode(), digest_size=16).digest()
+
+
+# slug 충돌(동시 생성) 시 재시도 횟수
+SLUG_MAX_RETRIES = 3
+
+# 제목이 길어도 번호("-1234567")를 붙일 수 있도록 비워 두는 slug 길이
+SLUG_SUFFIX_RESERVE = 8
+
+# 목록 페이지에서 불러오지 않는 무거운 컬럼
+LIST_DEFERRED_FIELDS = ("content", "search_vector")
+
+# 전문 검색 설정 (한국어 형태소 분석기가 없으므로 simple 사용)
+SEARCH_CONFIG = "simple"
+
+
+def supports_full_text_search():
+    """기본 DB가 PostgreSQL 전문 검색을 지원하는지 여부"""
+    return connection.vendor == "postgresql"
+
+
+def build_search_vector(title, text):
+    """제목(A)과 본문 텍스트(B)로 검색 벡터 표현식을 만듭니다."""
+    return SearchVector(
+        Value(title, output_field=TextField()), weight="A", config=SEARCH_CONFIG
+    ) + SearchVector(
+        Value(text, output_field=TextField()), weight="B", config=SEARCH_CONFIG
+    )
 
 
 class PostManager(models.Manager):
@@ -22,7 +120,7 @@ class PostManager(models.Manager):
         return (
             super()
             .get_queryset()
-            .select_related("author", "blog")
+            .select_related("author", "blog__owner")
             .prefetch_related("tags")
         )
 
@@ -47,12 +145,61 @@ class PostManager(models.Manager):
         """특정 사용자의 공개된 포스트"""
         return self.published().filter(author=user)
 
+    def liked_by_user(self, user):
+        """사용자가 좋아요한 공개된 포스트 (좋아요한 시각 liked_at 포함)"""
+        return (
+            self.published()
+            .filter(postlike__user=user)
+            .annotate(liked_at=F("postlike__created_at"))
+        )
+
+    def read_by_user(self, user):
+        """사용자가 읽은 공개된 포스트 (마지막으로 읽은 시각 read_at 포함)"""
+        return (
+            self.published()
+            .filter(postread__user=user)
+            .annotate(read_at=F("postread__updated_at"))
+        )
+
     def search(self, query):
-        """포스트 검색"""
-        return self.published().filter(
-            Q(title__icontains=query) | Q(content__icontains=query)
+        """
+        포스트 검색
+
+        PostgreSQL에서는 GIN 인덱스를 타는 전문 검색 후 관련도 순으로,
+        그 외 DB(SQLite 등)에서는 icontains 검색 후 최신순으로 정렬합니다.
+        """
+        if supports_full_text_search():
+            search_query = SearchQuery(
+                query, config=SEARCH_CONFIG, search_type="websearch"
+            )
+            return (
+                self.published()
+                .filter(search_vector=search_query)
+                .annotate(rank=SearchRank(F("search_vector"), search_query))
+                .order_by("-rank", "-created_at")
+            )
+
+        return (
+            self.published()
+            .filter(Q(title__icontains=query) | Q(content__icontains=query))
+            .order_by("-created_at")
         )
 
+    def adjust_likes(self, post_id, delta):
+        """
+        좋아요 수를 delta만큼 조정하고 갱신된 값을 반환합니다.
+        UPDATE ... RETURNING 한 번으로 처리하므로 refresh_from_db가 필요 없습니다.
+        """
+        table = connection.ops.quote_name(self.model._meta.db_table)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"UPDATE {table} SET likes = CASE WHEN likes + %s < 0 THEN 0 "
+                f"ELSE likes + %s END WHERE id = %s RETURNING likes",
+                [delta, delta, post_id],
+            )
+            row = cursor.fetchone()
+        return row[0] if row else None
+
 
 class BlogManager(models.Manager):
     def get_queryset(self):
@@ -89,6 +236,94 @@ class BlogManager(models.Manager):
             .order_by("-engagement_score")
         )
 
+    def adjust_stats(self, blog_id, posts=0, views=0, likes=0):
+        """
+        블로그 집계 필드를 delta만큼 조정합니다. (UPDATE 한 번)
+        게시글 공개/비공개 전환, 좋아요 토글 시 호출됩니다.
+        """
+        deltas = {"total_posts": posts, "total_views": views, "total_likes": likes}
+        changes = {field: F(field) + delta for field, delta in deltas.items() if delta}
+        if changes:
+            self.filter(id=blog_id).update(**changes)
+            self._refresh_leaderboard([blog_id])
+
+    def adjust_views(self, deltas):
+        """
+        여러 블로그의 조회수 집계를 한 번의 UPDATE로 조정합니다.
+
+        Args:
+            deltas: {blog_id: 증가한 조회수}
+        """
+        if not deltas:
+            return
+        self.filter(id__in=deltas).update(
+            total_views=F("total_views")
+            + Case(
+                *[When(id=pk, then=Value(delta)) for pk, delta in deltas.items()],
+                default=Value(0),
+            )
+        )
+        self._refresh_leaderboard(deltas)
+
+    def _refresh_leaderboard(self, blog_ids):
+        """커밋 후 바뀐 집계로 인기 블로거 순위 점수를 다시 계산"""
+        from .services.leaderboard_service import BloggerLeaderboardService
+
+        blog_ids = list(blog_ids)
+        transaction.on_commit(lambda: BloggerLeaderboardService.refresh(blog_ids))
+
+    def reconcile_stats(self, batch_size=1000):
+        """
+        증분 집계가 어긋난 블로그를 실제 게시글 기준으로 바로잡습니다.
+
+        블로그 id 범위를 batch_size 단위로 나누어, 범위마다 GROUP BY 집계와
+        UPDATE ... FROM 한 번으로 값이 다른 블로그만 갱신합니다.
+        바로잡힌 블로그가 있으면 커밋 후 인기 블로거 순위도 다시 만듭니다.
+
+        Returns:
+            int: 값이 바로잡힌 블로그 수
+        """
+        bounds = self.model.objects.aggregate(low=Min("id"), high=Max("id"))
+        if bounds["low"] is None:
+            return 0
+
+        qn = connection.ops.quote_name
+        blog_table = qn(self.model._meta.db_table)
+        post_table = qn(Post._meta.db_table)
+        sql = f"""
+            UPDATE {blog_table}
+            SET total_posts = s.total_posts,
+                total_views = s.total_views,
+                total_likes = s.total_likes
+            FROM (
+                SELECT b.id AS blog_id,
+                       COUNT(p.id) AS total_posts,
+                       COALESCE(SUM(p.views), 0) AS total_views,
+                       COALESCE(SUM(p.likes), 0) AS total_likes
+                FROM {blog_table} b
+                LEFT JOIN {post_table} p
+                    ON p.blog_id = b.id AND p.status = 'published'
+                WHERE b.id >= %s AND b.id < %s
+                GROUP BY b.id
+            ) AS s
+            WHERE {blog_table}.id = s.blog_id
+              AND ({blog_table}.total_posts <> s.total_posts
+                   OR {blog_table}.total_views <> s.total_views
+                   OR {blog_table}.total_likes <> s.total_likes)
+        """
+
+        updated = 0
+        with connection.cursor() as cursor:
+            for start in range(bounds["low"], bounds["high"] + 1, batch_size):
+                cursor.execute(sql, [start, start + batch_size])
+                updated += cursor.rowcount
+
+        if updated:
+            from .services.leaderboard_service import BloggerLeaderboardService
+
+            transaction.on_commit(BloggerLeaderboardService.rebuild)
+        return updated
+
     def with_tags(self):
         """태그 정보를 포함한 블로그 queryset 반환"""
         return self.get_queryset().prefetch_related(
@@ -152,6 +387,11 @@ class Post(models.Model):
     slug = models.SlugField(max_length=100, unique=True, allow_unicode=True)
     content = HTMLField()
     thumbnail = models.URLField(max_length=500, blank=True, null=True)
+
+    # 목록 카드용 미리 계산된 메타데이터 (save 시점에 갱신)
+    excerpt = models.TextField(blank=True, default="")
+    word_count = models.PositiveIntegerField(default=0)
+    reading_time = models.PositiveIntegerField(default=0)  # 분 단위
     status = models.CharField(
         max_length=10,
         choices=[("draft", "Draft"), ("published", "Published")],
@@ -187,30 +427,99 @@ class Post(models.Model):
     def __str__(self):
         return self.title
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # 공개 상태가 바뀔 때 블로그 집계를 조정하기 위해 저장된 상태를 기억
+        if "status" in instance.__dict__:
+            instance._stored_status = instance.status
+        # slug 재생성 여부를 DB 재조회 없이 판단하기 위해 저장된 제목을 기억
+        if "title" in instance.__dict__:
+            instance._stored_title = instance.title
+        # content가 바뀐 경우에만 썸네일/메타데이터를 다시 계산하기 위한 해시
+        if "content" in instance.__dict__:
+            instance._stored_content_hash = content_hash(instance.content)
+        return instance
+
+    def _slug_needs_update(self):
+        """제목이 바뀌었거나 slug가 없으면 True (DB 재조회 없이 불러온 제목과 비교)"""
+        if self._state.adding or not self.slug:
+            return True
+        return getattr(self, "_stored_title", None) != self.title
+
     def _generate_unique_slug(self):
-        """고유한 slug를 생성합니다."""
-        if (
-            not self.pk
-            or not self.slug
-            or Post.objects.get(pk=self.pk).title != self.title
-        ):
-            base_slug = slugify(self.title, allow_unicode=True)
-            unique_slug = base_slug
-            count = 1
-            while Post.objects.filter(slug=unique_slug).exclude(pk=self.pk).exists():
-                unique_slug = f"{base_slug}-{count}"
-                count += 1
-            return unique_slug
-        return self.slug
+        """
+        고유한 slug를 생성합니다.
+
+        같은 접두사로 시작하는 slug를 한 번에 조회해 다음 번호를 정하므로
+        같은 제목의 글이 많아도 쿼리는 한 번입니다.
+        """
+        # 번호를 붙여도 같은 접두사로 시작하도록 번호 자리를 미리 비워 둠
+        max_length = self._meta.get_field("slug").max_length
+        base_slug = (
+            slugify(self.title, allow_unicode=True)[
+                : max_length - SLUG_SUFFIX_RESERVE
+            ].rstrip("-")
+            or "post"
+        )
+        pattern = re.compile(rf"^{re.escape(base_slug)}(?:-(\d+))?$")
+
+        taken = set(
+            Post.objects.filter(slug__startswith=base_slug)
+            .exclude(pk=self.pk)
+            .values_list("slug", flat=True)
+        )
+        # 현재 slug가 같은 제목 패턴이고 비어 있으면 그대로 유지
+        if self.slug and pattern.match(self.slug) and self.slug not in taken:
+            return self.slug
+        if base_slug not in taken:
+            return base_slug
+
+        suffixes = [
+            int(match.group(1) or 0)
+            for match in map(pattern.match, taken)
+            if match is not None
+        ]
+        return f"{base_slug}-{max(suffixes) + 1}"
 
     def _extract_thumbnail(self):
-        """content에서 첫 번째 이미지를 썸네일로 추출합니다."""
+        """content에서 첫 번째 이미지를 썸네일로 추출합니다. (변환본이 있으면 작은 변환본)"""
+        from .services.image_service import ImageVariantService
+
         if self.content:
-            soup = BeautifulSoup(self.content, "html.parser")
-            img = soup.find("img")
-            return img["src"] if img and img.get("src") else None
+            return ImageVariantService.thumbnail_url(find_first_image_src(self.content))
         return None
 
+    def _use_image_variants(self):
+        """변환이 끝난 업로드 이미지를 반응형 변환본으로 바꿉니다."""
+        from .services.image_service import ImageVariantService
+
+        self.content = ImageVariantService.rewrite_content(self.content)
+
+    def _content_needs_update(self):
+        """
+        content가 바뀌었으면 True.
+        불러오지 않은(defer) content는 바뀌지 않은 것으로 보고, 불러온 값은 해시로 비교합니다.
+        """
+        if self._state.adding:
+            return True
+        if "content" not in self.__dict__:
+            return False
+        return getattr(self, "_stored_content_hash", None) != content_hash(self.content)
+
+    def _get_plain_text(self):
+        """content에서 HTML 태그를 제거한 본문 텍스트를 반환합니다."""
+        content = BLOCK_TAG_RE.sub(" ", self.content or "")
+        return " ".join(html.unescape(strip_tags(content)).split())
+
+    def _build_card_metadata(self):
+        """content에서 미리보기 텍스트, 단어 수, 읽는 시간을 계산합니다."""
+        text = self._get_plain_text()
+        word_count = len(text.split())
+        self.excerpt = Truncator(text).words(EXCERPT_WORDS)
+        self.word_count = word_count
+        self.reading_time = max(1, math.ceil(word_count / WORDS_PER_MINUTE))
+
     def clean(self):
         """데이터 유효성 검사를 수행합니다."""
         if self.status not in dict(self._meta.get_field("status").choices):
@@ -221,13 +530,94 @@ class Post(models.Model):
         # clean 메서드 호출하여 유효성 검사 수행
         self.clean()
 
-        # slug 생성
-        self.slug = self._generate_unique_slug()
-
-        # 썸네일 추출
-        self.thumbnail = self._extract_thumbnail()
+        # slug 생성 (제목이 바뀐 경우만)
+        slug_changed = self._slug_needs_update()
+        if slug_changed:
+            self.slug = self._generate_unique_slug()
+
+        # 이미지 변환본 적용, 썸네일 추출, 목록 카드 메타데이터 계산 (content가 바뀐 경우만)
+        content_changed = self._content_needs_update()
+        if content_changed:
+            self._use_image_variants()
+            self.thumbnail = self._extract_thumbnail()
+            self._build_card_metadata()
+
+        # 공개 전환 1, 비공개 전환 -1, 그 외 0
+        # (post_save 시그널에서 태그 클라우드 반영에 쓰이므로 저장 전에 계산)
+        adding = self._state.adding
+        update_fields = kwargs.get("update_fields")
+        self._published_delta = 0
+        if update_fields is None or "status" in update_fields:
+            self._published_delta = self._get_published_delta(adding)
+
+        if slug_changed:
+            self._save_with_slug_retry(*args, **kwargs)
+        else:
+            super().save(*args, **kwargs)
+        self._stored_title = self.title
+        if content_changed:
+            self._stored_content_hash = content_hash(self.content)
+
+        if update_fields is None or "status" in update_fields:
+            self._adjust_blog_stats(adding)
+
+        # 제목/본문이 바뀌어 저장된 경우 검색 벡터 갱신
+        if (slug_changed or content_changed) and (
+            update_fields is None or {"title", "content"} & set(update_fields)
+        ):
+            self._update_search_vector()
+
+    def _save_with_slug_retry(self, *args, **kwargs):
+        """
+        저장 시 다른 요청이 같은 slug를 먼저 차지했다면 slug를 다시 정해 재시도합니다.
+        (미리 exists()로 확인하지 않고 unique 인덱스에 맡김)
+        """
+        for attempt in range(SLUG_MAX_RETRIES):
+            try:
+                with transaction.atomic():
+                    super().save(*args, **kwargs)
+                return
+            except IntegrityError:
+                slug_taken = (
+                    Post.objects.filter(slug=self.slug).exclude(pk=self.pk).exists()
+                )
+                if not slug_taken or attempt == SLUG_MAX_RETRIES - 1:
+                    raise
+                self.slug = self._generate_unique_slug()
+
+    def _get_published_delta(self, adding):
+        """공개 전환이면 1, 비공개 전환이면 -1, 변화가 없으면 0"""
+        if not adding and not hasattr(self, "_stored_status"):
+            # 이전 상태를 알 수 없음 (status를 불러오지 않은 경우) - 정기 보정에 맡김
+            return 0
+        was_published = not adding and self._stored_status == "published"
+        is_published = self.status == "published"
+        if was_published == is_published:
+            return 0
+        return 1 if is_published else -1
+
+    def _adjust_blog_stats(self, adding):
+        """공개/비공개 전환 시 블로그 집계에 게시글 수, 조회수, 좋아요 수를 반영"""
+        if not adding and not hasattr(self, "_stored_status"):
+            return
+        self._stored_status = self.status
+
+        sign = self._published_delta
+        if sign:
+            Blog.objects.adjust_stats(
+                self.blog_id,
+                posts=sign,
+                views=sign * self.views,
+                likes=sign * self.likes,
+            )
 
-        super().save(*args, **kwargs)
+    def _update_search_vector(self):
+        """검색 벡터를 갱신합니다. (PostgreSQL에서만 동작)"""
+        if not supports_full_text_search():
+            return
+        Post.objects.filter(pk=self.pk).update(
+            search_vector=build_search_vector(self.title, self._get_plain_text())
+        )
 
     def get_like_url(self):
         """좋아요 토글 URL 반환"""
@@ -242,43 +632,32 @@ class Post(models.Model):
 
     def get_likes_count(self):
         """좋아요 수 조회 (캐시 적용)"""
-        cache_key = self.get_cache_key("likes")
-        count = cache.get(cache_key)
+        from .services.like_service import LikeService
 
-        if count is None:
-            count = self.likes
-            cache.set(cache_key, count, settings.LIKES_CACHE_TTL)
-
-        return count
+        return LikeService.get_likes_count(self)
 
     def get_views_count(self):
-        """조회수 조회 (캐시 적용)"""
-        cache_key = self.get_cache_key("views")
-        count = cache.get(cache_key)
-
-        if count is None:
-            count = self.views
-            cache.set(cache_key, count, settings.VIEWS_CACHE_TTL)
+        """조회수 조회 (DB 값 + 버퍼에 누적된 조회수)"""
+        from .services.read_service import ReadService
 
-        return count
+        return ReadService.get_views_count(self)
 
     def increment_likes(self):
         """좋아요 수 증가"""
-        Post.objects.filter(id=self.id).update(likes=F("likes") + 1)
-        self.refresh_from_db()
+        self.likes = Post.objects.adjust_likes(self.id, 1)
         return self.likes
 
     def decrement_likes(self):
         """좋아요 수 감소"""
-        Post.objects.filter(id=self.id).update(likes=F("likes") - 1)
-        self.refresh_from_db()
+        self.likes = Post.objects.adjust_likes(self.id, -1)
         return self.likes
 
     def increment_views(self):
-        """조회수 증가"""
-        Post.objects.filter(id=self.id).update(views=F("views") + 1)
-        self.refresh_from_db()
-        return self.views
+        """조회수 증가 (버퍼에 누적 후 주기적으로 DB에 반영)"""
+        from .services.read_service import ReadService
+
+        ReadService.buffer_view(self)
+        return self.get_views_count()
 
     def get_absolute_url(self):
         """게시글의 상세 페이지 URL을 반환"""
@@ -294,16 +673,42 @@ class PostLikeManager(models.Manager):
         return super().get_queryset().select_related("user", "post")
 
     def toggle(self, user, post):
-        """좋아요 토글: 없으면 생성, 있으면 삭제"""
-        like, created = self.get_or_create(user=user, post=post)
-        if not created:
-            like.delete()
-            post.likes = models.F("likes") - 1
-            post.save()
-            return None
-        post.likes = models.F("likes") + 1
-        post.save()
-        return like
+        """
+        좋아요 토글: 있으면 삭제, 없으면 생성하고 같은 트랜잭션에서 좋아요 수를 조정
+
+        DELETE(또는 INSERT) 후 UPDATE ... RETURNING으로 처리하며, 좋아요 수는
+        실제로 삭제/생성된 행에 대해서만 변경되므로 동시 클릭에도 어긋나지 않습니다.
+
+        Returns:
+            tuple: (좋아요 상태, 갱신된 좋아요 수)
+        """
+        with transaction.atomic():
+            deleted, _ = self.filter(user=user, post=post).delete()
+            if deleted:
+                has_liked, delta = False, -1
+            else:
+                has_liked, delta = True, int(self._insert_if_absent(user, post))
+            post.likes = Post.objects.adjust_likes(post.id, delta)
+            if post.status == "published":
+                Blog.objects.adjust_stats(post.blog_id, likes=delta)
+        return has_liked, post.likes
+
+    def _insert_if_absent(self, user, post):
+        """좋아요 행을 생성하고, 이미 존재하면 아무것도 하지 않음 (생성 여부 반환)"""
+        opts = self.model._meta
+        qn = connection.ops.quote_name
+        columns = ", ".join(
+            qn(opts.get_field(name).column) for name in ("user", "post", "created_at")
+        )
+        created_at = connection.ops.adapt_datetimefield_value(timezone.now())
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"INSERT INTO {qn(opts.db_table)} ({columns}) VALUES (%s, %s, %s) "
+                f"ON CONFLICT ({qn(opts.get_field('user').column)}, "
+                f"{qn(opts.get_field('post').column)}) DO NOTHING RETURNING id",
+                [user.id, post.id, created_at],
+            )
+            return cursor.fetchone() is not None
 
     def get_user_likes(self, user):
         """특정 사용자의 좋아요 목록"""
@@ -361,6 +766,11 @@ class PostLike(models.Model):
     class Meta:
         unique_together = ("user", "post")
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(
+                fields=["user", "-created_at"], name="postlike_user_created_idx"
+            )
+        ]
 
     def __str__(self):
         return f"{self.user.username} likes {self.post.title}"
@@ -377,6 +787,57 @@ class PostRead(models.Model):
     class Meta:
         unique_together = ("user", "post")
         ordering = ["-updated_at"]
+        indexes = [
+            models.Index(
+                fields=["user", "-updated_at"], name="postread_user_updated_idx"
+            )
+        ]
 
     def __str__(self):
         return f"{self.user.username} read {self.post.title}"
+
+
+class ViewFlush(models.Model):
+    """
+    DB에 반영한 조회수 버퍼 배치 기록.
+    조회수 UPDATE와 같은 트랜잭션에서 저장되므로, 커밋 후 Redis 정리 전에
+    중단되어 같은 배치를 다시 반영하려 할 때 건너뛸 수 있습니다.
+    """
+
+    batch_id = models.CharField(max_length=32, unique=True)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    def __str__(self):
+        return self.batch_id
+
+
+class UploadedImage(models.Model):
+    """에디터로 업로드한 원본 이미지와 반응형 변환본 정보"""
+
+    STATUS_CHOICES = [
+        ("pending", "Pending"),
+        ("ready", "Ready"),
+        ("skipped", "Skipped"),
+        ("failed", "Failed"),
+    ]
+
+    key = models.CharField(max_length=500, unique=True)  # 원본 객체 키
+    # 원본 내용의 SHA-256 (같은 이미지를 다시 올리면 기존 객체를 재사용)
+    content_hash = models.CharField(max_length=64, unique=True, null=True, blank=True)
+    uploader = models.ForeignKey(
+        CustomUser,
+        on_delete=models.SET_NULL,
+        null=True,
+        related_name="uploaded_images",
+    )
+    content_type = models.CharField(max_length=100)
+    width = models.PositiveIntegerField(null=True, blank=True)
+    height = models.PositiveIntegerField(null=True, blank=True)
+    # 변환본 이름 -> 실제 너비 (예: {"thumbnail": 400, "card": 800, "content": 1600})
+    variant_widths = models.JSONField(default=dict, blank=True)
+    fallback_format = models.CharField(max_length=10, blank=True)  # jpg 또는 png
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default="pending")
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return self.key
@@ -0,0 +1,260 @@
+import base64
+import binascii
+import datetime
+import json
+from django.core.exceptions import ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q
+from .redis_store import READY_MEMBER, get_redis
+
+
+class CursorJSONEncoder(DjangoJSONEncoder):
+    """
+    시각을 마이크로초까지 그대로 저장하는 인코더.
+    DjangoJSONEncoder는 밀리초로 자르므로 같은 밀리초에 만든 행을 구분하지 못함
+    """
+
+    def default(self, o):
+        if isinstance(o, datetime.datetime):
+            return o.isoformat()
+        return super().default(o)
+
+
+def encode_cursor(values, direction):
+    """정렬 키 값과 방향을 URL에 넣을 수 있는 불투명한 토큰으로 변환"""
+    payload = json.dumps(
+        {"v": list(values), "d": direction},
+        cls=CursorJSONEncoder,
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token):
+    """
+    토큰을 (정렬 키 값 목록, 방향)으로 복원합니다.
+    잘못된 토큰이면 None을 반환합니다. (첫 페이지로 처리)
+    """
+    if not token:
+        return None
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        values, direction = payload["v"], payload["d"]
+    except (binascii.Error, ValueError, KeyError, TypeError):
+        return None
+    if direction not in ("next", "prev") or not isinstance(values, list):
+        return None
+    return values, direction
+
+
+class CursorPage:
+    """커서 페이지네이션 결과 (전체 개수/페이지 수 없이 이전/다음 토큰만 가짐)"""
+
+    def __init__(self, object_list, next_cursor=None, previous_cursor=None):
+        self.object_list = object_list
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def has_next(self):
+        return self.next_cursor is not None
+
+    def has_previous(self):
+        return self.previous_cursor is not None
+
+    def has_other_pages(self):
+        return self.has_next() or self.has_previous()
+
+
+class CursorPaginator:
+    """
+    (created_at, id) 같은 정렬 키를 기준으로 한 keyset 페이지네이션.
+    정렬 키에는 annotate로 추가한 값(예: 좋아요한 시각)도 쓸 수 있습니다.
+
+    COUNT(*)와 OFFSET 없이 "WHERE 정렬키 < 마지막 값 LIMIT n+1" 한 번으로
+    페이지를 가져오므로 몇 번째 페이지든 비용이 같습니다.
+    ordering의 마지막 필드는 고유해야 합니다. (예: "-id")
+    """
+
+    def __init__(self, queryset, per_page, ordering=("-created_at", "-id")):
+        self.queryset = queryset
+        self.per_page = per_page
+        self.ordering = tuple(ordering)
+        self.fields = [name.lstrip("-") for name in self.ordering]
+
+    def _get_field(self, name):
+        """정렬 키의 필드 (annotate로 추가한 값이면 그 출력 필드)"""
+        annotation = self.queryset.query.annotations.get(name)
+        if annotation is not None:
+            return annotation.output_field
+        return self.queryset.model._meta.get_field(name)
+
+    def _parse_values(self, values):
+        """토큰에 담긴 값을 모델 필드 타입으로 변환"""
+        if len(values) != len(self.fields):
+            return None
+        try:
+            return [
+                self._get_field(name).to_python(value)
+                for name, value in zip(self.fields, values)
+            ]
+        except ValidationError:
+            return None
+
+    def _keyset_filter(self, values, direction):
+        """정렬 키가 values보다 뒤(next) 또는 앞(prev)인 행을 고르는 조건"""
+        condition = Q()
+        for i, name in enumerate(self.ordering):
+            field = name.lstrip("-")
+            descending = name.startswith("-")
+            if direction == "prev":
+                descending = not descending
+            lookup = "lt" if descending else "gt"
+            equal = {self.fields[j]: values[j] for j in range(i)}
+            condition |= Q(**equal, **{f"{field}__{lookup}": values[i]})
+        return condition
+
+    def _cursor_for(self, obj, direction):
+        return encode_cursor([getattr(obj, name) for name in self.fields], direction)
+
+    def page(self, token):
+        """
+        커서 토큰에 해당하는 페이지를 반환합니다.
+
+        Args:
+            token: 이전 페이지에서 받은 커서 토큰 (없거나 잘못되면 첫 페이지)
+
+        Returns:
+            CursorPage: 현재 페이지
+        """
+        cursor = decode_cursor(token)
+        values = self._parse_values(cursor[0]) if cursor else None
+        direction = cursor[1] if values is not None else "next"
+
+        queryset = self.queryset
+        if values is None:
+            queryset = queryset.order_by(*self.ordering)
+        elif direction == "next":
+            queryset = queryset.filter(self._keyset_filter(values, "next"))
+            queryset = queryset.order_by(*self.ordering)
+        else:
+            reverse = [
+                name[1:] if name.startswith("-") else f"-{name}"
+                for name in self.ordering
+            ]
+            queryset = queryset.filter(self._keyset_filter(values, "prev"))
+            queryset = queryset.order_by(*reverse)
+
+        rows = list(queryset[: self.per_page + 1])
+        has_more = len(rows) > self.per_page
+        rows = rows[: self.per_page]
+        if direction == "prev":
+            rows.reverse()
+
+        if not rows:
+            return CursorPage([])
+
+        # 커서로 들어온 경우 반대 방향에는 항상 페이지가 있음
+        if direction == "next":
+            has_next, has_previous = has_more, values is not None
+        else:
+            has_next, has_previous = True, has_more
+
+        return CursorPage(
+            rows,
+            next_cursor=self._cursor_for(rows[-1], "next") if has_next else None,
+            previous_cursor=(
+                self._cursor_for(rows[0], "prev") if has_previous else None
+            ),
+        )
+
+
+class SortedSetPaginator:
+    """
+    Redis 정렬 집합을 점수 내림차순으로 (점수, 멤버) 커서를 이용해 읽는 페이지네이터.
+
+    ZREVRANGEBYSCORE로 커서 이후 범위만 가져오므로 깊은 페이지도 비용이 같고,
+    멤버(객체 ID)만 읽은 뒤 load_objects로 한 번에 조회합니다.
+    CursorPaginator와 같은 인터페이스(page)를 제공합니다.
+    """
+
+    def __init__(self, key, per_page, load_objects):
+        self.key = key
+        self.per_page = per_page
+        self.load_objects = load_objects
+
+    def page(self, token):
+        """
+        커서 토큰에 해당하는 페이지를 반환합니다.
+
+        Args:
+            token: 이전 페이지에서 받은 커서 토큰 (없거나 잘못되면 첫 페이지)
+
+        Returns:
+            CursorPage: 현재 페이지
+        """
+        cursor = decode_cursor(token)
+        try:
+            score, member = float(cursor[0][0]), str(cursor[0][1]).encode()
+            direction = cursor[1]
+        except (TypeError, ValueError, IndexError):
+            score = member = None
+            direction = "next"
+
+        redis = get_redis()
+        if score is None:
+            entries = redis.zrevrange(self.key, 0, self.per_page, withscores=True)
+        elif direction == "next":
+            # 같은 점수의 멤버는 역사전순으로 정렬되므로 커서 멤버까지 건너뜀
+            ties = redis.zrevrangebyscore(self.key, score, score)
+            skip = sum(1 for tie in ties if tie >= member)
+            entries = redis.zrevrangebyscore(
+                self.key,
+                score,
+                "-inf",
+                start=skip,
+                num=self.per_page + 1,
+                withscores=True,
+            )
+        else:
+            ties = redis.zrangebyscore(self.key, score, score)
+            skip = sum(1 for tie in ties if tie <= member)
+            entries = redis.zrangebyscore(
+                self.key,
+                score,
+                "+inf",
+                start=skip,
+                num=self.per_page + 1,
+                withscores=True,
+            )
+
+        # 준비 표시 멤버는 결과에서 제외
+        entries = [entry for entry in entries if entry[0] != READY_MEMBER]
+        has_more = len(entries) > self.per_page
+        entries = entries[: self.per_page]
+        if direction == "prev":
+            entries.reverse()
+
+        if not entries:
+            return CursorPage([])
+        objects = self.load_objects([int(member) for member, _ in entries])
+
+        if direction == "next":
+            has_next, has_previous = has_more, score is not None
+        else:
+            has_next, has_previous = True, has_more
+
+        def cursor_for(entry, direction):
+            return encode_cursor([entry[1], entry[0].decode()], direction)
+
+        return CursorPage(
+            objects,
+            next_cursor=cursor_for(entries[-1], "next") if has_next else None,
+            previous_cursor=cursor_for(entries[0], "prev") if has_previous else None,
+        )
@@ -0,0 +1,276 @@
+import threading
+from django.core.cache import caches
+from redis.exceptions import ResponseError
+
+# 정렬 집합이 끝까지 채워졌음을 표시하는 멤버 (점수 -inf, 항상 마지막)
+# 집합과 같은 키에 있으므로 키가 축출되면 표시도 함께 사라짐
+READY_MEMBER = b"__ready__"
+
+
+def _encode(value):
+    """Redis와 동일하게 값을 bytes로 변환"""
+    if isinstance(value, bytes):
+        return value
+    if isinstance(value, str):
+        return value.encode()
+    return str(value).encode()
+
+
+def _score_bound(value):
+    """zrangebyscore 범위 인자를 float로 변환 ("-inf", "(1.5" 등 지원)"""
+    if isinstance(value, (int, float)):
+        return float(value), False
+    value = value.decode() if isinstance(value, bytes) else str(value)
+    if value.startswith("("):
+        return float(value[1:]), True
+    return float(value), False
+
+
+class _Pipeline:
+    """명령을 모아 두었다가 execute()에서 순서대로 실행하는 파이프라인"""
+
+    def __init__(self, client):
+        self._client = client
+        self._commands = []
+
+    def __getattr__(self, name):
+        method = getattr(self._client, name)
+
+        def queue(*args, **kwargs):
+            self._commands.append((method, args, kwargs))
+            return self
+
+        return queue
+
+    def execute(self):
+        commands, self._commands = self._commands, []
+        with self._client._lock:
+            return [method(*args, **kwargs) for method, args, kwargs in commands]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self._commands = []
+
+
+class CacheBackedRedis:
+    """
+    Redis 명령 일부를 Django 캐시 API 위에서 흉내 내는 대체 구현.
+
+    캐시 백엔드가 Redis가 아닌 환경(로컬 개발, 테스트)에서 사용되며,
+    원자성은 프로세스 내부에서만 보장됩니다. 모든 키는 캐시에 저장되므로
+    cache.clear() 호출 시 함께 초기화됩니다.
+    """
+
+    _lock = threading.RLock()
+
+    def __init__(self, cache):
+        self._cache = cache
+
+    def _get(self, key, default=None):
+        value = self._cache.get(key)
+        return default if value is None else value
+
+    def _set(self, key, value):
+        self._cache.set(key, value, None)
+
+    # 키
+    def exists(self, *keys):
+        return sum(1 for key in keys if self._cache.get(key) is not None)
+
+    def delete(self, *keys):
+        with self._lock:
+            count = self.exists(*keys)
+            self._cache.delete_many(keys)
+            return count
+
+    def set(self, key, value, ex=None, nx=False):
+        with self._lock:
+            if nx:
+                return self._cache.add(key, _encode(value), ex) or None
+            self._cache.set(key, _encode(value), ex)
+            return True
+
+    def get(self, key):
+        return self._cache.get(key)
+
+    def rename(self, src, dst):
+        with self._lock:
+            value = self._cache.get(src)
+            if value is None:
+                raise ResponseError("no such key")
+            self._set(dst, value)
+            self._cache.delete(src)
+            return True
+
+    def renamenx(self, src, dst):
+        with self._lock:
+            value = self._cache.get(src)
+            if value is None:
+                raise ResponseError("no such key")
+            if self._cache.get(dst) is not None:
+                return False
+            self._set(dst, value)
+            self._cache.delete(src)
+            return True
+
+    # 해시
+    def hincrby(self, name, key, amount=1):
+        with self._lock:
+            data = dict(self._get(name, {}))
+            field = _encode(key)
+            data[field] = _encode(int(data.get(field, 0)) + amount)
+            self._set(name, data)
+            return int(data[field])
+
+    def hset(self, name, key=None, value=None, mapping=None):
+        with self._lock:
+            data = dict(self._get(name, {}))
+            items = dict(mapping or {})
+            if key is not None:
+                items[key] = value
+            added = 0
+            for field, field_value in items.items():
+                field = _encode(field)
+                added += field not in data
+                data[field] = _encode(field_value)
+            self._set(name, data)
+            return added
+
+    def hdel(self, name, *keys):
+        with self._lock:
+            data = dict(self._get(name, {}))
+            removed = 0
+            for field in map(_encode, keys):
+                removed += data.pop(field, None) is not None
+            if data:
+                self._set(name, data)
+            else:
+                self._cache.delete(name)
+            return removed
+
+    def hget(self, name, key):
+        return self._get(name, {}).get(_encode(key))
+
+    def hgetall(self, name):
+        return dict(self._get(name, {}))
+
+    # 정렬 집합
+    def zadd(self, name, mapping):
+        with self._lock:
+            data = dict(self._get(name, {}))
+            added = 0
+            for member, score in mapping.items():
+                member = _encode(member)
+                added += member not in data
+                data[member] = float(score)
+            self._set(name, data)
+            return added
+
+    def zincrby(self, name, amount, value):
+        with self._lock:
+            data = dict(self._get(name, {}))
+            member = _encode(value)
+            data[member] = data.get(member, 0.0) + float(amount)
+            self._set(name, data)
+            return data[member]
+
+    def zrem(self, name, *values):
+        with self._lock:
+            data = dict(self._get(name, {}))
+            removed = 0
+            for value in values:
+                removed += data.pop(_encode(value), None) is not None
+            if data:
+                self._set(name, data)
+            else:
+                self._cache.delete(name)
+            return removed
+
+    def zcard(self, name):
+        return len(self._get(name, {}))
+
+    def zscore(self, name, value):
+        return self._get(name, {}).get(_encode(value))
+
+    def _sorted(self, name, desc):
+        items = sorted(self._get(name, {}).items(), key=lambda item: (item[1], item[0]))
+        return items[::-1] if desc else items
+
+    @staticmethod
+    def _slice(items, start, end):
+        # Redis와 같이 음수 인덱스와 end 포함 범위를 지원
+        start = max(start + len(items), 0) if start < 0 else start
+        end = end + len(items) if end < 0 else end
+        return items[start : end + 1]
+
+    def zrange(self, name, start, end, desc=False, withscores=False):
+        items = self._slice(self._sorted(name, desc), start, end)
+        return items if withscores else [member for member, _ in items]
+
+    def zrevrange(self, name, start, end, withscores=False):
+        return self.zrange(name, start, end, desc=True, withscores=withscores)
+
+    def zrangebyscore(self, name, min, max, start=None, num=None, withscores=False):
+        (low, low_open), (high, high_open) = _score_bound(min), _score_bound(max)
+        items = [
+            (member, score)
+            for member, score in self._sorted(name, False)
+            if (score > low if low_open else score >= low)
+            and (score < high if high_open else score <= high)
+        ]
+        if start is not None:
+            items = items[start : start + num]
+        return items if withscores else [member for member, _ in items]
+
+    def zrevrangebyscore(self, name, max, min, start=None, num=None, withscores=False):
+        items = self.zrangebyscore(name, min, max, withscores=True)[::-1]
+        if start is not None:
+            items = items[start : start + num]
+        return items if withscores else [member for member, _ in items]
+
+    def zremrangebyrank(self, name, min, max):
+        with self._lock:
+            removed = self._slice(self._sorted(name, False), min, max)
+            if removed:
+                self.zrem(name, *[member for member, _ in removed])
+            return len(removed)
+
+    # 집합
+    def sadd(self, name, *values):
+        with self._lock:
+            data = set(self._get(name, set()))
+            before = len(data)
+            data.update(_encode(value) for value in values)
+            self._set(name, data)
+            return len(data) - before
+
+    def srem(self, name, *values):
+        with self._lock:
+            data = set(self._get(name, set()))
+            before = len(data)
+            data.difference_update(_encode(value) for value in values)
+            if data:
+                self._set(name, data)
+            else:
+                self._cache.delete(name)
+            return before - len(data)
+
+    def smembers(self, name):
+        return set(self._get(name, set()))
+
+    def pipeline(self, transaction=True):
+        return _Pipeline(self)
+
+
+def get_redis():
+    """
+    캐시 백엔드와 같은 Redis 서버에 연결된 클라이언트를 반환합니다.
+    캐시 백엔드가 Redis가 아니면 CacheBackedRedis를 반환합니다.
+    """
+    backend = caches["default"]
+    client = getattr(backend, "_cache", None)
+    if hasattr(client, "get_client"):
+        return client.get_client(write=True)
+    return CacheBackedRedis(backend)
@@ -0,0 +1,226 @@
+import math
+import random
+import threading
+import time
+from collections import Counter, defaultdict
+from django.conf import settings
+from django.core.cache import cache
+from ..redis_store import get_redis
+
+# 만료 시각을 흩어 같은 시각에 만든 키가 한꺼번에 만료되지 않도록 하는 비율 (±10%)
+CACHE_TTL_JITTER = 0.1
+
+# 조기 재계산(XFetch) 강도: 클수록 만료 전에 더 일찍 다시 계산
+XFETCH_BETA = 1.0
+
+# 다시 계산하는 워커가 잡는 잠금의 최대 유지 시간
+RECOMPUTE_LOCK_TTL = 30
+
+# 다른 워커가 계산 중일 때 값이 채워지기를 기다리는 최대 시간과 확인 간격
+RECOMPUTE_WAIT_TIMEOUT = 2
+RECOMPUTE_WAIT_INTERVAL = 0.05
+
+# 프로세스별 카운터를 Redis에 합산하는 주기
+STATS_FLUSH_INTERVAL = 10
+STATS_KEY = f"{settings.CACHE_KEY_PREFIX}:cache:stats"
+
+_stats = Counter()
+_stats_lock = threading.Lock()
+_stats_flushed_at = time.monotonic()
+
+
+class CacheService:
+    """
+    캐시 스탬피드를 막는 get-or-compute 헬퍼.
+
+    - 단일 비행(single-flight): 값이 없을 때 잠금을 얻은 워커 하나만 계산하고
+      나머지는 잠시 기다렸다가 채워진 값을 읽습니다.
+    - 확률적 조기 재계산(XFetch): 만료가 가까울수록, 계산이 오래 걸리는 값일수록
+      높은 확률로 한 워커가 미리 다시 계산하고, 그동안 다른 요청은 기존 값을 씁니다.
+    - TTL 지터: 저장 시 TTL을 흩어 동시에 만든 키가 같이 만료되지 않게 합니다.
+
+    이름(name)별 hit/miss/recompute/stale/wait 카운터는 get_stats로 확인합니다.
+    """
+
+    @staticmethod
+    def _lock_key(key):
+        return f"{key}:lock"
+
+    @staticmethod
+    def jitter(ttl):
+        """TTL을 ±CACHE_TTL_JITTER 범위에서 흩어 반환"""
+        return ttl * random.uniform(1 - CACHE_TTL_JITTER, 1 + CACHE_TTL_JITTER)
+
+    @staticmethod
+    def set(key, value, ttl, delta=0):
+        """
+        값을 만료 시각, 계산 시간과 함께 저장합니다.
+
+        Args:
+            key: 캐시 키
+            value: 저장할 값
+            ttl: 기준 TTL (초, 지터 적용)
+            delta: 값을 계산하는 데 걸린 시간 (초, 조기 재계산 확률에 사용)
+        """
+        ttl = CacheService.jitter(ttl)
+        entry = {"value": value, "delta": delta, "expiry": time.time() + ttl}
+        cache.set(key, entry, math.ceil(ttl))
+
+    @staticmethod
+    def delete(key):
+        cache.delete(key)
+
+    @staticmethod
+    def _get_entry(key):
+        """
+        저장된 항목을 읽습니다. 이 형식 이전에 같은 키로 저장된 값(예: 좋아요 수 정수)은
+        없는 것으로 보고 다시 계산하게 합니다.
+        """
+        entry = cache.get(key)
+        if isinstance(entry, dict) and "expiry" in entry:
+            return entry
+        return None
+
+    @staticmethod
+    def _should_recompute_early(entry):
+        """XFetch: now - delta * beta * ln(rand) >= expiry 이면 미리 다시 계산"""
+        gap = -entry["delta"] * XFETCH_BETA * math.log(1.0 - random.random())
+        return time.time() + gap >= entry["expiry"]
+
+    @staticmethod
+    def _compute(key, compute, ttl):
+        start = time.monotonic()
+        value = compute()
+        CacheService.set(key, value, ttl, delta=time.monotonic() - start)
+        return value
+
+    @staticmethod
+    def get_or_set(key, compute, ttl, name="default"):
+        """
+        캐시된 값을 반환하고, 없거나 조기 재계산 대상이면 한 워커만 다시 계산합니다.
+
+        Args:
+            key: 캐시 키
+            compute: 값을 만드는 함수 (인자 없음)
+            ttl: 기준 TTL (초)
+            name: 카운터를 묶는 이름 (예: likes)
+
+        Returns:
+            캐시된 값 또는 새로 계산한 값
+        """
+        entry = CacheService._get_entry(key)
+        if entry is not None:
+            if not CacheService._should_recompute_early(entry):
+                CacheService.record(name, "hit")
+                return entry["value"]
+            if not cache.add(CacheService._lock_key(key), 1, RECOMPUTE_LOCK_TTL):
+                # 다른 워커가 다시 계산 중이면 기존 값을 그대로 사용
+                CacheService.record(name, "stale")
+                return entry["value"]
+        else:
+            CacheService.record(name, "miss")
+            if not cache.add(CacheService._lock_key(key), 1, RECOMPUTE_LOCK_TTL):
+                entry = CacheService._wait_for(key)
+                if entry is not None:
+                    return entry["value"]
+                # 계산하던 워커가 늦어지면 직접 계산 (잠금은 그 워커가 해제)
+                CacheService.record(name, "recompute")
+                return CacheService._compute(key, compute, ttl)
+
+        CacheService.record(name, "recompute")
+        try:
+            return CacheService._compute(key, compute, ttl)
+        finally:
+            cache.delete(CacheService._lock_key(key))
+
+    @staticmethod
+    def _wait_for(key):
+        """다른 워커가 값을 채울 때까지 RECOMPUTE_WAIT_TIMEOUT 동안 기다림"""
+        deadline = time.monotonic() + RECOMPUTE_WAIT_TIMEOUT
+        while time.monotonic() < deadline:
+            time.sleep(RECOMPUTE_WAIT_INTERVAL)
+            entry = CacheService._get_entry(key)
+            if entry is not None:
+                return entry
+        return None
+
+    @staticmethod
+    def run_once(key, func, name="default"):
+        """
+        같은 작업을 여러 워커가 동시에 실행하지 않도록 합니다.
+        다른 워커가 실행 중이면 끝날 때까지(최대 RECOMPUTE_WAIT_TIMEOUT) 기다립니다.
+
+        Args:
+            key: 작업을 구분하는 키
+            func: 실행할 함수 (인자 없음)
+            name: 카운터를 묶는 이름
+
+        Returns:
+            bool: 이 워커가 실행했으면 True
+        """
+        lock_key = CacheService._lock_key(key)
+        if cache.add(lock_key, 1, RECOMPUTE_LOCK_TTL):
+            CacheService.record(name, "recompute")
+            try:
+                func()
+            finally:
+                cache.delete(lock_key)
+            return True
+
+        CacheService.record(name, "wait")
+        deadline = time.monotonic() + RECOMPUTE_WAIT_TIMEOUT
+        while time.monotonic() < deadline and cache.get(lock_key) is not None:
+            time.sleep(RECOMPUTE_WAIT_INTERVAL)
+        return False
+
+    @staticmethod
+    def record(name, event):
+        """
+        카운터를 프로세스 안에서 누적하고 STATS_FLUSH_INTERVAL마다 Redis에 합산합니다.
+
+        Args:
+            name: 카운터 이름
+            event: hit, miss, recompute, stale, wait 중 하나
+        """
+        global _stats_flushed_at
+        with _stats_lock:
+            _stats[f"{name}:{event}"] += 1
+            if time.monotonic() - _stats_flushed_at < STATS_FLUSH_INTERVAL:
+                return
+            _stats_flushed_at = time.monotonic()
+        CacheService.flush_stats()
+
+    @staticmethod
+    def flush_stats():
+        """프로세스에 누적된 카운터를 Redis 해시에 더함"""
+        with _stats_lock:
+            counts = dict(_stats)
+            _stats.clear()
+        if not counts:
+            return
+
+        pipe = get_redis().pipeline()
+        for field, count in counts.items():
+            pipe.hincrby(STATS_KEY, field, count)
+        pipe.execute()
+
+    @staticmethod
+    def get_stats():
+        """
+        모든 워커의 카운터를 합산해 반환합니다.
+
+        Returns:
+            dict: {이름: {이벤트: 횟수}}
+        """
+        CacheService.flush_stats()
+        stats = defaultdict(dict)
+        for field, count in get_redis().hgetall(STATS_KEY).items():
+            name, event = field.decode().rsplit(":", 1)
+            stats[name][event] = int(count)
+        return dict(stats)
+
+    @staticmethod
+    def reset_stats():
+        with _stats_lock:
+            _stats.clear()
+        get_redis().delete(STATS_KEY)
@@ -0,0 +1,106 @@
+import hashlib
+from django.conf import settings
+from django.core.cache import cache
+from django.template.loader import render_to_string
+from django.utils.safestring import mark_safe
+
+# 목록 종류별 게시글 카드 템플릿
+CARD_TEMPLATES = {
+    "discovery": "discovery/post_card.html",
+    "blog": "blog/post_card.html",
+}
+
+# 카드 템플릿을 수정하면 올려서 기존 캐시를 모두 무효화
+CARD_TEMPLATE_VERSION = 2
+CARD_CACHE_TTL = 60 * 60 * 24
+
+# 사용자별로 달라지는 좋아요 버튼이 들어갈 자리
+LIKE_BUTTON_MARKER = "<!-- like-button -->"
+
+# 자주 바뀌는 조회수/좋아요 수가 들어갈 자리
+POST_STATS_MARKER = "<!-- post-stats -->"
+
+
+class PostCardService:
+    @staticmethod
+    def get_version(post):
+        """
+        카드 내용이 바뀌면 함께 바뀌는 버전을 반환합니다.
+
+        수정(updated_at, status), 태그 변경, 작성자 프로필 변경이 버전에 포함되므로
+        별도의 무효화 없이 새 키로 캐시됩니다. 좋아요/조회수는 카드에 캐시하지 않고
+        렌더링할 때 끼워 넣으므로 버전에 넣지 않습니다. (반영될 때마다 캐시가 바뀌지 않음)
+        목록 조회 시 이미 불러온 값만 사용하므로 추가 쿼리가 없습니다.
+
+        Args:
+            post: 대상 게시글 (tags prefetch 권장)
+
+        Returns:
+            str: 버전 문자열
+        """
+        stamp = "|".join(
+            str(value)
+            for value in (
+                CARD_TEMPLATE_VERSION,
+                post.updated_at.timestamp(),
+                post.status,
+                ",".join(sorted(tag.name for tag in post.tags.all())),
+                post.author.username,
+                post.author.profile_image,
+            )
+        )
+        return hashlib.md5(stamp.encode()).hexdigest()[:16]
+
+    @staticmethod
+    def _key(post, variant):
+        return (
+            f"{settings.CACHE_KEY_PREFIX}:post:{post.id}:card:{variant}:"
+            f"{PostCardService.get_version(post)}"
+        )
+
+    @staticmethod
+    def render_cards(request, posts, variant):
+        """
+        게시글 카드 목록을 렌더링합니다.
+
+        카드 HTML은 게시글별로 캐시해 get_many 한 번으로 가져오고,
+        없는 카드만 렌더링해 set_many로 저장합니다. 좋아요 버튼처럼 사용자마다
+        다른 부분과 조회수/좋아요 수처럼 자주 바뀌는 부분은 캐시하지 않고
+        매번 끼워 넣습니다.
+
+        Args:
+            request: 현재 요청 (좋아요 버튼의 CSRF 토큰용)
+            posts: 게시글 목록 (has_liked 속성 권장)
+            variant: 카드 종류 (discovery/blog)
+
+        Returns:
+            SafeString: 카드 HTML
+        """
+        posts = list(posts)
+        keys = [PostCardService._key(post, variant) for post in posts]
+        cached = cache.get_many(keys)
+
+        missing = {}
+        cards = []
+        for post, key in zip(posts, keys):
+            card = cached.get(key)
+            if card is None:
+                card = render_to_string(CARD_TEMPLATES[variant], {"post": post})
+                missing[key] = card
+
+            stats = render_to_string("blog/post_stats.html", {"post": post})
+            like_button = render_to_string(
+                "blog/like_button.html",
+                {"post": post, "has_liked": getattr(post, "has_liked", False)},
+                request=request,
+            )
+            cards.append(
+                card.replace(POST_STATS_MARKER, stats).replace(
+                    LIKE_BUTTON_MARKER, like_button
+                )
+            )
+
+        if missing:
+            cache.set_many(missing, CARD_CACHE_TTL)
+
+        return mark_safe("".join(cards))
@@ -0,0 +1,305 @@
+import hashlib
+import io
+import logging
+import re
+from botocore.exceptions import BotoCoreError, ClientError
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.utils.html import escape
+from PIL import Image, ImageOps, UnidentifiedImageError
+from ..media_store import download_media, get_media_key, get_media_url, upload_media
+from ..models import Post, UploadedImage
+from ..redis_store import get_redis
+
+logger = logging.getLogger(__name__)
+
+# 변환할 이미지 키 집합과 처리 잠금
+PENDING_IMAGES_KEY = f"{settings.CACHE_KEY_PREFIX}:images:pending"
+PROCESS_LOCK_KEY = f"{settings.CACHE_KEY_PREFIX}:images:process_lock"
+
+# 처리 잠금 유지 시간 (이미지마다 갱신)과 한 번에 처리하는 최대 이미지 수
+PROCESS_LOCK_TTL = 300
+PROCESS_BATCH_SIZE = 50
+
+# 변환본 이름 -> 최대 너비 (원본보다 크게 늘리지 않음)
+# thumbnail: 목록 카드 썸네일(200px)의 2배, card: 좁은 화면 본문, content: 본문(800px)의 2배
+VARIANT_WIDTHS = {"thumbnail": 400, "card": 800, "content": 1600}
+
+# 변환본 인코딩 품질
+WEBP_QUALITY = 80
+JPEG_QUALITY = 82
+
+# 변환 대상 원본 형식 (애니메이션 GIF, SVG 등은 원본을 그대로 사용)
+SOURCE_FORMATS = ("JPEG", "PNG", "WEBP")
+
+# 본문 이미지가 차지하는 너비 (본문 최대 너비 800px)
+CONTENT_IMAGE_SIZES = "(max-width: 800px) 100vw, 800px"
+
+IMG_TAG_RE = re.compile(r"<img\b[^>]*>", re.IGNORECASE)
+SRC_ATTR_RE = re.compile(r"""\bsrc\s*=\s*(["'])(.*?)\1""", re.IGNORECASE | re.DOTALL)
+CONTENT_VARIANT_RE = re.compile(r"\.content\.(jpg|png)$")
+FALLBACK_VARIANT_RE = re.compile(r"\.(thumbnail|card|content)\.(jpg|png)$")
+
+
+class ImageVariantService:
+    """
+    업로드한 이미지의 반응형 변환본(WebP + JPEG/PNG)을 만들고
+    게시글 본문과 썸네일이 원본 대신 변환본을 가리키도록 바꿉니다.
+
+    업로드 요청은 원본만 저장하고 키를 대기열에 넣으며,
+    process_pending(process_images 명령)이 원본을 한 번 디코딩해 변환본을 만듭니다.
+    """
+
+    @staticmethod
+    def variant_key(key, name, ext):
+        """원본 키에서 변환본 키를 만듦 (예: a/b.png -> a/b.card.webp)"""
+        return f"{key.rsplit('.', 1)[0]}.{name}.{ext}"
+
+    @staticmethod
+    def enqueue(key):
+        """
+        업로드한 원본을 변환 대기열에 넣습니다.
+
+        Args:
+            key: 원본 객체 키
+        """
+        get_redis().sadd(PENDING_IMAGES_KEY, key)
+
+    @staticmethod
+    def process_pending():
+        """
+        대기열의 이미지를 변환합니다. (한 번에 한 워커만 실행)
+
+        Returns:
+            int: 처리한 이미지 수
+        """
+        redis = get_redis()
+        if not redis.set(PROCESS_LOCK_KEY, 1, ex=PROCESS_LOCK_TTL, nx=True):
+            return 0
+
+        try:
+            processed = 0
+            keys = sorted(redis.smembers(PENDING_IMAGES_KEY))[:PROCESS_BATCH_SIZE]
+            for key in keys:
+                key = key.decode() if isinstance(key, bytes) else key
+                # 오래 걸려도 다른 워커가 잠금을 가져가지 않도록 이미지마다 연장
+                redis.set(PROCESS_LOCK_KEY, 1, ex=PROCESS_LOCK_TTL)
+                try:
+                    ImageVariantService.process(key)
+                except Exception:
+                    # 한 이미지의 오류가 대기열 전체를 막지 않도록 실패로 기록하고 넘어감
+                    logger.exception("Image processing failed: %s", key)
+                    UploadedImage.objects.filter(key=key, status="pending").update(
+                        status="failed"
+                    )
+                redis.srem(PENDING_IMAGES_KEY, key)
+                processed += 1
+            return processed
+        finally:
+            redis.delete(PROCESS_LOCK_KEY)
+
+    @staticmethod
+    def process(key):
+        """
+        원본을 한 번 디코딩해 변환본을 업로드하고, 업로더의 게시글 중
+        이 이미지를 쓰는 글의 본문과 썸네일을 변환본으로 바꿉니다.
+
+        Args:
+            key: 원본 객체 키
+        """
+        image = UploadedImage.objects.filter(key=key).first()
+        if image is None or image.status != "pending":
+            return
+
+        try:
+            data = download_media(key)
+            ImageVariantService._index_hash(image, data)
+            ImageVariantService._build_variants(image, data)
+        except (
+            OSError,
+            UnidentifiedImageError,
+            Image.DecompressionBombError,
+            BotoCoreError,
+            ClientError,
+        ):
+            logger.exception("Image variant generation failed: %s", key)
+            image.status = "failed"
+        image.save()
+
+        if image.status == "ready" and image.uploader_id:
+            ImageVariantService._rewrite_posts(image)
+
+    @staticmethod
+    def _index_hash(image, data):
+        """직접 업로드한 원본의 해시를 중복 인덱스에 기록 (이미 있는 내용이면 건너뜀)"""
+        if image.content_hash:
+            return
+        content_hash = hashlib.sha256(data).hexdigest()
+        # 다른 워커나 업로드가 같은 해시를 먼저 기록했으면 unique 인덱스가 막음
+        try:
+            with transaction.atomic():
+                updated = UploadedImage.objects.filter(
+                    pk=image.pk, content_hash__isnull=True
+                ).update(content_hash=content_hash)
+        except IntegrityError:
+            return
+        if updated:
+            image.content_hash = content_hash
+
+    @staticmethod
+    def _build_variants(image, data):
+        with Image.open(io.BytesIO(data)) as source:
+            if source.format not in SOURCE_FORMATS or getattr(
+                source, "is_animated", False
+            ):
+                image.status = "skipped"
+                return
+
+            source = ImageOps.exif_transpose(source)
+            has_alpha = source.mode in ("RGBA", "LA", "PA") or (
+                source.mode == "P" and "transparency" in source.info
+            )
+            source = source.convert("RGBA" if has_alpha else "RGB")
+
+        image.width, image.height = source.size
+        image.fallback_format = "png" if has_alpha else "jpg"
+
+        # 큰 변환본부터 만들고, 다음 변환본은 직전 결과를 줄여 만듦
+        resized = source
+        widths = {}
+        for name, width in sorted(VARIANT_WIDTHS.items(), key=lambda item: -item[1]):
+            if resized.width > width:
+                height = max(1, round(resized.height * width / resized.width))
+                resized = resized.resize((width, height), Image.LANCZOS)
+            widths[name] = resized.width
+            ImageVariantService._upload(image.key, name, "webp", resized)
+            ImageVariantService._upload(image.key, name, image.fallback_format, resized)
+
+        image.variant_widths = widths
+        image.status = "ready"
+
+    @staticmethod
+    def _upload(key, name, ext, image):
+        buffer = io.BytesIO()
+        if ext == "webp":
+            image.save(buffer, "WEBP", quality=WEBP_QUALITY, method=4)
+            content_type = "image/webp"
+        elif ext == "png":
+            image.save(buffer, "PNG", optimize=True)
+            content_type = "image/png"
+        else:
+            image.save(buffer, "JPEG", quality=JPEG_QUALITY, optimize=True)
+            content_type = "image/jpeg"
+        upload_media(
+            buffer, ImageVariantService.variant_key(key, name, ext), content_type
+        )
+
+    @staticmethod
+    def _rewrite_posts(image):
+        # 변환이 끝나기 전에 저장된 글 (본문이 바뀌면 save가 썸네일을 다시 추출)
+        posts = Post.objects.filter(
+            author_id=image.uploader_id, content__contains=get_media_url(image.key)
+        )
+        for post in posts:
+            post.content = ImageVariantService.rewrite_content(post.content)
+            post.save(update_fields=["content", "thumbnail"])
+
+    @staticmethod
+    def _srcset(image, ext):
+        candidates = {}
+        for name, width in image.variant_widths.items():
+            url = get_media_url(ImageVariantService.variant_key(image.key, name, ext))
+            candidates.setdefault(width, url)
+        return ", ".join(f"{url} {width}w" for width, url in sorted(candidates.items()))
+
+    @staticmethod
+    def _picture(tag, image):
+        """<img>를 WebP <source>와 기본 형식 srcset을 가진 <picture>로 감쌈"""
+        fallback = image.fallback_format
+        content_url = get_media_url(
+            ImageVariantService.variant_key(image.key, "content", fallback)
+        )
+        attrs = (
+            f'src="{escape(content_url)}" '
+            f'srcset="{escape(ImageVariantService._srcset(image, fallback))}" '
+            f'sizes="{CONTENT_IMAGE_SIZES}"'
+        )
+        if "loading=" not in tag:
+            attrs += ' loading="lazy"'
+        img = SRC_ATTR_RE.sub(lambda match: attrs, tag, count=1)
+        return (
+            f'<picture><source type="image/webp" '
+            f'srcset="{escape(ImageVariantService._srcset(image, "webp"))}" '
+            f'sizes="{CONTENT_IMAGE_SIZES}">{img}</picture>'
+        )
+
+    @staticmethod
+    def rewrite_content(content):
+        """
+        본문에서 변환이 끝난 원본 이미지를 반응형 <picture>로 바꿉니다.
+        이미 바꾼 이미지는 src가 변환본이므로 다시 바꾸지 않습니다.
+
+        Args:
+            content: 게시글 본문 HTML
+
+        Returns:
+            str: 변환된 본문 HTML
+        """
+        if not content or "<img" not in content:
+            return content
+
+        keys = set()
+        for tag in IMG_TAG_RE.findall(content):
+            match = SRC_ATTR_RE.search(tag)
+            key = match and get_media_key(match.group(2))
+            if key:
+                keys.add(key)
+        if not keys:
+            return content
+
+        images = {
+            image.key: image
+            for image in UploadedImage.objects.filter(key__in=keys, status="ready")
+        }
+        if not images:
+            return content
+
+        def replace(match):
+            tag = match.group(0)
+            src = SRC_ATTR_RE.search(tag)
+            image = src and images.get(get_media_key(src.group(2)))
+            if image is None:
+                return tag
+            return ImageVariantService._picture(tag, image)
+
+        return IMG_TAG_RE.sub(replace, content)
+
+    @staticmethod
+    def thumbnail_url(src):
+        """
+        본문 변환본 URL이면 같은 이미지의 썸네일 변환본 URL을 반환합니다.
+
+        Args:
+            src: 본문 첫 이미지의 src
+
+        Returns:
+            str: 썸네일 URL (변환본이 아니면 src 그대로)
+        """
+        if src and CONTENT_VARIANT_RE.search(src):
+            return CONTENT_VARIANT_RE.sub(r".thumbnail.\1", src)
+        return src
+
+    @staticmethod
+    def webp_url(url):
+        """
+        기본 형식(JPEG/PNG) 변환본 URL이면 같은 변환본의 WebP URL을 반환합니다.
+
+        Args:
+            url: 변환본 URL
+
+        Returns:
+            str: WebP URL (변환본이 아니면 None)
+        """
+        if url and FALLBACK_VARIANT_RE.search(url):
+            return FALLBACK_VARIANT_RE.sub(r".\1.webp", url)
+        return None
@@ -0,0 +1,153 @@
+from django.conf import settings
+from django.db.models import Count
+from ..models import Blog
+from ..redis_store import READY_MEMBER, get_redis
+from .cache_service import CacheService
+
+# 인기 블로거 페이지에 보여주는 블로거 수
+POPULAR_BLOGGERS_LIMIT = 10
+
+# 전체 재생성 시 한 번에 Redis에 쓰는 블로그 수
+REBUILD_CHUNK_SIZE = 1000
+
+
+class BloggerLeaderboardService:
+    """
+    블로그 참여도 순위를 Redis 정렬 집합(블로그 ID -> 참여도 점수)으로 관리합니다.
+
+    점수는 BlogManager.popular()와 같은 (조회수 + 좋아요 수 * 2) / 게시글 수이며,
+    Blog.total_* 집계를 바꾸는 곳(adjust_stats, adjust_views, reconcile_stats)에서
+    해당 블로그의 점수만 다시 계산하므로 게시글 전체를 집계하지 않습니다.
+    DB에서 다 채운 집합에만 READY_MEMBER가 있으며, 없으면 읽을 때 다시 만듭니다.
+    """
+
+    @staticmethod
+    def _key():
+        return f"{settings.CACHE_KEY_PREFIX}:bloggers:popular"
+
+    @staticmethod
+    def _score(total_posts, total_views, total_likes):
+        return (total_views + total_likes * 2) / total_posts
+
+    @staticmethod
+    def _stats(**filters):
+        return Blog.objects.filter(**filters).values_list(
+            "id", "total_posts", "total_views", "total_likes"
+        )
+
+    @staticmethod
+    def refresh(blog_ids):
+        """
+        블로그 집계 필드를 기준으로 순위 점수를 다시 계산합니다.
+        공개 게시글이 없는 블로그는 순위에서 제외합니다.
+
+        Args:
+            blog_ids: 블로그 ID 목록
+        """
+        blog_ids = list(blog_ids)
+        redis = get_redis()
+        key = BloggerLeaderboardService._key()
+        if not blog_ids or redis.zscore(key, READY_MEMBER) is None:
+            # 아직 만들어지지 않았으면 처음 읽을 때 DB에서 전체를 만듦
+            return
+
+        rows = BloggerLeaderboardService._stats(id__in=blog_ids)
+        pipe = redis.pipeline()
+        for blog_id, total_posts, total_views, total_likes in rows:
+            if total_posts > 0:
+                score = BloggerLeaderboardService._score(
+                    total_posts, total_views, total_likes
+                )
+                pipe.zadd(key, {blog_id: score})
+            else:
+                pipe.zrem(key, blog_id)
+        pipe.execute()
+
+    @staticmethod
+    def rebuild():
+        """
+        DB 기준으로 전체 순위를 다시 만듭니다.
+        임시 키에 채운 뒤 RENAME으로 교체하므로 읽는 쪽에 빈 순위가 보이지 않습니다.
+
+        Returns:
+            int: 순위에 오른 블로그 수
+        """
+        redis = get_redis()
+        key = f"{BloggerLeaderboardService._key()}:rebuild"
+        rows = BloggerLeaderboardService._stats(total_posts__gt=0).iterator(
+            chunk_size=REBUILD_CHUNK_SIZE
+        )
+
+        pipe = redis.pipeline()
+        pipe.delete(key)
+        pipe.zadd(key, {READY_MEMBER: float("-inf")})
+        count = 0
+        for count, (blog_id, total_posts, total_views, total_likes) in enumerate(
+            rows, start=1
+        ):
+            score = BloggerLeaderboardService._score(
+                total_posts, total_views, total_likes
+            )
+            pipe.zadd(key, {blog_id: score})
+            if count % REBUILD_CHUNK_SIZE == 0:
+                pipe.execute()
+        pipe.rename(key, BloggerLeaderboardService._key())
+        pipe.execute()
+        return count
+
+    @staticmethod
+    def ensure_ready():
+        """
+        순위가 없으면(처음이거나 축출됨) 한 워커만 다시 만들고 나머지는 끝나기를 기다립니다.
+
+        Returns:
+            bool: 이미 순위가 있었으면 True
+        """
+        key = BloggerLeaderboardService._key()
+        if get_redis().zscore(key, READY_MEMBER) is not None:
+            return True
+        CacheService.run_once(key, BloggerLeaderboardService.rebuild, name="bloggers")
+        return False
+
+    @staticmethod
+    def get_top(limit=POPULAR_BLOGGERS_LIMIT):
+        """
+        참여도가 높은 블로그를 순위대로 반환합니다.
+        상위 ID만 읽고 소유자와 팔로워 수를 쿼리 한 번으로 함께 불러옵니다.
+
+        Args:
+            limit: 최대 블로그 수
+
+        Returns:
+            list: engagement_score, followers_count가 설정된 Blog 객체 목록
+        """
+        redis = get_redis()
+        key = BloggerLeaderboardService._key()
+        if BloggerLeaderboardService.ensure_ready():
+            CacheService.record("bloggers", "hit")
+        else:
+            CacheService.record("bloggers", "miss")
+
+        scores = {
+            int(blog_id): score
+            for blog_id, score in redis.zrevrange(key, 0, limit - 1, withscores=True)
+            if blog_id != READY_MEMBER
+        }
+        blogs = (
+            Blog.objects.filter(id__in=scores)
+            .select_related("owner")
+            .annotate(followers_count=Count("owner__followers"))
+        )
+        blogs = {blog.id: blog for blog in blogs}
+
+        # 삭제된 블로그는 순위에서 정리
+        missing = [blog_id for blog_id in scores if blog_id not in blogs]
+        if missing:
+            redis.zrem(key, *missing)
+
+        result = []
+        for blog_id, score in scores.items():
+            if blog_id in blogs:
+                blogs[blog_id].engagement_score = score
+                result.append(blogs[blog_id])
+        return result
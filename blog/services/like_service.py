@@ -1,6 +1,7 @@
-from django.core.cache import cache
-from django.db.models import F
-from ..models import Post
+from django.conf import settings
+from ..models import PostLike
+from .cache_service import CacheService
+from .trending_service import TrendingService
 
 
 class LikeService:
@@ -16,25 +17,14 @@ class LikeService:
         Returns:
             tuple: (좋아요 상태, 업데이트된 좋아요 수)
         """
-        # 캐시 키 생성
-        cache_key = post.get_cache_key("likes")
-
-        # 좋아요 상태 확인 및 토글
-        if post.liked_by.filter(id=user.id).exists():
-            post.liked_by.remove(user)
-            Post.objects.filter(id=post.id).update(likes=F("likes") - 1)
-            has_liked = False
-        else:
-            post.liked_by.add(user)
-            Post.objects.filter(id=post.id).update(likes=F("likes") + 1)
-            has_liked = True
-
-        # 객체 새로고침
-        post.refresh_from_db()
-        likes_count = post.likes
-
-        # 캐시 업데이트
-        cache.set(cache_key, likes_count)
+        # 좋아요 행 생성/삭제와 좋아요 수 조정을 한 트랜잭션에서 처리
+        has_liked, likes_count = PostLike.objects.toggle(user, post)
+
+        # 캐시 및 트렌딩 점수 업데이트
+        CacheService.set(
+            post.get_cache_key("likes"), likes_count, settings.LIKES_CACHE_TTL
+        )
+        TrendingService.update_post(post)
 
         return has_liked, likes_count
 
@@ -54,11 +44,42 @@ class LikeService:
             return False
         return post.liked_by.filter(id=user.id).exists()
 
+    @staticmethod
+    def annotate_like_status(user, posts):
+        """
+        목록 페이지 게시글들의 좋아요 여부를 한 번의 IN 쿼리로 조회해
+        각 게시글에 has_liked 속성으로 붙입니다.
+
+        Args:
+            user: 현재 요청한 사용자 (AnonymousUser 가능)
+            posts: 게시글 목록 (QuerySet 또는 list)
+
+        Returns:
+            list: has_liked 속성이 설정된 게시글 목록
+        """
+        posts = list(posts)
+        liked_ids = set()
+
+        if user.is_authenticated and posts:
+            liked_ids = set(
+                PostLike.objects.filter(
+                    user=user, post_id__in=[post.id for post in posts]
+                )
+                .order_by()
+                .values_list("post_id", flat=True)
+            )
+
+        for post in posts:
+            post.has_liked = post.id in liked_ids
+
+        return posts
+
     @staticmethod
     def get_likes_count(post):
         """
         게시글의 좋아요 수를 반환합니다.
-        캐시된 값이 있으면 캐시에서, 없으면 DB에서 조회합니다.
+        캐시된 값이 있으면 캐시에서, 없으면 게시글의 값으로 채웁니다.
+        (만료 시 한 워커만 다시 계산 - CacheService.get_or_set)
 
         Args:
             post: 대상 게시글
@@ -66,11 +87,9 @@ class LikeService:
         Returns:
             int: 좋아요 수
         """
-        cache_key = post.get_cache_key("likes")
-        likes_count = cache.get(cache_key)
-
-        if likes_count is None:
-            likes_count = post.likes
-            cache.set(cache_key, likes_count)
-
-        return likes_count
+        return CacheService.get_or_set(
+            post.get_cache_key("likes"),
+            lambda: post.likes,
+            settings.LIKES_CACHE_TTL,
+            name="likes",
+        )
@@ -0,0 +1,107 @@
+import hashlib
+import time
+from django.conf import settings
+from django.core.cache import cache
+
+# 캐시된 페이지를 그대로 내보내는 시간
+PAGE_CACHE_TTL = getattr(settings, "PAGE_CACHE_TTL", 60)
+
+# 신선도가 지난 뒤에도 다시 만드는 동안 대신 내보내는 시간
+PAGE_CACHE_STALE_TTL = getattr(settings, "PAGE_CACHE_STALE_TTL", 60 * 10)
+
+# 페이지를 다시 만드는 워커가 잡는 잠금의 최대 유지 시간
+PAGE_CACHE_LOCK_TTL = 30
+
+
+class PageCacheService:
+    """
+    태그 기반 무효화를 지원하는 전체 페이지 캐시.
+
+    페이지마다 의존하는 태그(예: posts, tag:python)의 버전을 함께 저장하고,
+    읽을 때 현재 태그 버전과 다르면 오래된(stale) 페이지로 봅니다.
+    purge는 태그 버전만 바꾸므로 해당 태그를 쓰는 페이지 키를 찾을 필요가 없습니다.
+    """
+
+    @staticmethod
+    def _key(path, params):
+        query = "&".join(f"{name}={value}" for name, value in params)
+        digest = hashlib.md5(f"{path}?{query}".encode()).hexdigest()
+        return f"{settings.CACHE_KEY_PREFIX}:page:{digest}"
+
+    @staticmethod
+    def _tag_key(tag):
+        return f"{settings.CACHE_KEY_PREFIX}:page:tag:{tag}"
+
+    @staticmethod
+    def _lock_key(key):
+        return f"{key}:lock"
+
+    @staticmethod
+    def lookup(path, params, tags):
+        """
+        캐시된 페이지와 현재 태그 버전을 한 번에 조회합니다.
+
+        Args:
+            path: 요청 경로
+            params: 정규화된 (이름, 값) 쿼리 파라미터 목록
+            tags: 페이지가 의존하는 태그 목록
+
+        Returns:
+            tuple: (캐시 키, 캐시 항목 또는 None, 신선 여부, 현재 태그 버전)
+        """
+        key = PageCacheService._key(path, params)
+        tag_keys = {tag: PageCacheService._tag_key(tag) for tag in tags}
+        values = cache.get_many([key, *tag_keys.values()])
+
+        versions = {tag: values.get(tag_key) for tag, tag_key in tag_keys.items()}
+        entry = values.get(key)
+        fresh = (
+            entry is not None
+            and entry["versions"] == versions
+            and time.time() - entry["created"] < PAGE_CACHE_TTL
+        )
+        return key, entry, fresh, versions
+
+    @staticmethod
+    def acquire_refresh(key):
+        """페이지를 다시 만들 권한을 얻으면 True (다른 워커는 오래된 페이지를 내보냄)"""
+        return cache.add(PageCacheService._lock_key(key), 1, PAGE_CACHE_LOCK_TTL)
+
+    @staticmethod
+    def release_refresh(key):
+        cache.delete(PageCacheService._lock_key(key))
+
+    @staticmethod
+    def store(key, content, content_type, versions):
+        """
+        렌더링한 페이지를 저장합니다.
+
+        Args:
+            key: lookup에서 받은 캐시 키
+            content: 응답 본문
+            content_type: 응답 Content-Type
+            versions: 렌더링 전에 읽은 태그 버전 (렌더링 중 purge되면 바로 stale)
+        """
+        entry = {
+            "content": content,
+            "content_type": content_type,
+            "versions": versions,
+            "created": time.time(),
+        }
+        cache.set(key, entry, PAGE_CACHE_TTL + PAGE_CACHE_STALE_TTL)
+
+    @staticmethod
+    def purge(*tags):
+        """
+        태그에 의존하는 모든 페이지를 오래된 페이지로 만듭니다.
+
+        버전을 증가시키지 않고 새 값으로 바꾸므로, 태그 키가 캐시에서
+        밀려난 뒤에도 예전 버전과 겹치지 않습니다.
+
+        Args:
+            *tags: 무효화할 태그
+        """
+        version = time.time_ns()
+        cache.set_many(
+            {PageCacheService._tag_key(tag): version for tag in set(tags)}, None
+        )
@@ -1,7 +1,7 @@
 from django.core.cache import cache
 from django.db.models import Q, Prefetch
 from django.contrib.auth import get_user_model
-from ..models import Post, Blog
+from ..models import Post, Blog, LIST_DEFERRED_FIELDS
 from .read_service import ReadService
 
 User = get_user_model()
@@ -36,6 +36,7 @@ class PostService:
         # N+1 쿼리 최적화
         posts = (
             posts.select_related("author", "blog")
+            .defer(*LIST_DEFERRED_FIELDS)
             .prefetch_related(
                 "tags",
                 Prefetch(
@@ -1,6 +1,23 @@
-from django.core.cache import cache
-from django.db.models import F
-from ..models import Post, PostRead
+import uuid
+from datetime import timedelta
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Case, F, Value, When
+from django.utils import timezone
+from ..models import Blog, Post, PostRead, ViewFlush
+from ..redis_store import get_redis
+from .trending_service import TrendingService
+
+# 조회수 버퍼 키 (post_id -> 아직 DB에 반영되지 않은 조회수)
+PENDING_VIEWS_KEY = f"{settings.CACHE_KEY_PREFIX}:views:pending"
+FLUSHING_VIEWS_KEY = f"{settings.CACHE_KEY_PREFIX}:views:flushing"
+FLUSH_LOCK_KEY = f"{settings.CACHE_KEY_PREFIX}:views:flush_lock"
+# flushing 해시의 배치 ID (DB에 반영한 배치는 ViewFlush에 기록됨)
+FLUSH_ID_KEY = f"{settings.CACHE_KEY_PREFIX}:views:flushing:id"
+FLUSH_BATCH_SIZE = 500
+
+# 반영한 배치 기록을 보관하는 기간 (중단된 flush는 다음 실행에서 바로 재개됨)
+VIEW_FLUSH_RETENTION = timedelta(days=1)
 
 
 class ReadService:
@@ -8,6 +25,7 @@ class ReadService:
     def record_read(user, post):
         """
         사용자의 게시글 조회를 기록합니다.
+        조회수는 Redis 버퍼에만 누적되며 flush_pending_views가 DB에 반영합니다.
 
         Args:
             user: 조회한 사용자 (AnonymousUser 가능)
@@ -16,26 +34,59 @@ class ReadService:
         # 로그인한 사용자의 경우
         if user.is_authenticated:
             # 자신의 글은 조회수를 증가시키지 않음
-            if post.author != user:
+            if post.author_id != user.id:
                 # PostRead 레코드 생성 또는 업데이트
                 PostRead.objects.record_read(user=user, post=post)
-                # 조회수 증가
-                Post.objects.filter(id=post.id).update(views=F("views") + 1)
-                post.refresh_from_db()
+                ReadService.buffer_view(post)
         # 익명 사용자의 경우
         else:
-            Post.objects.filter(id=post.id).update(views=F("views") + 1)
-            post.refresh_from_db()
+            ReadService.buffer_view(post)
+
+    @staticmethod
+    def buffer_view(post):
+        """
+        조회수 1을 Redis 버퍼에 누적합니다. (Post 행을 건드리지 않음)
+
+        Args:
+            post: 조회한 게시글
+
+        Returns:
+            int: 버퍼에 누적된 조회수
+        """
+        return get_redis().hincrby(PENDING_VIEWS_KEY, post.id, 1)
+
+    @staticmethod
+    def get_pending_views(post_id):
+        """
+        아직 DB에 반영되지 않은 조회수를 반환합니다.
+
+        Args:
+            post_id: 대상 게시글 ID
 
-        # 캐시 업데이트
-        cache_key = post.get_cache_key("views")
-        cache.set(cache_key, post.views)
+        Returns:
+            int: 버퍼에 누적된 조회수
+        """
+        pipe = get_redis().pipeline()
+        pipe.hget(PENDING_VIEWS_KEY, post_id)
+        pipe.hget(FLUSHING_VIEWS_KEY, post_id)
+        pipe.get(FLUSH_ID_KEY)
+        pending, flushing, batch_id = pipe.execute()
+
+        # 커밋되었지만 아직 Redis에서 지우지 않은 배치는 DB 조회수에 이미 포함됨
+        # (flush 중인 게시글만 확인하므로 평소에는 쿼리하지 않음)
+        if (
+            flushing
+            and batch_id
+            and ViewFlush.objects.filter(batch_id=batch_id.decode()).exists()
+        ):
+            flushing = None
+        return int(pending or 0) + int(flushing or 0)
 
     @staticmethod
     def get_views_count(post):
         """
         게시글의 조회수를 반환합니다.
-        캐시된 값이 있으면 캐시에서, 없으면 DB에서 조회합니다.
+        DB 값에 버퍼에 누적된 조회수를 더하므로 Post 행을 다시 조회하지 않습니다.
 
         Args:
             post: 대상 게시글
@@ -43,14 +94,82 @@ class ReadService:
         Returns:
             int: 조회수
         """
-        cache_key = post.get_cache_key("views")
-        views_count = cache.get(cache_key)
+        return post.views + ReadService.get_pending_views(post.id)
+
+    @staticmethod
+    def flush_pending_views():
+        """
+        버퍼에 누적된 조회수를 일괄 UPDATE로 DB에 반영합니다.
+
+        pending 해시를 flushing 해시로 옮긴 뒤 반영하므로, 반영 도중 들어온
+        조회는 다음 flush에서 처리됩니다. 이전 flush가 중단되어 flushing
+        해시가 남아 있으면 그것부터 반영합니다.
+
+        flushing 해시마다 배치 ID를 두고 조회수 UPDATE와 같은 트랜잭션에서
+        ViewFlush에 기록하므로, 커밋 후 Redis 정리 전에 중단되어도
+        같은 조회수를 두 번 반영하지 않습니다.
+
+        Returns:
+            int: 조회수가 반영된 게시글 수
+        """
+        redis = get_redis()
+        # 잠금이 만료되어 다른 워커가 잡은 뒤에는 그 잠금을 지우지 않도록 토큰을 비교
+        token = uuid.uuid4().hex
+        if not redis.set(FLUSH_LOCK_KEY, token, ex=60, nx=True):
+            return 0
+
+        try:
+            if not redis.exists(FLUSHING_VIEWS_KEY):
+                if not redis.exists(PENDING_VIEWS_KEY):
+                    return 0
+                redis.renamenx(PENDING_VIEWS_KEY, FLUSHING_VIEWS_KEY)
+
+            # 배치 ID가 없으면 아직 반영되지 않은 배치이므로 새로 발급
+            redis.set(FLUSH_ID_KEY, uuid.uuid4().hex, nx=True)
+            batch_id = redis.get(FLUSH_ID_KEY).decode()
+
+            deltas = {
+                int(post_id): int(count)
+                for post_id, count in redis.hgetall(FLUSHING_VIEWS_KEY).items()
+                if int(count) > 0
+            }
+            post_ids = sorted(deltas)
+
+            if ViewFlush.objects.filter(batch_id=batch_id).exists():
+                # 이미 커밋된 배치 (Redis 정리 전에 중단됨)
+                redis.delete(FLUSHING_VIEWS_KEY, FLUSH_ID_KEY)
+                return 0
+
+            with transaction.atomic():
+                ViewFlush.objects.create(batch_id=batch_id)
+                ViewFlush.objects.filter(
+                    created_at__lt=timezone.now() - VIEW_FLUSH_RETENTION
+                ).delete()
+                for i in range(0, len(post_ids), FLUSH_BATCH_SIZE):
+                    batch = post_ids[i : i + FLUSH_BATCH_SIZE]
+                    Post.objects.filter(id__in=batch).update(
+                        views=F("views")
+                        + Case(
+                            *[When(id=pk, then=Value(deltas[pk])) for pk in batch],
+                            default=Value(0),
+                        )
+                    )
 
-        if views_count is None:
-            views_count = post.views
-            cache.set(cache_key, views_count)
+                    # 공개 게시글의 조회수는 블로그 집계에도 반영
+                    blog_deltas = {}
+                    for pk, blog_id in Post.objects.filter(
+                        id__in=batch, status="published"
+                    ).values_list("id", "blog_id"):
+                        blog_deltas[blog_id] = blog_deltas.get(blog_id, 0) + deltas[pk]
+                    Blog.objects.adjust_views(blog_deltas)
 
-        return views_count
+            redis.delete(FLUSHING_VIEWS_KEY, FLUSH_ID_KEY)
+            TrendingService.refresh_posts(post_ids)
+            return len(post_ids)
+        finally:
+            lock = redis.get(FLUSH_LOCK_KEY)
+            if lock is not None and lock.decode() == token:
+                redis.delete(FLUSH_LOCK_KEY)
 
     @staticmethod
     def get_read_status(user, post):
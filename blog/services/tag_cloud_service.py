@@ -0,0 +1,142 @@
+from collections import defaultdict
+from django.conf import settings
+from django.db.models import Count, Max
+from taggit.models import Tag
+from ..models import Blog
+from ..redis_store import get_redis
+
+# 태그 클라우드 해시가 만들어졌음을 표시하는 필드 (태그가 없는 블로그도 구분)
+READY_FIELD = "__ready__"
+
+
+class TagCloudService:
+    """
+    블로그별 태그 클라우드(태그 이름 -> 공개 게시글 수)를 Redis 해시로 관리합니다.
+
+    태그 추가/제거, 공개 상태 변경, 게시글 삭제 시 증감만 반영하므로
+    사이드바는 HGETALL 한 번으로 그려집니다.
+    """
+
+    @staticmethod
+    def _key(blog_id):
+        return f"{settings.CACHE_KEY_PREFIX}:blog:{blog_id}:tags"
+
+    @staticmethod
+    def adjust(blog_id, names, delta):
+        """
+        태그별 게시글 수를 delta만큼 조정합니다.
+
+        Args:
+            blog_id: 블로그 ID
+            names: 태그 이름 목록
+            delta: 증감값 (1 또는 -1)
+        """
+        names = list(names)
+        if not names:
+            return
+
+        redis = get_redis()
+        key = TagCloudService._key(blog_id)
+        if not redis.exists(key):
+            # 아직 만들어지지 않았으면 처음 읽을 때 DB에서 전체를 만듦
+            return
+
+        pipe = redis.pipeline()
+        for name in names:
+            pipe.hincrby(key, name, delta)
+        counts = pipe.execute()
+
+        # 게시글이 없어진 태그는 해시에서 제거
+        empty = [name for name, count in zip(names, counts) if int(count) <= 0]
+        if empty:
+            redis.hdel(key, *empty)
+
+    @staticmethod
+    def _store(redis, blog_id, counts):
+        pipe = redis.pipeline()
+        pipe.delete(TagCloudService._key(blog_id))
+        pipe.hset(TagCloudService._key(blog_id), mapping={READY_FIELD: 1, **counts})
+        pipe.execute()
+
+    @staticmethod
+    def _count_tags(**post_filters):
+        """공개 게시글 조건으로 블로그별 {태그 이름: 게시글 수}를 GROUP BY 한 번으로 집계"""
+        filters = {f"post__{name}": value for name, value in post_filters.items()}
+        rows = (
+            Tag.objects.filter(post__status="published", **filters)
+            .values_list("post__blog_id", "name")
+            .annotate(posts_count=Count("post"))
+        )
+        counts = defaultdict(dict)
+        for blog_id, name, posts_count in rows:
+            counts[blog_id][name] = posts_count
+        return counts
+
+    @staticmethod
+    def rebuild(blog_id):
+        """
+        DB 기준으로 블로그의 태그 클라우드를 다시 만듭니다.
+
+        Args:
+            blog_id: 블로그 ID
+
+        Returns:
+            dict: 태그 이름별 공개 게시글 수
+        """
+        counts = TagCloudService._count_tags(blog__id=blog_id)[blog_id]
+        TagCloudService._store(get_redis(), blog_id, counts)
+        return counts
+
+    @staticmethod
+    def rebuild_all(batch_size=1000):
+        """
+        모든 블로그의 태그 클라우드를 다시 만듭니다.
+        블로그 id 범위마다 GROUP BY 한 번으로 집계합니다.
+
+        Args:
+            batch_size: 한 번에 집계할 블로그 id 범위
+
+        Returns:
+            int: 다시 만든 블로그 수
+        """
+        redis = get_redis()
+        max_id = Blog.objects.aggregate(max_id=Max("id"))["max_id"] or 0
+        rebuilt = 0
+        for start in range(1, max_id + 1, batch_size):
+            end = start + batch_size - 1
+            counts = TagCloudService._count_tags(blog__id__range=(start, end))
+            blog_ids = Blog.objects.filter(id__range=(start, end)).values_list(
+                "id", flat=True
+            )
+            for blog_id in blog_ids:
+                TagCloudService._store(redis, blog_id, counts[blog_id])
+                rebuilt += 1
+        return rebuilt
+
+    @staticmethod
+    def get_tags(blog_id):
+        """
+        블로그의 태그와 공개 게시글 수를 게시글 수 내림차순으로 반환합니다.
+
+        Args:
+            blog_id: 블로그 ID
+
+        Returns:
+            list: {"name", "posts_count"} 목록
+        """
+        data = get_redis().hgetall(TagCloudService._key(blog_id))
+        if READY_FIELD.encode() not in data:
+            counts = TagCloudService.rebuild(blog_id)
+        else:
+            counts = {
+                field.decode(): int(value)
+                for field, value in data.items()
+                if field.decode() != READY_FIELD
+            }
+
+        tags = [
+            {"name": name, "posts_count": count}
+            for name, count in counts.items()
+            if count > 0
+        ]
+        return sorted(tags, key=lambda tag: (-tag["posts_count"], tag["name"]))
@@ -0,0 +1,240 @@
+from django.conf import settings
+from django.db.models import Count
+from taggit.models import Tag
+from ..models import Post, LIST_DEFERRED_FIELDS
+from ..pagination import SortedSetPaginator
+from ..redis_store import READY_MEMBER, get_redis
+
+# 인기 태그 목록에 보여주는 태그 수
+POPULAR_TAGS_LIMIT = 20
+
+# 전체 재생성 시 한 번에 Redis에 쓰는 행 수
+REBUILD_CHUNK_SIZE = 1000
+
+
+class TagIndexService:
+    """
+    태그별 공개 게시글 목록(posting list)과 전역 인기 태그 순위를 Redis에 관리합니다.
+
+    태그 페이지는 태그의 정렬 집합(작성 시각 순 게시글 ID)에서 한 페이지의 ID만 읽고
+    게시글을 일괄 조회하므로, 태그가 달린 게시글 수와 무관하게 비용이 같습니다.
+    인기 태그는 태그 이름 -> 공개 게시글 수 정렬 집합입니다.
+    두 집합 모두 DB에서 다 채운 뒤 READY_MEMBER를 넣어 두며, 이 멤버가 없으면
+    (축출되었거나 이벤트로 일부만 다시 생긴 집합) 읽을 때 다시 만듭니다.
+    """
+
+    @staticmethod
+    def _posts_key(name):
+        return f"{settings.CACHE_KEY_PREFIX}:tag:{name}:posts"
+
+    @staticmethod
+    def _popular_key():
+        return f"{settings.CACHE_KEY_PREFIX}:tags:popular"
+
+    @staticmethod
+    def _score(created_at):
+        """작성 시각을 정수 마이크로초로 변환 (float로도 정확히 표현되는 범위)"""
+        return int(created_at.timestamp()) * 1_000_000 + created_at.microsecond
+
+    @staticmethod
+    def _member(post_id):
+        """같은 점수에서 Redis 사전순 정렬이 id 순서와 같도록 0으로 채움"""
+        return f"{post_id:012d}"
+
+    @staticmethod
+    def adjust(post, names, delta):
+        """
+        게시글을 태그 목록에 추가(delta=1)하거나 제거(delta=-1)하고
+        인기 태그 점수를 함께 조정합니다.
+
+        Args:
+            post: 대상 게시글
+            names: 태그 이름 목록
+            delta: 1 또는 -1
+        """
+        names = list(names)
+        if not names:
+            return
+
+        member = TagIndexService._member(post.id)
+        score = TagIndexService._score(post.created_at)
+        pipe = get_redis().pipeline()
+        for name in names:
+            key = TagIndexService._posts_key(name)
+            if delta > 0:
+                pipe.zadd(key, {member: score})
+            else:
+                pipe.zrem(key, member)
+            pipe.zincrby(TagIndexService._popular_key(), delta, name)
+        pipe.execute()
+
+    @staticmethod
+    def rebuild_tag(name):
+        """
+        DB 기준으로 태그 하나의 게시글 목록을 다시 만듭니다.
+
+        Args:
+            name: 태그 이름
+        """
+        mapping = {
+            TagIndexService._member(post_id): TagIndexService._score(created_at)
+            for post_id, created_at in Post.objects.by_tag(name).values_list(
+                "id", "created_at"
+            )
+        }
+        mapping[READY_MEMBER] = float("-inf")
+        pipe = get_redis().pipeline()
+        pipe.delete(TagIndexService._posts_key(name))
+        pipe.zadd(TagIndexService._posts_key(name), mapping)
+        pipe.execute()
+
+    @staticmethod
+    def rebuild_popular():
+        """DB 기준으로 인기 태그 순위를 다시 만듭니다."""
+        mapping = dict(
+            Tag.objects.filter(post__status="published")
+            .values_list("name")
+            .annotate(posts_count=Count("post"))
+        )
+        mapping[READY_MEMBER] = float("-inf")
+        pipe = get_redis().pipeline()
+        pipe.delete(TagIndexService._popular_key())
+        pipe.zadd(TagIndexService._popular_key(), mapping)
+        pipe.execute()
+
+    @staticmethod
+    def rebuild_all():
+        """
+        모든 태그의 게시글 목록과 인기 태그 순위를 다시 만듭니다.
+
+        기존 목록을 먼저 지우고(그 사이 읽는 요청은 태그별로 DB에서 만듦)
+        (태그, 게시글) 행을 한 번의 쿼리로 순회하며 채웁니다.
+
+        Returns:
+            int: 다시 만든 태그 수
+        """
+        redis = get_redis()
+        names = list(Tag.objects.values_list("name", flat=True))
+        for start in range(0, len(names), REBUILD_CHUNK_SIZE):
+            chunk = names[start : start + REBUILD_CHUNK_SIZE]
+            redis.delete(*[TagIndexService._posts_key(name) for name in chunk])
+
+        rows = (
+            Tag.objects.filter(post__status="published")
+            .values_list("name", "post__id", "post__created_at")
+            .iterator(chunk_size=REBUILD_CHUNK_SIZE)
+        )
+        pipe = redis.pipeline()
+        for count, (name, post_id, created_at) in enumerate(rows, start=1):
+            pipe.zadd(
+                TagIndexService._posts_key(name),
+                {TagIndexService._member(post_id): TagIndexService._score(created_at)},
+            )
+            if count % REBUILD_CHUNK_SIZE == 0:
+                pipe.execute()
+        for name in names:
+            pipe.zadd(TagIndexService._posts_key(name), {READY_MEMBER: float("-inf")})
+        pipe.execute()
+
+        TagIndexService.rebuild_popular()
+        return len(names)
+
+    @staticmethod
+    def _ensure_ready(name):
+        if get_redis().zscore(TagIndexService._posts_key(name), READY_MEMBER) is None:
+            TagIndexService.rebuild_tag(name)
+
+    @staticmethod
+    def get_posts_count(name):
+        """
+        태그가 달린 공개 게시글 수를 반환합니다.
+
+        Args:
+            name: 태그 이름
+
+        Returns:
+            int: 게시글 수
+        """
+        TagIndexService._ensure_ready(name)
+        # 준비 표시 멤버 제외
+        return get_redis().zcard(TagIndexService._posts_key(name)) - 1
+
+    @staticmethod
+    def get_paginator(name, per_page):
+        """
+        태그 게시글 목록 커서 페이지네이터를 반환합니다.
+
+        Args:
+            name: 태그 이름
+            per_page: 페이지당 게시글 수
+
+        Returns:
+            SortedSetPaginator: 태그 게시글 페이지네이터
+        """
+        TagIndexService._ensure_ready(name)
+        return SortedSetPaginator(
+            TagIndexService._posts_key(name),
+            per_page,
+            lambda post_ids: TagIndexService.get_posts_by_ids(name, post_ids),
+        )
+
+    @staticmethod
+    def get_posts_by_ids(name, post_ids):
+        """
+        태그 목록에서 읽은 ID 순서대로 게시글을 일괄 조회합니다.
+
+        Args:
+            name: 태그 이름
+            post_ids: 게시글 ID 목록 (작성 시각 순)
+
+        Returns:
+            list: Post 객체 목록
+        """
+        posts = Post.objects.published().filter(id__in=post_ids)
+        posts = {post.id: post for post in posts.defer(*LIST_DEFERRED_FIELDS)}
+
+        # 삭제되었거나 비공개로 바뀐 게시글은 목록에서 정리
+        missing = [post_id for post_id in post_ids if post_id not in posts]
+        if missing:
+            get_redis().zrem(
+                TagIndexService._posts_key(name),
+                *[TagIndexService._member(post_id) for post_id in missing],
+            )
+
+        return [posts[post_id] for post_id in post_ids if post_id in posts]
+
+    @staticmethod
+    def ensure_popular_ready():
+        """
+        인기 태그 순위가 없으면(처음이거나 축출됨) DB에서 다시 만듭니다.
+
+        Returns:
+            bool: 이미 순위가 있었으면 True
+        """
+        if get_redis().zscore(TagIndexService._popular_key(), READY_MEMBER) is not None:
+            return True
+        TagIndexService.rebuild_popular()
+        return False
+
+    @staticmethod
+    def get_popular_tags(limit=POPULAR_TAGS_LIMIT):
+        """
+        공개 게시글이 많은 태그를 반환합니다.
+
+        Args:
+            limit: 최대 태그 수
+
+        Returns:
+            list: {"name", "posts_count"} 목록
+        """
+        redis = get_redis()
+        TagIndexService.ensure_popular_ready()
+
+        # 준비 표시 멤버(-inf)와 게시글이 없어진 태그(0)는 제외
+        return [
+            {"name": name.decode(), "posts_count": int(score)}
+            for name, score in redis.zrevrange(
+                TagIndexService._popular_key(), 0, limit - 1, withscores=True
+            )
+            if score > 0
+        ]
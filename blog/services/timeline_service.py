@@ -0,0 +1,394 @@
+from datetime import datetime, timedelta, timezone as dt_timezone
+from django.conf import settings
+from django.db.models import Q
+from user.models import Follow
+from ..models import Post, LIST_DEFERRED_FIELDS
+from ..pagination import CursorPage, decode_cursor, encode_cursor
+from ..redis_store import READY_MEMBER, get_redis
+
+# 팔로워별 타임라인에 보관하는 최대 게시글 수
+TIMELINE_SIZE = 800
+
+# 팔로워가 이보다 많은 작성자는 fan-out 하지 않고 읽을 때 DB에서 가져옴
+FANOUT_FOLLOWER_LIMIT = 1000
+
+EPOCH = datetime(1970, 1, 1, tzinfo=dt_timezone.utc)
+
+
+class TimelinePaginator:
+    """
+    팔로잉 타임라인을 (updated_at, id) 커서로 읽는 페이지네이터.
+
+    fan-out 된 게시글은 타임라인 정렬 집합 하나에서, 팔로워가 많은 작성자의
+    게시글과 보관 한도(TIMELINE_SIZE)를 넘어 잘린 오래된 게시글은 DB에서
+    같은 커서 조건으로 가져와 병합합니다.
+    CursorPaginator와 같은 인터페이스(page)를 제공합니다.
+    """
+
+    def __init__(self, user, per_page):
+        self.user = user
+        self.per_page = per_page
+
+    def page(self, token):
+        """
+        커서 토큰에 해당하는 페이지를 반환합니다.
+
+        Args:
+            token: 이전 페이지에서 받은 커서 토큰 (없거나 잘못되면 첫 페이지)
+
+        Returns:
+            CursorPage: 현재 페이지
+        """
+        cursor = decode_cursor(token)
+        try:
+            key = (int(cursor[0][0]), int(cursor[0][1]))
+            direction = cursor[1]
+        except (TypeError, ValueError, IndexError):
+            key, direction = None, "next"
+
+        limit = self.per_page + 1
+        entries = TimelineService.get_entries(self.user, key, direction, limit)
+        entries |= TimelineService.get_pulled_entries(self.user, key, direction, limit)
+
+        # (updated_at, id) 내림차순 정렬 (prev는 커서에 가까운 것부터)
+        # pull 대상이 되기 전에 fan-out 된 게시글이 중복되지 않도록 id 기준으로 한 번만
+        merged, seen = [], set()
+        for entry in sorted(entries, reverse=direction == "next"):
+            if entry[1] not in seen:
+                seen.add(entry[1])
+                merged.append(entry)
+        entries = merged[:limit]
+        has_more = len(entries) > self.per_page
+        entries = entries[: self.per_page]
+        if direction == "prev":
+            entries.reverse()
+
+        if not entries:
+            return CursorPage([])
+
+        posts = Post.objects.published().filter(id__in=[pk for _, pk in entries])
+        posts = {post.id: post for post in posts.defer(*LIST_DEFERRED_FIELDS)}
+
+        if direction == "next":
+            has_next, has_previous = has_more, key is not None
+        else:
+            has_next, has_previous = True, has_more
+
+        return CursorPage(
+            [posts[pk] for _, pk in entries if pk in posts],
+            next_cursor=(
+                encode_cursor(list(entries[-1]), "next") if has_next else None
+            ),
+            previous_cursor=(
+                encode_cursor(list(entries[0]), "prev") if has_previous else None
+            ),
+        )
+
+
+class TimelineService:
+    @staticmethod
+    def _key(user_id):
+        return f"{settings.CACHE_KEY_PREFIX}:timeline:{user_id}"
+
+    @staticmethod
+    def _pull_authors_key():
+        return f"{settings.CACHE_KEY_PREFIX}:timeline:pull_authors"
+
+    @staticmethod
+    def _score(value):
+        """updated_at을 정수 마이크로초로 변환 (float 오차 없이 DB 값과 비교 가능)"""
+        return (value - EPOCH) // timedelta(microseconds=1)
+
+    @staticmethod
+    def _datetime(score):
+        return EPOCH + timedelta(microseconds=score)
+
+    @staticmethod
+    def _member(post_id):
+        """같은 점수에서 Redis 사전순 정렬이 id 순서와 같도록 0으로 채움"""
+        return f"{post_id:012d}"
+
+    @staticmethod
+    def _follower_ids(author_id):
+        """
+        fan-out 대상 팔로워 ID 목록을 반환합니다.
+        팔로워가 FANOUT_FOLLOWER_LIMIT를 넘으면 pull 대상으로 표시하고 None을 반환합니다.
+        """
+        redis = get_redis()
+        follower_ids = list(
+            Follow.objects.filter(following_id=author_id).values_list(
+                "follower_id", flat=True
+            )[: FANOUT_FOLLOWER_LIMIT + 1]
+        )
+        if len(follower_ids) > FANOUT_FOLLOWER_LIMIT:
+            redis.sadd(TimelineService._pull_authors_key(), author_id)
+            return None
+        redis.srem(TimelineService._pull_authors_key(), author_id)
+        return follower_ids
+
+    @staticmethod
+    def fan_out(post):
+        """
+        게시글을 작성자 팔로워들의 타임라인에 반영합니다.
+        공개 글은 추가(수정 시 점수 갱신)하고, 비공개로 바뀐 글은 제거합니다.
+
+        Args:
+            post: 저장된 게시글
+        """
+        follower_ids = TimelineService._follower_ids(post.author_id)
+        if not follower_ids:
+            return
+
+        member = TimelineService._member(post.id)
+        score = TimelineService._score(post.updated_at)
+        pipe = get_redis().pipeline()
+        for follower_id in follower_ids:
+            key = TimelineService._key(follower_id)
+            if post.status == "published":
+                pipe.zadd(key, {member: score})
+                TimelineService._trim(pipe, key)
+            else:
+                pipe.zrem(key, member)
+        pipe.execute()
+
+    @staticmethod
+    def remove_post(post):
+        """삭제된 게시글을 팔로워들의 타임라인에서 제거합니다."""
+        follower_ids = TimelineService._follower_ids(post.author_id)
+        if not follower_ids:
+            return
+
+        member = TimelineService._member(post.id)
+        pipe = get_redis().pipeline()
+        for follower_id in follower_ids:
+            pipe.zrem(TimelineService._key(follower_id), member)
+        pipe.execute()
+
+    @staticmethod
+    def _trim(pipe, key):
+        """가장 오래된 게시글부터 잘라 TIMELINE_SIZE개만 남김 (0번은 준비 표시 멤버)"""
+        pipe.zremrangebyrank(key, 1, -(TIMELINE_SIZE + 2))
+
+    @staticmethod
+    def _add_posts(user_id, posts, rebuild=False):
+        """
+        (id, updated_at) 목록을 타임라인에 추가하고 크기를 제한합니다.
+        rebuild이면 기존 집합을 비우고 준비 표시 멤버와 함께 한 번에 다시 채웁니다.
+        """
+        key = TimelineService._key(user_id)
+        mapping = {
+            TimelineService._member(post_id): TimelineService._score(updated_at)
+            for post_id, updated_at in posts
+        }
+        pipe = get_redis().pipeline()
+        if rebuild:
+            pipe.delete(key)
+            pipe.zadd(key, {READY_MEMBER: float("-inf")})
+        if mapping:
+            pipe.zadd(key, mapping)
+            TimelineService._trim(pipe, key)
+        pipe.execute()
+
+    @staticmethod
+    def follow(follower_id, author_id):
+        """
+        새로 팔로우한 작성자의 최근 게시글로 타임라인을 채웁니다.
+
+        Args:
+            follower_id: 팔로우한 사용자 ID
+            author_id: 팔로우된 작성자 ID
+        """
+        key = TimelineService._key(follower_id)
+        if get_redis().zscore(key, READY_MEMBER) is None:
+            # 타임라인이 아직 없으면 처음 읽을 때 전체를 만듦
+            return
+        posts = (
+            Post.objects.filter(author_id=author_id, status="published")
+            .order_by("-updated_at", "-id")
+            .values_list("id", "updated_at")[:TIMELINE_SIZE]
+        )
+        TimelineService._add_posts(follower_id, posts)
+
+    @staticmethod
+    def unfollow(follower_id, author_id):
+        """
+        언팔로우한 작성자의 게시글을 타임라인에서 제거합니다.
+
+        Args:
+            follower_id: 언팔로우한 사용자 ID
+            author_id: 언팔로우된 작성자 ID
+        """
+        post_ids = Post.objects.filter(author_id=author_id).values_list("id", flat=True)
+        members = [TimelineService._member(post_id) for post_id in post_ids]
+        if members:
+            get_redis().zrem(TimelineService._key(follower_id), *members)
+
+    @staticmethod
+    def rebuild(user_id):
+        """
+        DB 기준으로 사용자의 타임라인을 다시 만듭니다.
+        (Redis가 비워졌거나 처음 읽는 경우)
+
+        Args:
+            user_id: 대상 사용자 ID
+        """
+        following_ids = Follow.objects.filter(follower_id=user_id).values_list(
+            "following_id", flat=True
+        )
+        posts = (
+            Post.objects.filter(author_id__in=following_ids, status="published")
+            .order_by("-updated_at", "-id")
+            .values_list("id", "updated_at")[:TIMELINE_SIZE]
+        )
+        TimelineService._add_posts(user_id, posts, rebuild=True)
+
+    @staticmethod
+    def get_entries(user, key, direction, limit):
+        """
+        타임라인 정렬 집합에서 커서 이후의 (score, post_id)를 limit개 읽습니다.
+
+        Args:
+            user: 대상 사용자
+            key: 커서의 (score, post_id) (None이면 처음부터)
+            direction: next 또는 prev
+            limit: 최대 개수
+
+        Returns:
+            set: (score, post_id) 집합
+        """
+        redis = get_redis()
+        name = TimelineService._key(user.id)
+        # 준비 표시 멤버가 없으면 축출되었거나 일부만 채워진 집합
+        if redis.zscore(name, READY_MEMBER) is None:
+            TimelineService.rebuild(user.id)
+
+        if key is None:
+            entries = redis.zrevrange(name, 0, limit - 1, withscores=True)
+        elif direction == "next":
+            entries = redis.zrevrangebyscore(
+                name, f"({key[0]}", "-inf", start=0, num=limit, withscores=True
+            )
+            ties = [
+                (member, score)
+                for member, score in redis.zrevrangebyscore(
+                    name, key[0], key[0], withscores=True
+                )
+                if int(member) < key[1]
+            ]
+            entries = ties + entries
+        else:
+            entries = redis.zrangebyscore(
+                name, f"({key[0]}", "+inf", start=0, num=limit, withscores=True
+            )
+            ties = [
+                (member, score)
+                for member, score in redis.zrangebyscore(
+                    name, key[0], key[0], withscores=True
+                )
+                if int(member) > key[1]
+            ]
+            entries = ties + entries
+
+        entries = {
+            (int(score), int(member))
+            for member, score in entries
+            if member != READY_MEMBER
+        }
+        entries = set(sorted(entries, reverse=direction == "next")[:limit])
+
+        # 보관 한도가 찬 집합보다 오래된 게시글은 DB에서 읽음
+        if redis.zcard(name) > TIMELINE_SIZE:
+            member, score = redis.zrange(name, 1, 1, withscores=True)[0]
+            floor = (int(score), int(member))
+            if direction == "next" and len(entries) < limit:
+                after = floor if key is None else min(key, floor)
+                entries |= TimelineService._get_db_entries(
+                    user, after, None, "next", limit
+                )
+            elif direction == "prev" and key is not None and key < floor:
+                entries |= TimelineService._get_db_entries(
+                    user, key, floor, "prev", limit
+                )
+
+        return entries
+
+    @staticmethod
+    def _keyset_entries(posts, key, direction, limit, before=None):
+        """
+        게시글 쿼리셋에서 커서 이후의 (score, post_id)를 limit개 읽습니다.
+        before를 지정하면 그보다 오래된 게시글만 읽습니다.
+        """
+        ordering = ("-updated_at", "-id")
+        if key is not None:
+            updated_at = TimelineService._datetime(key[0])
+            if direction == "next":
+                posts = posts.filter(
+                    Q(updated_at__lt=updated_at)
+                    | Q(updated_at=updated_at, id__lt=key[1])
+                )
+            else:
+                posts = posts.filter(
+                    Q(updated_at__gt=updated_at)
+                    | Q(updated_at=updated_at, id__gt=key[1])
+                )
+                ordering = ("updated_at", "id")
+        if before is not None:
+            updated_at = TimelineService._datetime(before[0])
+            posts = posts.filter(
+                Q(updated_at__lt=updated_at)
+                | Q(updated_at=updated_at, id__lt=before[1])
+            )
+
+        return {
+            (TimelineService._score(updated_at), post_id)
+            for post_id, updated_at in posts.order_by(*ordering).values_list(
+                "id", "updated_at"
+            )[:limit]
+        }
+
+    @staticmethod
+    def _get_db_entries(user, key, before, direction, limit):
+        """팔로우한 작성자의 게시글을 DB에서 커서 조건으로 읽습니다."""
+        following_ids = Follow.objects.filter(follower=user).values_list(
+            "following_id", flat=True
+        )
+        posts = Post.objects.filter(author_id__in=following_ids, status="published")
+        return TimelineService._keyset_entries(posts, key, direction, limit, before)
+
+    @staticmethod
+    def get_pulled_entries(user, key, direction, limit):
+        """
+        fan-out 하지 않는 (팔로워가 많은) 작성자의 게시글을 DB에서 읽습니다.
+
+        Args:
+            user: 대상 사용자
+            key: 커서의 (score, post_id) (None이면 처음부터)
+            direction: next 또는 prev
+            limit: 최대 개수
+
+        Returns:
+            set: (score, post_id) 집합
+        """
+        pull_authors = get_redis().smembers(TimelineService._pull_authors_key())
+        if not pull_authors:
+            return set()
+
+        author_ids = Follow.objects.filter(
+            follower=user, following_id__in=[int(pk) for pk in pull_authors]
+        ).values_list("following_id", flat=True)
+        posts = Post.objects.filter(author_id__in=author_ids, status="published")
+        return TimelineService._keyset_entries(posts, key, direction, limit)
+
+    @staticmethod
+    def get_paginator(user, per_page):
+        """
+        팔로잉 타임라인 커서 페이지네이터를 반환합니다.
+
+        Args:
+            user: 대상 사용자
+            per_page: 페이지당 게시글 수
+
+        Returns:
+            TimelinePaginator: 타임라인 페이지네이터
+        """
+        return TimelinePaginator(user, per_page)
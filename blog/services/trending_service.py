@@ -0,0 +1,290 @@
+import math
+from datetime import timedelta
+from django.conf import settings
+from django.utils import timezone
+from ..models import Post, LIST_DEFERRED_FIELDS
+from ..pagination import SortedSetPaginator
+from ..redis_store import READY_MEMBER, get_redis
+from .cache_service import CacheService
+
+# 트렌딩 기간 (일)
+PERIOD_DAYS = {"day": 1, "week": 7, "month": 30, "year": 365}
+
+# 참여도 가중치
+LIKE_WEIGHT = 3
+VIEW_WEIGHT = 1
+
+# 참여도가 10배 높은 글이 이 시간(초)만큼 먼저 작성된 글과 같은 점수를 가짐
+# (일간 기준, 긴 기간일수록 기간 길이에 비례해 천천히 감쇠)
+DECAY_SECONDS = 45000
+PERIOD_DECAY_SECONDS = {
+    period: DECAY_SECONDS * days for period, days in PERIOD_DAYS.items()
+}
+
+# 다시 만들 때 한 번에 반영하는 게시글 수
+REBUILD_BATCH_SIZE = 500
+
+
+class TrendingPaginator(SortedSetPaginator):
+    """트렌딩 정렬 집합 페이지네이터 (읽기 전에 기간이 지난 게시글을 정리)"""
+
+    def __init__(self, period, per_page):
+        super().__init__(
+            TrendingService._key(period), per_page, TrendingService.get_posts_by_ids
+        )
+        self.period = period
+
+    def page(self, token):
+        redis = get_redis()
+        TrendingService._ensure_ready(redis, self.period)
+        TrendingService._prune(redis, self.period)
+        return super().page(token)
+
+
+class TrendingService:
+    @staticmethod
+    def _key(period):
+        return f"{settings.CACHE_KEY_PREFIX}:trending:{period}"
+
+    @staticmethod
+    def _created_key(period):
+        return f"{settings.CACHE_KEY_PREFIX}:trending:{period}:created"
+
+    @staticmethod
+    def score(post, period="day"):
+        """
+        시간 감쇠가 반영된 트렌딩 점수를 계산합니다.
+        작성 시각이 점수에 포함되므로 이벤트가 없어도 재계산할 필요가 없습니다.
+
+        Args:
+            post: 대상 게시글
+            period: 기간 (감쇠 속도가 기간 길이에 비례)
+
+        Returns:
+            float: 트렌딩 점수
+        """
+        engagement = post.likes * LIKE_WEIGHT + post.views * VIEW_WEIGHT
+        return (
+            math.log10(max(engagement, 1))
+            + post.created_at.timestamp() / PERIOD_DECAY_SECONDS[period]
+        )
+
+    @staticmethod
+    def update_posts(posts):
+        """
+        게시글들의 트렌딩 점수를 기간별 정렬 집합에 반영합니다.
+        공개되지 않았거나 기간을 벗어난 게시글은 집합에서 제거합니다.
+
+        Args:
+            posts: 대상 게시글 목록
+        """
+        pipe = get_redis().pipeline()
+        TrendingService._add_posts(pipe, posts, TrendingService._key)
+        pipe.execute()
+
+    @staticmethod
+    def _add_posts(pipe, posts, key_for):
+        now = timezone.now()
+        for post in posts:
+            created = post.created_at.timestamp()
+            for period, days in PERIOD_DAYS.items():
+                key = key_for(period)
+                created_key = f"{key}:created"
+                in_period = post.created_at >= now - timedelta(days=days)
+                if post.status == "published" and in_period:
+                    pipe.zadd(key, {post.id: TrendingService.score(post, period)})
+                    pipe.zadd(created_key, {post.id: created})
+                else:
+                    pipe.zrem(key, post.id)
+                    pipe.zrem(created_key, post.id)
+
+    @staticmethod
+    def update_post(post):
+        """게시글 하나의 트렌딩 점수를 갱신합니다."""
+        TrendingService.update_posts([post])
+
+    @staticmethod
+    def refresh_posts(post_ids):
+        """
+        DB에서 최신 좋아요/조회수를 읽어 트렌딩 점수를 갱신합니다.
+        (조회수 flush처럼 여러 게시글의 수치가 한꺼번에 바뀐 경우)
+
+        Args:
+            post_ids: 대상 게시글 ID 목록
+        """
+        posts = (
+            Post.objects.filter(id__in=post_ids)
+            .select_related(None)
+            .prefetch_related(None)
+            .only("id", "status", "likes", "views", "created_at")
+        )
+        TrendingService.update_posts(posts)
+
+    @staticmethod
+    def remove_posts(post_ids):
+        """게시글들을 모든 트렌딩 집합에서 제거합니다."""
+        pipe = get_redis().pipeline()
+        for period in PERIOD_DAYS:
+            pipe.zrem(TrendingService._key(period), *post_ids)
+            pipe.zrem(TrendingService._created_key(period), *post_ids)
+        pipe.execute()
+
+    @staticmethod
+    def _ensure_ready(redis, period):
+        """집합이 비었거나 축출되었으면 (다른 워커와 겹치지 않게) 다시 만듭니다."""
+        key = TrendingService._key(period)
+        if redis.zscore(key, READY_MEMBER) is None:
+            CacheService.run_once(
+                f"{key}:rebuild", TrendingService.rebuild, name="trending"
+            )
+
+    @staticmethod
+    def _prune(redis, period):
+        """기간을 벗어난 게시글을 집합에서 제거합니다."""
+        cutoff = timezone.now() - timedelta(days=PERIOD_DAYS[period])
+        created_key = TrendingService._created_key(period)
+        stale = redis.zrangebyscore(created_key, "-inf", f"({cutoff.timestamp()}")
+        if stale:
+            redis.zrem(TrendingService._key(period), *stale)
+            redis.zrem(created_key, *stale)
+
+    @staticmethod
+    def count(period):
+        """
+        기간 내 트렌딩 게시글 수를 반환합니다.
+
+        Args:
+            period: 기간 (day/week/month/year)
+
+        Returns:
+            int: 게시글 수
+        """
+        redis = get_redis()
+        TrendingService._ensure_ready(redis, period)
+        TrendingService._prune(redis, period)
+        key = TrendingService._key(period)
+        return redis.zcard(key) - (redis.zscore(key, READY_MEMBER) is not None)
+
+    @staticmethod
+    def get_posts(period, start, stop):
+        """
+        점수 순으로 start부터 stop 직전까지의 게시글을 반환합니다.
+
+        Args:
+            period: 기간 (day/week/month/year)
+            start: 시작 순위 (0부터)
+            stop: 끝 순위 (포함하지 않음)
+
+        Returns:
+            list: Post 객체 목록
+        """
+        if stop <= start:
+            return []
+
+        redis = get_redis()
+        TrendingService._ensure_ready(redis, period)
+        TrendingService._prune(redis, period)
+        post_ids = [
+            int(post_id)
+            for post_id in redis.zrevrange(
+                TrendingService._key(period), start, stop - 1
+            )
+            if post_id != READY_MEMBER
+        ]
+        return TrendingService.get_posts_by_ids(post_ids)
+
+    @staticmethod
+    def get_posts_by_ids(post_ids):
+        """
+        정렬 집합에서 읽은 ID 순서대로 게시글을 일괄 조회합니다.
+
+        Args:
+            post_ids: 게시글 ID 목록 (점수 순)
+
+        Returns:
+            list: Post 객체 목록
+        """
+        if not post_ids:
+            return []
+
+        posts = Post.objects.published().filter(id__in=post_ids)
+        posts = {post.id: post for post in posts.defer(*LIST_DEFERRED_FIELDS)}
+
+        # 삭제되었거나 비공개로 바뀐 게시글은 집합에서 정리
+        missing = [post_id for post_id in post_ids if post_id not in posts]
+        if missing:
+            TrendingService.remove_posts(missing)
+
+        return [posts[post_id] for post_id in post_ids if post_id in posts]
+
+    @staticmethod
+    def get_paginator(period, per_page):
+        """
+        트렌딩 게시글 커서 페이지네이터를 반환합니다.
+
+        Args:
+            period: 기간 (day/week/month/year)
+            per_page: 페이지당 게시글 수
+
+        Returns:
+            TrendingPaginator: 트렌딩 페이지네이터
+        """
+        if period not in PERIOD_DAYS:
+            period = "day"
+        return TrendingPaginator(period, per_page)
+
+    @staticmethod
+    def rebuild():
+        """
+        DB 기준으로 모든 트렌딩 집합을 다시 만듭니다.
+        임시 키에 채운 뒤 RENAME으로 교체하므로 읽는 쪽에 빈 집합이 보이지 않습니다.
+
+        Returns:
+            int: 반영된 게시글 수
+        """
+        redis = get_redis()
+
+        def temp_key(period):
+            return f"{TrendingService._key(period)}:rebuild"
+
+        pipe = redis.pipeline()
+        for period in PERIOD_DAYS:
+            pipe.delete(temp_key(period), f"{temp_key(period)}:created")
+            pipe.zadd(temp_key(period), {READY_MEMBER: float("-inf")})
+        pipe.execute()
+
+        start_date = timezone.now() - timedelta(days=max(PERIOD_DAYS.values()))
+        posts = (
+            Post.objects.filter(status="published", created_at__gte=start_date)
+            .select_related(None)
+            .prefetch_related(None)
+            .only("id", "status", "likes", "views", "created_at")
+            .order_by("id")
+        )
+
+        batch = []
+        count = 0
+        for post in posts.iterator(chunk_size=REBUILD_BATCH_SIZE):
+            batch.append(post)
+            if len(batch) >= REBUILD_BATCH_SIZE:
+                pipe = redis.pipeline()
+                TrendingService._add_posts(pipe, batch, temp_key)
+                pipe.execute()
+                count += len(batch)
+                batch = []
+        if batch:
+            pipe = redis.pipeline()
+            TrendingService._add_posts(pipe, batch, temp_key)
+            pipe.execute()
+            count += len(batch)
+
+        for period in PERIOD_DAYS:
+            created_key = TrendingService._created_key(period)
+            redis.rename(temp_key(period), TrendingService._key(period))
+            # 기간 안의 게시글이 없으면 작성 시각 집합이 만들어지지 않음
+            if redis.exists(f"{temp_key(period)}:created"):
+                redis.rename(f"{temp_key(period)}:created", created_key)
+            else:
+                redis.delete(created_key)
+
+        return count
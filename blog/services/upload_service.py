@@ -0,0 +1,229 @@
+import hashlib
+import mimetypes
+import re
+import uuid
+from datetime import datetime
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError, transaction
+from ..media_store import delete_media, get_media_url, head_media, presign_upload
+from ..models import UploadedImage
+from ..tasks import process_pending_images
+from .image_service import ImageVariantService
+
+# presigned 업로드 정책의 유효 시간
+PRESIGNED_UPLOAD_TTL = 5 * 60
+
+# 발급한 업로드 키를 완료 요청까지 기억하는 시간 (느린 업로드 여유 포함)
+UPLOAD_TICKET_TTL = PRESIGNED_UPLOAD_TTL + 10 * 60
+
+SHA256_RE = re.compile(r"^[0-9a-f]{64}$")
+
+
+class ImageUploadService:
+    """
+    에디터 이미지 업로드 키 발급과 등록을 담당합니다.
+
+    브라우저는 presign으로 받은 정책으로 MinIO에 직접 올리고 complete를 호출하므로
+    업로드하는 동안 웹 워커를 점유하지 않습니다.
+
+    같은 내용의 이미지는 SHA-256으로 찾아 이미 저장된 객체의 URL을 돌려주므로
+    다시 업로드하지 않습니다. (UploadedImage.content_hash가 해시 -> 객체 키 인덱스)
+    """
+
+    @staticmethod
+    def _extension(filename, content_type):
+        ext = mimetypes.guess_extension(content_type or "")
+        if ext:
+            return ext.lstrip(".")
+        return filename.rsplit(".", 1)[-1].lower() if "." in filename else "bin"
+
+    @staticmethod
+    def build_key(filename):
+        """연/월 폴더 아래 UUID 파일 이름으로 객체 키를 만듦"""
+        ext = filename.rsplit(".", 1)[-1].lower() if "." in filename else "bin"
+        today = datetime.now()
+        return f"blog/posts/images/{today.year}/{today.month:02d}/{uuid.uuid4()}.{ext}"
+
+    @staticmethod
+    def content_key(content_hash, filename, content_type):
+        """내용 해시로 객체 키를 만듦 (같은 내용이면 같은 키)"""
+        ext = ImageUploadService._extension(filename, content_type)
+        return f"blog/posts/images/sha256/{content_hash[:2]}/{content_hash}.{ext}"
+
+    @staticmethod
+    def hash_file(file):
+        """
+        업로드 파일을 청크 단위로 읽어 SHA-256을 계산합니다.
+
+        Args:
+            file: Django UploadedFile
+
+        Returns:
+            str: 16진수 SHA-256
+        """
+        digest = hashlib.sha256()
+        for chunk in file.chunks():
+            digest.update(chunk)
+        return digest.hexdigest()
+
+    @staticmethod
+    def find_existing(content_hash):
+        """
+        같은 내용의 이미지가 이미 저장되어 있으면 그 URL을 반환합니다.
+        변환에 실패한 이미지는 재사용하지 않습니다. (다시 올린 원본이 대신 변환됨)
+
+        Args:
+            content_hash: 16진수 SHA-256
+
+        Returns:
+            str: 기존 이미지의 공개 URL (없으면 None)
+        """
+        image = (
+            UploadedImage.objects.filter(content_hash=content_hash)
+            .exclude(status="failed")
+            .first()
+        )
+        if image is None:
+            return None
+        return get_media_url(image.key)
+
+    @staticmethod
+    def _ticket_key(key):
+        return f"{settings.CACHE_KEY_PREFIX}:upload:{key}"
+
+    @staticmethod
+    def _validate(content_type, size):
+        if not content_type or not content_type.startswith("image/"):
+            raise ValidationError("File type not supported")
+        if size is not None and not 0 < size <= settings.MAX_UPLOAD_SIZE:
+            raise ValidationError("File too large")
+
+    @staticmethod
+    def presign(user, filename, content_type, size=None, content_hash=None):
+        """
+        브라우저가 직접 업로드할 presigned POST 정책을 발급합니다.
+        브라우저가 계산한 해시가 이미 저장된 이미지와 같으면 정책 대신 URL을 반환합니다.
+
+        Args:
+            user: 업로드하는 사용자
+            filename: 원본 파일 이름 (확장자만 사용)
+            content_type: 파일 Content-Type
+            size: 파일 크기 (알면 미리 검사)
+            content_hash: 브라우저가 계산한 SHA-256 (선택)
+
+        Returns:
+            dict: {"url", "fields", "key"} 또는 중복이면 {"location"}
+
+        Raises:
+            ValidationError: 이미지가 아니거나 너무 큰 경우, 해시 형식이 잘못된 경우
+        """
+        ImageUploadService._validate(content_type, size)
+        if content_hash:
+            if not SHA256_RE.match(content_hash):
+                raise ValidationError("Invalid content hash")
+            # 해시는 검증된 인덱스와만 비교 (새 객체 키는 클라이언트 해시를 믿지 않음)
+            location = ImageUploadService.find_existing(content_hash)
+            if location:
+                return {"location": location}
+
+        key = ImageUploadService.build_key(filename)
+        policy = presign_upload(
+            key, content_type, settings.MAX_UPLOAD_SIZE, PRESIGNED_UPLOAD_TTL
+        )
+        cache.set(
+            ImageUploadService._ticket_key(key),
+            {"user_id": user.id, "content_type": content_type},
+            UPLOAD_TICKET_TTL,
+        )
+        return {**policy, "key": key}
+
+    @staticmethod
+    def complete(user, key):
+        """
+        직접 업로드가 끝난 객체를 확인하고 등록합니다.
+
+        Args:
+            user: 업로드한 사용자
+            key: presign에서 받은 객체 키
+
+        Returns:
+            str: 업로드한 이미지의 공개 URL
+
+        Raises:
+            ValidationError: 발급하지 않은 키이거나 객체가 없거나 정책과 다른 경우
+        """
+        ticket = cache.get(ImageUploadService._ticket_key(key))
+        if ticket is None or ticket["user_id"] != user.id:
+            raise ValidationError("Unknown upload")
+
+        head = head_media(key)
+        if head is None:
+            raise ValidationError("Upload not found")
+        if head.get("ContentType") != ticket["content_type"] or not (
+            0 < head["ContentLength"] <= settings.MAX_UPLOAD_SIZE
+        ):
+            delete_media(key)
+            cache.delete(ImageUploadService._ticket_key(key))
+            raise ValidationError("Upload does not match the policy")
+
+        ImageUploadService.register(user, key, ticket["content_type"])
+        cache.delete(ImageUploadService._ticket_key(key))
+        return get_media_url(key)
+
+    @staticmethod
+    def register(user, key, content_type, content_hash=None):
+        """
+        업로드한 원본을 기록하고 반응형 변환 대기열에 넣습니다.
+
+        같은 키나 같은 해시가 이미 기록되어 있으면(동시 업로드, 변환 워커의 해시 기록)
+        그 행을 반환합니다. 변환에 실패했던 행이면 새로 올린 원본으로 다시 변환합니다.
+
+        Args:
+            user: 업로드한 사용자
+            key: 원본 객체 키
+            content_type: 원본 Content-Type
+            content_hash: 서버에서 계산한 SHA-256 (직접 업로드는 변환 워커가 채움)
+
+        Returns:
+            UploadedImage: 원본 기록 (key와 다른 기존 원본일 수 있음)
+        """
+        defaults = {
+            "uploader": user,
+            "content_type": content_type,
+            "content_hash": content_hash,
+        }
+        try:
+            with transaction.atomic():
+                image, created = UploadedImage.objects.get_or_create(
+                    key=key, defaults=defaults
+                )
+        except IntegrityError:
+            if content_hash is None:
+                raise
+            # 다른 키의 원본이 같은 해시를 먼저 기록한 경우
+            image = UploadedImage.objects.get(content_hash=content_hash)
+            if image.status != "failed":
+                # 새로 올린 객체는 쓰지 않으므로 지우고 기존 원본을 사용
+                delete_media(key)
+                return image
+            # 실패한 행에서 해시를 넘겨받아 새 원본을 변환
+            with transaction.atomic():
+                UploadedImage.objects.filter(pk=image.pk).update(content_hash=None)
+                image = UploadedImage.objects.create(key=key, **defaults)
+            created = True
+
+        if not created:
+            if image.status != "failed":
+                return image
+            # 같은 키에 다시 올린 원본으로 실패한 변환을 다시 시도
+            UploadedImage.objects.filter(pk=image.pk, status="failed").update(
+                status="pending"
+            )
+            image.status = "pending"
+
+        ImageVariantService.enqueue(key)
+        # 대기 중인 변환 작업이 있으면 그 작업이 함께 처리
+        process_pending_images.apply_async(idempotency_key="pending")
+        return image
@@ -1,10 +1,147 @@
 from django.dispatch import receiver
-from django.db.models.signals import post_save
-from user.models import CustomUser
-from .models import Blog
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete, pre_delete, m2m_changed
+from taggit.models import Tag
+from user.models import CustomUser, Follow
+from .models import Blog, Post
+from .services.page_cache_service import PageCacheService
+from .services.tag_cloud_service import TagCloudService
+from .services.tag_index_service import TagIndexService
+from .services.timeline_service import TimelineService
+from .services.trending_service import TrendingService
 
 
 @receiver(post_save, sender=CustomUser)
 def create_user_blog(sender, instance, created, **kwargs):
     if created:
         Blog.objects.create(owner=instance, title=f"Just Do {instance.username}'s Blog")
+
+
+@receiver(post_save, sender=Post)
+def update_post_trending(sender, instance, **kwargs):
+    """게시글 저장(발행/비공개 전환 포함) 시 트렌딩 점수 갱신"""
+    TrendingService.update_post(instance)
+
+
+@receiver(post_delete, sender=Post)
+def remove_post_trending(sender, instance, **kwargs):
+    TrendingService.remove_posts([instance.id])
+
+
+def affects_public_views(post, created):
+    """
+    공개 글이거나 공개/비공개가 바뀐 저장이면 True.
+    임시저장 글의 자동 저장/수정은 공개 화면에 보이지 않으므로 False.
+    """
+    if post.status == "published" or getattr(post, "_published_delta", 0):
+        return True
+    # 이전 상태를 알 수 없으면(status를 불러오지 않은 경우) 반영
+    return not created and not hasattr(post, "_stored_status")
+
+
+@receiver(post_save, sender=Post)
+def fan_out_post_timeline(sender, instance, created, **kwargs):
+    """게시글 발행/수정 시 팔로워 타임라인에 반영 (비공개 전환 시 제거)"""
+    if affects_public_views(instance, created):
+        TimelineService.fan_out(instance)
+
+
+@receiver(post_delete, sender=Post)
+def remove_post_timeline(sender, instance, **kwargs):
+    TimelineService.remove_post(instance)
+
+
+@receiver(post_delete, sender=Post)
+def subtract_post_blog_stats(sender, instance, **kwargs):
+    """공개 게시글 삭제 시 블로그 집계에서 제외"""
+    if getattr(instance, "_stored_status", None) == "published":
+        Blog.objects.adjust_stats(
+            instance.blog_id,
+            posts=-1,
+            views=-instance.views,
+            likes=-instance.likes,
+        )
+
+
+@receiver(post_save, sender=Follow)
+def backfill_follower_timeline(sender, instance, created, **kwargs):
+    """팔로우 시 작성자의 최근 게시글을 팔로워 타임라인에 채움"""
+    if created:
+        TimelineService.follow(instance.follower_id, instance.following_id)
+
+
+@receiver(post_delete, sender=Follow)
+def trim_follower_timeline(sender, instance, **kwargs):
+    """언팔로우 시 작성자의 게시글을 팔로워 타임라인에서 제거"""
+    TimelineService.unfollow(instance.follower_id, instance.following_id)
+
+
+def post_tag_names(post):
+    """게시글의 태그 이름 목록 (tags가 prefetch되어 있으면 추가 쿼리 없음)"""
+    return [tag.name for tag in post.tags.all()]
+
+
+def purge_page_cache(*tags):
+    """
+    비로그인 페이지 캐시 태그를 무효화합니다.
+    커밋 전에 다른 워커가 이전 데이터로 다시 만든 페이지가 남지 않도록
+    커밋 후에 한 번 더 무효화합니다.
+    """
+    PageCacheService.purge(*tags)
+    transaction.on_commit(lambda: PageCacheService.purge(*tags))
+
+
+@receiver(post_save, sender=Post)
+def purge_post_pages(sender, instance, created, **kwargs):
+    """게시글 발행/수정 시 목록 페이지 캐시 무효화 (임시저장 글의 저장 제외)"""
+    if not affects_public_views(instance, created):
+        return
+    tags = [f"tag:{name}" for name in post_tag_names(instance)]
+    purge_page_cache("posts", "bloggers", *tags)
+
+
+def update_post_tags(post, names, delta):
+    """블로그 태그 클라우드, 태그별 게시글 목록, 인기 태그에 게시글의 태그 반영"""
+    TagCloudService.adjust(post.blog_id, names, delta)
+    TagIndexService.adjust(post, names, delta)
+
+
+@receiver(post_save, sender=Post)
+def update_published_post_tags(sender, instance, created, **kwargs):
+    """공개/비공개 전환 시 게시글의 태그를 태그 집계에 반영"""
+    delta = getattr(instance, "_published_delta", 0)
+    if delta and not created:
+        # 새 글의 태그는 저장 후에 추가되므로 태그 변경 시그널에서 반영
+        update_post_tags(instance, post_tag_names(instance), delta)
+
+
+@receiver(pre_delete, sender=Post)
+def purge_deleted_post(sender, instance, **kwargs):
+    """게시글 삭제 시 페이지 캐시 무효화, 공개 글이면 태그 집계에서 제외"""
+    # 삭제 후에는 태그 연결이 남지 않으므로 삭제 전에 태그를 읽음
+    names = post_tag_names(instance)
+    purge_page_cache("posts", "bloggers", *[f"tag:{name}" for name in names])
+    if getattr(instance, "_stored_status", None) == "published":
+        update_post_tags(instance, names, -1)
+
+
+@receiver(m2m_changed, sender=Post.tags.through)
+def sync_post_tags(sender, instance, action, pk_set, **kwargs):
+    """공개 게시글의 태그 추가/제거 시 태그 집계와 태그 페이지 캐시 반영"""
+    if not isinstance(instance, Post) or instance.status != "published":
+        return
+    if action in ("post_add", "post_remove"):
+        names = list(Tag.objects.filter(pk__in=pk_set).values_list("name", flat=True))
+        delta = 1 if action == "post_add" else -1
+    elif action == "pre_clear":
+        names, delta = post_tag_names(instance), -1
+    else:
+        return
+    update_post_tags(instance, names, delta)
+    purge_page_cache("posts", *[f"tag:{name}" for name in names])
+
+
+@receiver([post_save, post_delete], sender=Follow)
+def purge_blogger_pages(sender, instance, **kwargs):
+    """팔로워 수가 표시되는 인기 블로거 페이지 캐시 무효화"""
+    purge_page_cache("bloggers")
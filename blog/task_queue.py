@@ -0,0 +1,264 @@
+import json
+import logging
+import time
+import uuid
+from django.conf import settings
+from django.db import close_old_connections, connections
+from .redis_store import get_redis
+
+logger = logging.getLogger(__name__)
+
+# 실행 시각(score) -> 작업 ID 정렬 집합 (지연/재시도 작업도 같은 집합에서 기다림)
+QUEUE_KEY = f"{settings.CACHE_KEY_PREFIX}:tasks:queue"
+# 워커가 가져간 작업 ID -> 임대 만료 시각 (워커가 죽으면 만료 후 다시 대기열로)
+RUNNING_KEY = f"{settings.CACHE_KEY_PREFIX}:tasks:running"
+# 작업 ID -> 작업 내용(JSON)
+JOBS_KEY = f"{settings.CACHE_KEY_PREFIX}:tasks:jobs"
+# 작업 이름별 성공/재시도/실패 횟수
+STATS_KEY = f"{settings.CACHE_KEY_PREFIX}:tasks:stats"
+
+# 작업 하나가 끝나기를 기다리는 최대 시간 (넘으면 다른 워커가 다시 실행)
+JOB_LEASE_SECONDS = 10 * 60
+
+# 같은 멱등 키의 작업을 다시 넣지 않는 최대 시간 (작업이 끝나면 바로 해제)
+IDEMPOTENCY_TTL = 60 * 60
+
+# 기본 재시도 횟수와 첫 재시도 대기 시간 (재시도마다 2배)
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_RETRY_BACKOFF = 30
+
+# 워커가 한 번에 가져오는 작업 수
+RUN_BATCH_SIZE = 100
+
+# 등록된 작업 (이름 -> Task)
+registry = {}
+
+
+def _decode(value):
+    return value.decode() if isinstance(value, bytes) else value
+
+
+class Task:
+    """
+    대기열로 실행할 수 있는 함수.
+
+    직접 호출하면 바로 실행하고, delay/apply_async로 넣으면 run_tasks 워커가 실행합니다.
+    인자는 JSON으로 저장되므로 모델 객체 대신 ID를 넘깁니다.
+    """
+
+    def __init__(self, func, name, schedule, max_retries, retry_backoff):
+        self.func = func
+        self.name = name
+        self.schedule = schedule
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.__doc__ = func.__doc__
+
+    def __call__(self, *args, **kwargs):
+        return self.func(*args, **kwargs)
+
+    def __repr__(self):
+        return f"<Task {self.name}>"
+
+    def _idempotency_key(self, key):
+        return f"{settings.CACHE_KEY_PREFIX}:tasks:idempotency:{self.name}:{key}"
+
+    def delay(self, *args, **kwargs):
+        return self.apply_async(args, kwargs)
+
+    def apply_async(self, args=(), kwargs=None, countdown=0, idempotency_key=None):
+        """
+        작업을 대기열에 넣습니다.
+
+        Args:
+            args: 위치 인자 (JSON으로 저장 가능해야 함)
+            kwargs: 키워드 인자
+            countdown: 실행까지 기다릴 시간 (초)
+            idempotency_key: 같은 키의 작업이 대기/실행 중이면 다시 넣지 않음
+
+        Returns:
+            str: 작업 ID (멱등 키로 걸러졌으면 None)
+        """
+        redis = get_redis()
+        job_id = uuid.uuid4().hex
+        if idempotency_key is not None:
+            # 작업 내용이 사라져도 키를 해제할 수 있도록 ID에 멱등 키를 포함
+            lock_key = self._idempotency_key(idempotency_key)
+            job_id = f"{job_id}:{lock_key}"
+            if not redis.set(lock_key, job_id, ex=IDEMPOTENCY_TTL, nx=True):
+                return None
+
+        job = {
+            "id": job_id,
+            "task": self.name,
+            "args": list(args),
+            "kwargs": kwargs or {},
+            "attempts": 0,
+            "idempotency_key": idempotency_key,
+        }
+        pipe = redis.pipeline()
+        pipe.hset(JOBS_KEY, job_id, json.dumps(job))
+        pipe.zadd(QUEUE_KEY, {job_id: time.time() + countdown})
+        pipe.execute()
+        return job_id
+
+
+def task(name=None, schedule=None, max_retries=DEFAULT_MAX_RETRIES, retry_backoff=None):
+    """
+    함수를 작업으로 등록하는 데코레이터.
+
+    Args:
+        name: 작업 이름 (기본값: 모듈.함수 이름)
+        schedule: 지정하면 N초마다 주기적으로 실행
+        max_retries: 예외 발생 시 다시 시도할 횟수
+        retry_backoff: 첫 재시도까지 기다릴 시간 (초, 재시도마다 2배)
+    """
+
+    def decorator(func):
+        task_name = name or f"{func.__module__}.{func.__name__}"
+        registry[task_name] = Task(
+            func,
+            task_name,
+            schedule,
+            max_retries,
+            DEFAULT_RETRY_BACKOFF if retry_backoff is None else retry_backoff,
+        )
+        return registry[task_name]
+
+    return decorator
+
+
+def schedule_periodic():
+    """
+    주기가 돌아온 작업을 대기열에 넣습니다.
+    주기 동안 유지되는 표시 키를 먼저 잡은 워커 하나만 넣으므로 워커가 여러 개여도
+    주기마다 한 번만 실행됩니다.
+
+    Returns:
+        int: 대기열에 넣은 작업 수
+    """
+    redis = get_redis()
+    scheduled = 0
+    for periodic in registry.values():
+        if not periodic.schedule:
+            continue
+        marker = f"{settings.CACHE_KEY_PREFIX}:tasks:schedule:{periodic.name}"
+        if redis.set(marker, 1, ex=periodic.schedule, nx=True):
+            job_id = periodic.apply_async(idempotency_key="periodic")
+            scheduled += job_id is not None
+    return scheduled
+
+
+def requeue_expired():
+    """임대 시간이 지난 작업(중단된 워커가 가져간 작업)을 다시 대기열에 넣음"""
+    redis = get_redis()
+    now = time.time()
+    expired = redis.zrangebyscore(RUNNING_KEY, "-inf", now)
+    for job_id in expired:
+        if redis.zrem(RUNNING_KEY, job_id):
+            redis.zadd(QUEUE_KEY, {job_id: now})
+    return len(expired)
+
+
+def run_pending(limit=RUN_BATCH_SIZE):
+    """
+    실행 시각이 된 작업을 가져와 실행합니다.
+
+    Args:
+        limit: 최대 작업 수
+
+    Returns:
+        int: 실행한 작업 수 (실패 포함)
+    """
+    redis = get_redis()
+    now = time.time()
+    executed = 0
+    for job_id in redis.zrangebyscore(QUEUE_KEY, "-inf", now, start=0, num=limit):
+        # 대기열에서 먼저 지운 워커만 실행
+        if not redis.zrem(QUEUE_KEY, job_id):
+            continue
+        redis.zadd(RUNNING_KEY, {job_id: time.time() + JOB_LEASE_SECONDS})
+        # 요청 처리와 같이 작업 전후로 끊기거나 수명이 지난 DB 연결을 정리
+        _close_old_connections()
+        try:
+            _execute(redis, _decode(job_id))
+        finally:
+            _close_old_connections()
+        executed += 1
+    return executed
+
+
+def _close_old_connections():
+    # 트랜잭션 안에서 호출된 경우(테스트 등)에는 연결을 닫지 않음
+    if not any(conn.in_atomic_block for conn in connections.all(initialized_only=True)):
+        close_old_connections()
+
+
+def _execute(redis, job_id):
+    payload = redis.hget(JOBS_KEY, job_id)
+    if payload is None:
+        # 다른 워커가 이미 끝냈거나 내용이 유실된 작업
+        redis.zrem(RUNNING_KEY, job_id)
+        _release_idempotency_key(redis, job_id)
+        return
+
+    job = json.loads(payload)
+    task = registry.get(job["task"])
+    if task is None:
+        logger.error("Unknown task %s (job %s)", job["task"], job_id)
+        _finish(redis, job, None, "failed")
+        return
+
+    try:
+        task(*job["args"], **job["kwargs"])
+    except Exception:
+        job["attempts"] += 1
+        if job["attempts"] > task.max_retries:
+            logger.exception("Task %s failed (job %s)", task.name, job_id)
+            _finish(redis, job, task, "failed")
+            return
+
+        logger.warning(
+            "Task %s failed, retry %d/%d", task.name, job["attempts"], task.max_retries
+        )
+        eta = time.time() + task.retry_backoff * 2 ** (job["attempts"] - 1)
+        pipe = redis.pipeline()
+        pipe.hset(JOBS_KEY, job_id, json.dumps(job))
+        pipe.zrem(RUNNING_KEY, job_id)
+        pipe.zadd(QUEUE_KEY, {job_id: eta})
+        pipe.hincrby(STATS_KEY, f"{task.name}:retried", 1)
+        pipe.execute()
+        return
+
+    _finish(redis, job, task, "succeeded")
+
+
+def _finish(redis, job, task, result):
+    pipe = redis.pipeline()
+    pipe.hdel(JOBS_KEY, job["id"])
+    pipe.zrem(RUNNING_KEY, job["id"])
+    if task is not None:
+        pipe.hincrby(STATS_KEY, f"{task.name}:{result}", 1)
+    pipe.execute()
+    _release_idempotency_key(redis, job["id"])
+
+
+def _release_idempotency_key(redis, job_id):
+    """작업이 잡고 있는 멱등 키를 해제 (같은 키로 새로 들어온 작업의 키는 그대로 둠)"""
+    _, _, lock_key = job_id.partition(":")
+    if lock_key and _decode(redis.get(lock_key)) == job_id:
+        redis.delete(lock_key)
+
+
+def get_stats():
+    """
+    작업 이름별 실행 결과 횟수를 반환합니다.
+
+    Returns:
+        dict: {작업 이름: {succeeded/retried/failed: 횟수}}
+    """
+    stats = {}
+    for field, count in get_redis().hgetall(STATS_KEY).items():
+        name, result = _decode(field).rsplit(":", 1)
+        stats.setdefault(name, {})[result] = int(count)
+    return stats
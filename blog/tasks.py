@@ -1,5 +1,35 @@
-@shared_task
+from .models import Blog
+from .services.image_service import ImageVariantService
+from .services.leaderboard_service import BloggerLeaderboardService
+from .services.read_service import ReadService
+from .services.tag_index_service import TagIndexService
+from .task_queue import task
+
+
+@task(schedule=10)
+def flush_pending_views():
+    """Redis 버퍼에 누적된 조회수를 DB에 반영"""
+    return ReadService.flush_pending_views()
+
+
+@task(schedule=60 * 60)
 def update_blog_stats():
-    """모든 블로그의 통계 주기적 업데이트"""
-    for blog in Blog.objects.all():
-        blog.update_stats()
+    """블로그 집계 필드와 인기 태그 순위의 누적 오차를 주기적으로 보정"""
+    TagIndexService.rebuild_popular()
+    return Blog.objects.reconcile_stats()
+
+
+@task(schedule=60)
+def process_pending_images():
+    """업로드된 이미지의 반응형 변환본 생성"""
+    return ImageVariantService.process_pending()
+
+
+@task(schedule=5 * 60)
+def warm_caches():
+    """
+    요청 처리 중 다시 만들지 않도록 비어 있는(축출된) 순위 캐시만 미리 채움
+    (있는 순위는 이벤트와 update_blog_stats가 갱신하므로 다시 만들지 않음)
+    """
+    BloggerLeaderboardService.ensure_ready()
+    TagIndexService.ensure_popular_ready()
@@ -1,10 +1,29 @@
 from django import template
+from ..services.card_service import PostCardService
+from ..services.image_service import ImageVariantService
 
 register = template.Library()
 
 
 @register.filter
 def is_liked_by(post, user):
+    """
+    게시글 좋아요 여부 (LikeStatusMixin이 계산한 has_liked가 있으면 그대로 사용)
+    """
     if not user.is_authenticated:
         return False
-    return post in user.liked_posts.all()
+    if hasattr(post, "has_liked"):
+        return post.has_liked
+    return post.liked_by.filter(id=user.id).exists()
+
+
+@register.filter
+def webp_variant(url):
+    """썸네일 변환본의 WebP URL (변환본이 아니면 빈 문자열)"""
+    return ImageVariantService.webp_url(url) or ""
+
+
+@register.simple_tag(takes_context=True)
+def post_cards(context, posts, variant):
+    """캐시된 게시글 카드를 한 번에 가져와 좋아요 버튼과 함께 렌더링"""
+    return PostCardService.render_cards(context["request"], posts, variant)
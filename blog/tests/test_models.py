@@ -1,11 +1,27 @@
 from django.test import TestCase
 from django.contrib.auth import get_user_model
 from django.db.utils import IntegrityError
-from blog.models import Blog, Post, PostLike, PostRead
+from blog.models import (
+    Blog,
+    Post,
+    PostLike,
+    PostRead,
+    _FirstImageParser,
+    find_first_image_src,
+)
+from html.parser import HTMLParser
+from blog.services.read_service import ReadService
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
 from taggit.models import Tag
 from django.utils import timezone
 import datetime
+from unittest.mock import patch
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from freezegun import freeze_time
+from django.core.management import call_command
+from io import StringIO
 
 User = get_user_model()
 
@@ -145,6 +161,75 @@ class BlogModelTest(TestCase):
         self.assertEqual(published_posts.count(), 1)
         self.assertEqual(draft_posts.count(), 1)
 
+    def assertStats(self, posts, views, likes):
+        self.blog.refresh_from_db()
+        self.assertEqual(
+            (self.blog.total_posts, self.blog.total_views, self.blog.total_likes),
+            (posts, views, likes),
+        )
+
+    def test_blog_stats_incremental(self):
+        """게시글 공개/비공개, 좋아요, 조회수 flush 시 블로그 집계가 갱신되는지 테스트"""
+        cache.clear()
+        other_user = User.objects.create_user(
+            username="otheruser", email="other@example.com", password="otherpass123"
+        )
+        post = Post.objects.create(
+            author=self.user,
+            blog=self.blog,
+            title="Post",
+            content="Content",
+            status="published",
+        )
+        Post.objects.create(
+            author=self.user, blog=self.blog, title="Draft", content="Content"
+        )
+        self.assertStats(1, 0, 0)
+
+        PostLike.objects.toggle(other_user, post)
+        for _ in range(3):
+            ReadService.record_read(AnonymousUser(), post)
+        ReadService.flush_pending_views()
+        self.assertStats(1, 3, 1)
+
+        # 비공개 전환 시 해당 게시글의 수치를 제외하고, 다시 공개하면 복원
+        post = Post.objects.get(id=post.id)
+        post.status = "draft"
+        post.save()
+        self.assertStats(0, 0, 0)
+        post.status = "published"
+        post.save()
+        self.assertStats(1, 3, 1)
+
+        Post.objects.get(id=post.id).delete()
+        self.assertStats(0, 0, 0)
+        cache.clear()
+
+    def test_reconcile_stats(self):
+        """어긋난 블로그 집계를 일괄 보정하는지 테스트"""
+        other_blog = User.objects.create_user(
+            username="otheruser", email="other@example.com", password="otherpass123"
+        ).blog
+        post = Post.objects.create(
+            author=self.user,
+            blog=self.blog,
+            title="Post",
+            content="Content",
+            status="published",
+        )
+        Post.objects.filter(id=post.id).update(views=7, likes=2)
+        Blog.objects.filter(id=other_blog.id).update(total_posts=5)
+
+        self.assertEqual(Blog.objects.reconcile_stats(batch_size=1), 2)
+        self.assertStats(1, 7, 2)
+        other_blog.refresh_from_db()
+        self.assertEqual(other_blog.total_posts, 0)
+
+        # 이미 맞는 블로그는 갱신하지 않음
+        out = StringIO()
+        call_command("reconcile_blog_stats", stdout=out)
+        self.assertIn("0개 블로그", out.getvalue())
+
 
 class PostModelTest(TestCase):
     def setUp(self):
@@ -189,6 +274,23 @@ class PostModelTest(TestCase):
         )
         self.assertEqual(post4.slug, "테스트-제목")
 
+    def test_post_slug_long_title(self):
+        """긴 제목이 같은 글도 번호를 붙여 계속 저장되는지 테스트"""
+        title = "Long Title " * 12
+        posts = [
+            Post.objects.create(
+                author=self.user, blog=self.blog, title=title, content="Content"
+            )
+            for _ in range(3)
+        ]
+
+        stem = posts[0].slug
+        self.assertTrue(title.lower().startswith(stem.replace("-", " ")))
+        self.assertEqual(
+            [post.slug for post in posts], [stem, f"{stem}-1", f"{stem}-2"]
+        )
+        self.assertTrue(all(len(post.slug) <= 100 for post in posts))
+
     def test_post_slug_update(self):
         """포스트 수정 시 slug 업데이트 테스트"""
         # 포스트 생성
@@ -221,6 +323,51 @@ class PostModelTest(TestCase):
         another_post.save()
         self.assertEqual(another_post.slug, "updated-title-1")
 
+    def test_post_slug_constant_queries(self):
+        """같은 제목의 글이 많아도 slug 생성 쿼리 수가 일정한지 테스트"""
+        for _ in range(5):
+            Post.objects.create(
+                author=self.user, blog=self.blog, title="TIL", content="Content"
+            )
+
+        post = Post(author=self.user, blog=self.blog, title="TIL", content="Content")
+        with CaptureQueriesContext(connection) as queries:
+            post.save()
+        slug_queries = [q for q in queries if "LIKE" in q["sql"]]
+        self.assertEqual(len(slug_queries), 1)
+        self.assertEqual(post.slug, "til-5")
+
+        # 제목이 바뀌지 않으면 slug 조회 없이 저장
+        post = Post.objects.get(id=post.id)
+        post.content = "Updated Content"
+        with CaptureQueriesContext(connection) as queries:
+            post.save()
+        self.assertFalse([q for q in queries if "LIKE" in q["sql"]])
+        self.assertFalse(
+            [
+                q
+                for q in queries
+                if q["sql"].startswith("SELECT") and "title" in q["sql"]
+            ]
+        )
+        self.assertEqual(post.slug, "til-5")
+
+    def test_post_slug_retry_on_conflict(self):
+        """동시에 같은 slug를 차지한 경우 다시 정해 저장하는지 테스트"""
+        Post.objects.create(
+            author=self.user, blog=self.blog, title="Race", content="Content"
+        )
+        post = Post(author=self.user, blog=self.blog, title="Race", content="Content")
+
+        # 다른 요청이 먼저 저장해 미리 계산한 slug가 이미 사용 중인 상황
+        with patch.object(
+            Post, "_generate_unique_slug", side_effect=["race", "race-1"]
+        ):
+            post.save()
+
+        self.assertEqual(post.slug, "race-1")
+        self.assertEqual(Post.objects.filter(title="Race").count(), 2)
+
     def test_thumbnail_extraction(self):
         """HTML content에서 썸네일 추출 테스트"""
         # 이미지가 있는 content로 포스트 생성
@@ -255,6 +402,127 @@ class PostModelTest(TestCase):
         post_with_image.save()
         self.assertIsNone(post_with_image.thumbnail)
 
+    def test_thumbnail_scan_stops_at_first_image(self):
+        """첫 번째 이미지를 찾으면 나머지 content를 파싱하지 않는지 테스트"""
+        content = '<p>Intro</p><img src="/first.jpg"/>' + "<p>text</p>" * 10000
+        content += '<img src="/second.jpg">'
+
+        with patch.object(
+            _FirstImageParser, "feed", autospec=True, side_effect=HTMLParser.feed
+        ) as feed:
+            self.assertEqual(find_first_image_src(content), "/first.jpg")
+        self.assertEqual(feed.call_count, 1)
+
+        self.assertEqual(
+            find_first_image_src('<p>a &amp; b</p><img src="/a.jpg?x=1&amp;y=2">'),
+            "/a.jpg?x=1&y=2",
+        )
+        self.assertIsNone(find_first_image_src('<img alt="no src"><img src="/b.jpg">'))
+
+    def test_save_skips_thumbnail_when_content_unchanged(self):
+        """content가 바뀌지 않은 저장에서는 썸네일/메타데이터를 다시 계산하지 않는지 테스트"""
+        post = Post.objects.create(
+            author=self.user,
+            blog=self.blog,
+            title="Post",
+            content='<img src="https://example.com/image.jpg"><p>Text</p>',
+        )
+
+        post = Post.objects.get(id=post.id)
+        post.status = "published"
+        with patch.object(Post, "_extract_thumbnail") as extract:
+            post.save()
+        extract.assert_not_called()
+
+        # content를 불러오지 않은 경우 content 조회 없이 저장
+        post = Post.objects.defer("content").get(id=post.id)
+        post.status = "draft"
+        with patch.object(Post, "_extract_thumbnail") as extract:
+            with CaptureQueriesContext(connection) as queries:
+                post.save()
+        extract.assert_not_called()
+        self.assertFalse([q for q in queries if '"content"' in q["sql"]])
+
+        post.refresh_from_db()
+        self.assertEqual(post.thumbnail, "https://example.com/image.jpg")
+        self.assertEqual(post.excerpt, "Text")
+
+    def test_card_metadata(self):
+        """저장 시 미리보기, 단어 수, 읽는 시간이 계산되는지 테스트"""
+        words = " ".join(f"word{i}" for i in range(450))
+        post = Post.objects.create(
+            author=self.user,
+            blog=self.blog,
+            title="Long Post",
+            content=f"<p>Tom &amp; Jerry</p><pre><code>{words}</code></pre>",
+        )
+        self.assertEqual(post.word_count, 453)
+        self.assertEqual(post.reading_time, 3)
+        self.assertTrue(post.excerpt.startswith("Tom & Jerry word0"))
+        self.assertTrue(post.excerpt.endswith("…"))
+        self.assertEqual(len(post.excerpt.split()), 30)
+
+        # content 수정 시 다시 계산
+        post.content = "<p>Short</p>"
+        post.save()
+        self.assertEqual(post.excerpt, "Short")
+        self.assertEqual(post.word_count, 1)
+        self.assertEqual(post.reading_time, 1)
+
+    def test_backfill_post_metadata_command(self):
+        """backfill_post_metadata 명령어가 기존 게시글을 갱신하는지 테스트"""
+        post = Post.objects.create(
+            author=self.user,
+            blog=self.blog,
+            title="Old Post",
+            content="<p>Old content here</p>",
+        )
+        Post.objects.filter(id=post.id).update(excerpt="", word_count=0)
+
+        call_command("backfill_post_metadata", batch_size=1, stdout=StringIO())
+
+        post.refresh_from_db()
+        self.assertEqual(post.excerpt, "Old content here")
+        self.assertEqual(post.word_count, 3)
+
+    def test_search_falls_back_to_icontains(self):
+        """PostgreSQL이 아닌 DB에서는 icontains 검색을 최신순으로 사용하는지 테스트"""
+        with freeze_time("2024-03-14 12:00:00"):
+            older = Post.objects.create(
+                author=self.user,
+                blog=self.blog,
+                title="Django tips",
+                content="<p>Old</p>",
+                status="published",
+            )
+        newer = Post.objects.create(
+            author=self.user,
+            blog=self.blog,
+            title="Another",
+            content="<p>More about django</p>",
+            status="published",
+        )
+        Post.objects.create(
+            author=self.user,
+            blog=self.blog,
+            title="Draft django",
+            content="<p>Draft</p>",
+        )
+
+        self.assertEqual(list(Post.objects.search("django")), [newer, older])
+
+    def test_rebuild_search_vectors_command_requires_postgres(self):
+        """PostgreSQL이 아니면 rebuild_search_vectors가 아무것도 하지 않는지 테스트"""
+        post = Post.objects.create(
+            author=self.user, blog=self.blog, title="Test Post", content="Content"
+        )
+        out = StringIO()
+        call_command("rebuild_search_vectors", stdout=out)
+
+        self.assertIn("PostgreSQL", out.getvalue())
+        post.refresh_from_db()
+        self.assertIsNone(post.search_vector)
+
     def test_post_basic_fields(self):
         """Post 기본 필드 및 관계 테스트"""
         # 기본 포스트 생성
@@ -378,6 +646,32 @@ class PostLikeModelTest(TestCase):
         with self.assertRaises(IntegrityError):
             PostLike.objects.create(user=self.user, post=self.post)
 
+    def test_post_like_toggle(self):
+        """PostLikeManager.toggle이 좋아요 행과 좋아요 수를 함께 갱신하는지 테스트"""
+        has_liked, likes_count = PostLike.objects.toggle(self.other_user, self.post)
+        self.assertTrue(has_liked)
+        self.assertEqual(likes_count, 1)
+        self.assertTrue(
+            PostLike.objects.filter(user=self.other_user, post=self.post).exists()
+        )
+
+        has_liked, likes_count = PostLike.objects.toggle(self.other_user, self.post)
+        self.assertFalse(has_liked)
+        self.assertEqual(likes_count, 0)
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.likes, 0)
+
+    def test_increment_decrement_likes(self):
+        """좋아요 수 증가/감소 테스트 (0 미만으로 내려가지 않음)"""
+        self.assertEqual(self.post.increment_likes(), 1)
+        self.assertEqual(self.post.increment_likes(), 2)
+        self.assertEqual(self.post.decrement_likes(), 1)
+        self.assertEqual(self.post.decrement_likes(), 0)
+        self.assertEqual(self.post.decrement_likes(), 0)
+
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.likes, 0)
+
     def test_post_like_cascade_delete(self):
         """연관 객체 삭제 시 좋아요 삭제 테스트"""
         like = PostLike.objects.create(user=self.user, post=self.post)
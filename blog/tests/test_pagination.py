@@ -0,0 +1,60 @@
+from datetime import timedelta
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.utils import timezone
+from blog.models import Post
+from blog.pagination import CursorPaginator
+
+User = get_user_model()
+
+
+class CursorPaginatorTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="testpass123"
+        )
+
+    def create_posts(self, prefix, count):
+        """같은 밀리초 안에서 마이크로초만 다른 시각의 게시글 생성"""
+        base = timezone.now().replace(microsecond=0)
+        posts = []
+        for i in range(count):
+            post = Post.objects.create(
+                blog=self.user.blog,
+                author=self.user,
+                title=f"{prefix}{i}",
+                content="content",
+                status="published",
+            )
+            Post.objects.filter(pk=post.pk).update(
+                created_at=base + timedelta(microseconds=i)
+            )
+            posts.append(post)
+        return posts
+
+    def titles(self, page):
+        return [post.title for post in page]
+
+    def test_same_millisecond_walk(self):
+        """같은 밀리초에 작성된 게시글도 빠짐없이 순회하는지 테스트"""
+        self.create_posts("s", 4)
+        paginator = CursorPaginator(Post.objects.all(), 1)
+
+        page = paginator.page(None)
+        titles = self.titles(page)
+        while page.has_next():
+            page = paginator.page(page.next_cursor)
+            titles += self.titles(page)
+        self.assertEqual(titles, ["s3", "s2", "s1", "s0"])
+
+    def test_next_then_previous(self):
+        """다음 페이지에서 이전 페이지로 돌아가면 첫 페이지와 같은지 테스트"""
+        self.create_posts("t", 24)
+        paginator = CursorPaginator(Post.objects.all(), 10)
+
+        first = paginator.page(None)
+        second = paginator.page(first.next_cursor)
+        self.assertEqual(self.titles(second), [f"t{i}" for i in range(13, 3, -1)])
+        previous = paginator.page(second.previous_cursor)
+        self.assertEqual(self.titles(previous), self.titles(first))
+        self.assertEqual(self.titles(first), [f"t{i}" for i in range(23, 13, -1)])
@@ -1,11 +1,38 @@
-from django.test import TestCase
+import hashlib
+from django.test import TestCase, override_settings
 from django.contrib.auth import get_user_model
-from blog.models import Blog, Post, PostLike, PostRead
+from django.contrib.auth.models import AnonymousUser
+from blog.models import Blog, Post, PostLike, PostRead, UploadedImage
 from blog.services.like_service import LikeService
-from blog.services.read_service import ReadService
+from blog.services.read_service import (
+    FLUSH_LOCK_KEY,
+    FLUSHING_VIEWS_KEY,
+    ReadService,
+)
 from blog.services.post_service import PostService
+from blog.redis_store import CacheBackedRedis, get_redis
+from blog.services.cache_service import CacheService
+from blog.services.card_service import PostCardService
+from blog.services.image_service import ImageVariantService
+from blog.services.leaderboard_service import BloggerLeaderboardService
+from blog.services.tag_cloud_service import TagCloudService
+from blog.services.tag_index_service import TagIndexService
+from blog.services.timeline_service import TimelineService
+from blog.services.trending_service import TrendingService
 from django.core.cache import cache
 from freezegun import freeze_time
+from datetime import timedelta
+from django.utils import timezone
+from unittest.mock import patch
+from io import StringIO
+import time
+from django.core.management import call_command
+from django.test import RequestFactory
+from django.template.loader import render_to_string
+from user.models import Follow
+from blog.tests.test_views import FakeS3Client
+from PIL import Image
+import io
 
 User = get_user_model()
 
@@ -45,6 +72,38 @@ class LikeServiceTests(TestCase):
         self.assertEqual(likes_count, 0)
         self.assertFalse(self.post.liked_by.filter(id=self.other_user.id).exists())
 
+    def test_toggle_like_queries(self):
+        """좋아요 토글이 content 재조회 없이 최소 쿼리로 처리되는지 테스트"""
+        # 좋아요 추가: SAVEPOINT, DELETE, INSERT, UPDATE ... RETURNING,
+        # 블로그 집계 UPDATE, RELEASE
+        with self.assertNumQueries(6):
+            has_liked, likes_count = LikeService.toggle_like(self.other_user, self.post)
+        self.assertTrue(has_liked)
+        self.assertEqual(likes_count, 1)
+        self.assertEqual(self.post.likes, 1)
+
+        # 좋아요 취소: SAVEPOINT, DELETE, UPDATE ... RETURNING, 블로그 집계 UPDATE, RELEASE
+        with self.assertNumQueries(5):
+            has_liked, likes_count = LikeService.toggle_like(self.other_user, self.post)
+        self.assertFalse(has_liked)
+        self.assertEqual(likes_count, 0)
+
+    def test_toggle_like_keeps_count_consistent(self):
+        """좋아요 수가 실제 좋아요 행 수와 일치하는지 테스트"""
+        users = [
+            User.objects.create_user(
+                username=f"liker{i}", email=f"liker{i}@example.com", password="pass"
+            )
+            for i in range(3)
+        ]
+        for user in users:
+            LikeService.toggle_like(user, self.post)
+        LikeService.toggle_like(users[0], self.post)
+
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.likes, 2)
+        self.assertEqual(PostLike.objects.filter(post=self.post).count(), 2)
+
     def test_get_like_status(self):
         """좋아요 상태 확인 테스트"""
         self.assertFalse(LikeService.get_like_status(self.other_user, self.post))
@@ -52,6 +111,30 @@ class LikeServiceTests(TestCase):
         self.post.liked_by.add(self.other_user)
         self.assertTrue(LikeService.get_like_status(self.other_user, self.post))
 
+    def test_annotate_like_status(self):
+        """목록 게시글의 좋아요 여부를 한 번의 쿼리로 계산하는지 테스트"""
+        other_post = Post.objects.create(
+            blog=self.blog,
+            author=self.user,
+            title="Other Post",
+            content="Other Content",
+            status="published",
+        )
+        self.post.liked_by.add(self.other_user)
+
+        posts = list(Post.objects.filter(id__in=[self.post.id, other_post.id]))
+        with self.assertNumQueries(1):
+            posts = LikeService.annotate_like_status(self.other_user, posts)
+        liked = {post.id: post.has_liked for post in posts}
+        self.assertTrue(liked[self.post.id])
+        self.assertFalse(liked[other_post.id])
+
+        # 비로그인 사용자는 쿼리 없이 모두 False
+        posts = list(Post.objects.all())
+        with self.assertNumQueries(0):
+            posts = LikeService.annotate_like_status(AnonymousUser(), posts)
+        self.assertFalse(any(post.has_liked for post in posts))
+
     def test_get_likes_count(self):
         """좋아요 수 조회 테스트"""
         self.assertEqual(LikeService.get_likes_count(self.post), 0)
@@ -89,11 +172,87 @@ class ReadServiceTests(TestCase):
         self.assertTrue(
             PostRead.objects.filter(user=self.other_user, post=self.post).exists()
         )
-        self.assertEqual(self.post.views, 1)
+        self.assertEqual(ReadService.get_views_count(self.post), 1)
 
         # 작성자가 조회 (조회수 증가하지 않음)
         ReadService.record_read(self.user, self.post)
-        self.assertEqual(self.post.views, 1)
+        self.assertEqual(ReadService.get_views_count(self.post), 1)
+
+    def test_record_read_does_not_touch_post_row(self):
+        """조회 기록 시 Post 행을 갱신하지 않고 버퍼에만 누적하는지 테스트"""
+        ReadService.record_read(self.other_user, self.post)
+        ReadService.record_read(AnonymousUser(), self.post)
+
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.views, 0)
+        self.assertEqual(ReadService.get_pending_views(self.post.id), 2)
+        self.assertEqual(ReadService.get_views_count(self.post), 2)
+
+    def test_flush_pending_views(self):
+        """버퍼에 누적된 조회수를 일괄 반영하는지 테스트"""
+        other_post = Post.objects.create(
+            blog=self.blog,
+            author=self.user,
+            title="Other Post",
+            content="Other Content",
+            status="published",
+        )
+        for _ in range(3):
+            ReadService.record_read(AnonymousUser(), self.post)
+        ReadService.record_read(AnonymousUser(), other_post)
+
+        self.assertEqual(ReadService.flush_pending_views(), 2)
+
+        self.post.refresh_from_db()
+        other_post.refresh_from_db()
+        self.assertEqual(self.post.views, 3)
+        self.assertEqual(other_post.views, 1)
+        self.assertEqual(ReadService.get_pending_views(self.post.id), 0)
+        self.assertEqual(ReadService.get_views_count(self.post), 3)
+
+        # 버퍼가 비어 있으면 아무것도 하지 않음
+        self.assertEqual(ReadService.flush_pending_views(), 0)
+
+    def test_flush_replay_is_idempotent(self):
+        """커밋 후 Redis 정리 전에 중단되어도 다시 반영하지 않는지 테스트"""
+        for _ in range(3):
+            ReadService.record_read(AnonymousUser(), self.post)
+
+        delete = CacheBackedRedis.delete
+
+        def crash(redis, *keys):
+            if FLUSHING_VIEWS_KEY in keys:
+                raise ConnectionError("redis went away")
+            return delete(redis, *keys)
+
+        with patch.object(CacheBackedRedis, "delete", crash):
+            with self.assertRaises(ConnectionError):
+                ReadService.flush_pending_views()
+
+        # 커밋된 배치는 정리 전에도 버퍼 조회수에 다시 더하지 않음
+        self.post.refresh_from_db()
+        self.assertEqual(ReadService.get_views_count(self.post), 3)
+
+        ReadService.record_read(AnonymousUser(), self.post)
+        self.assertEqual(ReadService.flush_pending_views(), 0)  # 중단된 배치 정리
+        self.assertEqual(ReadService.flush_pending_views(), 1)
+
+        self.post.refresh_from_db()
+        self.blog.refresh_from_db()
+        self.assertEqual(self.post.views, 4)
+        self.assertEqual(self.blog.total_views, 4)
+        self.assertEqual(ReadService.get_views_count(self.post), 4)
+
+    def test_flush_keeps_lock_taken_by_another_worker(self):
+        """잠금이 만료되어 다른 워커가 잡았으면 그 잠금을 지우지 않는지 테스트"""
+        ReadService.record_read(AnonymousUser(), self.post)
+
+        def expire_lock(post_ids):
+            get_redis().set(FLUSH_LOCK_KEY, "other-worker")
+
+        with patch.object(TrendingService, "refresh_posts", side_effect=expire_lock):
+            self.assertEqual(ReadService.flush_pending_views(), 1)
+        self.assertEqual(get_redis().get(FLUSH_LOCK_KEY), b"other-worker")
 
     def test_get_views_count(self):
         """조회수 확인 테스트"""
@@ -192,3 +351,974 @@ class PostServiceTests(TestCase):
         self.assertEqual(updated_post.content, "Updated Content")
         self.assertEqual(updated_post.status, "draft")
         self.assertEqual(list(updated_post.tags.names()), ["tag3"])
+
+
+class TrendingServiceTests(TestCase):
+    @freeze_time("2024-03-15 12:00:00")
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="testpass123"
+        )
+        self.other_user = User.objects.create_user(
+            username="otheruser", email="other@example.com", password="otherpass123"
+        )
+        self.blog = self.user.blog
+        self.post = Post.objects.create(
+            blog=self.blog,
+            author=self.user,
+            title="Test Post",
+            content="Test Content",
+            status="published",
+        )
+        self.other_post = Post.objects.create(
+            blog=self.blog,
+            author=self.user,
+            title="Other Post",
+            content="Other Content",
+            status="published",
+        )
+
+    def tearDown(self):
+        cache.clear()
+
+    @freeze_time("2024-03-15 12:00:00")
+    def test_like_updates_ranking(self):
+        """좋아요가 반영되어 순위가 바뀌는지 테스트"""
+        LikeService.toggle_like(self.other_user, self.post)
+
+        posts = TrendingService.get_posts("day", 0, 10)
+        self.assertEqual(posts, [self.post, self.other_post])
+
+    @freeze_time("2024-03-15 12:00:00")
+    def test_flush_updates_ranking(self):
+        """조회수 flush 후 점수가 갱신되는지 테스트"""
+        for _ in range(5):
+            ReadService.record_read(AnonymousUser(), self.post)
+        ReadService.flush_pending_views()
+
+        posts = TrendingService.get_posts("day", 0, 10)
+        self.assertEqual(posts[0], self.post)
+
+    @freeze_time("2024-03-15 12:00:00")
+    def test_period_window(self):
+        """기간을 벗어난 게시글이 제외되는지 테스트"""
+        with freeze_time(timezone.now() - timedelta(days=3)):
+            old_post = Post.objects.create(
+                blog=self.blog,
+                author=self.user,
+                title="Old Post",
+                content="Old Content",
+                status="published",
+            )
+
+        self.assertEqual(TrendingService.count("day"), 2)
+        self.assertEqual(TrendingService.count("week"), 3)
+
+        # 하루가 지나면 일간 집합에서 정리됨
+        with freeze_time(timezone.now() + timedelta(days=2)):
+            self.assertEqual(TrendingService.count("day"), 0)
+            self.assertIn(old_post, TrendingService.get_posts("week", 0, 10))
+
+    @freeze_time("2024-03-15 12:00:00")
+    def test_unpublished_and_deleted_posts_removed(self):
+        """비공개 전환/삭제된 게시글이 집합에서 제거되는지 테스트"""
+        self.post.status = "draft"
+        self.post.save()
+        self.other_post.delete()
+
+        self.assertEqual(TrendingService.count("day"), 0)
+
+    @freeze_time("2024-03-15 12:00:00")
+    def test_rebuild(self):
+        """DB 기준으로 집합을 다시 만드는지 테스트"""
+        self.assertEqual(TrendingService.rebuild(), 2)
+        self.assertEqual(TrendingService.count("day"), 2)
+        self.assertEqual(TrendingService.get_posts("day", 0, 10)[-1:], [self.post])
+
+    @freeze_time("2024-03-15 12:00:00")
+    def test_rebuild_on_read_when_evicted(self):
+        """집합이 축출되었으면 읽을 때 다시 만드는지 테스트"""
+        TrendingService.rebuild()
+        cache.clear()
+        # 축출 뒤 새 이벤트로 일부만 다시 채워진 경우도 불완전한 집합으로 봄
+        TrendingService.update_post(self.post)
+
+        page = TrendingService.get_paginator("week", 10).page(None)
+        self.assertCountEqual(page.object_list, [self.post, self.other_post])
+        self.assertIsNone(page.next_cursor)
+        self.assertEqual(TrendingService.count("year"), 2)
+
+    @freeze_time("2024-03-15 12:00:00")
+    def test_decay_scales_with_period(self):
+        """긴 기간일수록 작성 시각보다 참여도의 비중이 커지는지 테스트"""
+        with freeze_time(timezone.now() - timedelta(hours=20)):
+            old_post = Post.objects.create(
+                blog=self.blog,
+                author=self.user,
+                title="Old Post",
+                content="Old Content",
+                status="published",
+            )
+        Post.objects.filter(id=old_post.id).update(likes=10)
+        TrendingService.refresh_posts([old_post.id])
+
+        self.assertNotEqual(TrendingService.get_posts("day", 0, 1), [old_post])
+        self.assertEqual(TrendingService.get_posts("week", 0, 1), [old_post])
+
+
+class TimelineServiceTests(TestCase):
+    @freeze_time("2024-03-15 12:00:00")
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="testpass123"
+        )
+        self.author = User.objects.create_user(
+            username="author", email="author@example.com", password="authorpass123"
+        )
+        self.other_author = User.objects.create_user(
+            username="otherauthor", email="other@example.com", password="otherpass123"
+        )
+        self.old_post = self.create_post(self.author, "Old Post")
+
+    def tearDown(self):
+        cache.clear()
+
+    def create_post(self, author, title, status="published"):
+        return Post.objects.create(
+            blog=author.blog,
+            author=author,
+            title=title,
+            content=f"{title} Content",
+            status=status,
+        )
+
+    def get_timeline(self, token=None, per_page=10):
+        return TimelineService.get_paginator(self.user, per_page).page(token)
+
+    @freeze_time("2024-03-15 12:00:00")
+    def test_follow_and_publish_fan_out(self):
+        """팔로우 시 기존 글이 채워지고 새 글이 fan-out 되는지 테스트"""
+        Follow.objects.create(follower=self.user, following=self.author)
+        self.assertEqual(list(self.get_timeline()), [self.old_post])
+
+        with freeze_time("2024-03-15 13:00:00"):
+            new_post = self.create_post(self.author, "New Post")
+        self.create_post(self.other_author, "Not Followed")
+        self.create_post(self.author, "Draft", status="draft")
+
+        self.assertEqual(list(self.get_timeline()), [new_post, self.old_post])
+
+    @freeze_time("2024-03-15 12:00:00")
+    def test_unfollow_and_unpublish_remove_posts(self):
+        """언팔로우/비공개 전환 시 타임라인에서 제거되는지 테스트"""
+        follow = Follow.objects.create(follower=self.user, following=self.author)
+        Follow.objects.create(follower=self.user, following=self.other_author)
+        other_post = self.create_post(self.other_author, "Other Post")
+        self.get_timeline()
+
+        self.old_post.status = "draft"
+        self.old_post.save()
+        self.assertEqual(list(self.get_timeline()), [other_post])
+
+        follow.delete()
+        self.old_post.status = "published"
+        self.old_post.save()
+        self.assertEqual(list(self.get_timeline()), [other_post])
+
+    def test_draft_saves_skip_fan_out(self):
+        """임시저장 글의 저장은 팔로워 타임라인을 건드리지 않는지 테스트"""
+        Follow.objects.create(follower=self.user, following=self.author)
+        with patch.object(TimelineService, "fan_out") as fan_out:
+            draft = self.create_post(self.author, "Draft", status="draft")
+            draft.content = "autosave"
+            draft.save()
+            fan_out.assert_not_called()
+
+            draft.status = "published"
+            draft.save()
+            draft.status = "draft"
+            draft.save()
+        self.assertEqual(fan_out.call_count, 2)
+
+    def test_draft_saves_keep_page_cache(self):
+        """임시저장 글의 저장은 공개 목록 페이지 캐시를 비우지 않는지 테스트"""
+        with patch("blog.signals.PageCacheService.purge") as purge:
+            draft = self.create_post(self.author, "Draft", status="draft")
+            draft.content = "autosave"
+            draft.save()
+            purge.assert_not_called()
+
+            draft.status = "published"
+            draft.save()
+            self.assertTrue(purge.called)
+
+            purge.reset_mock()
+            draft.status = "draft"
+            draft.save()
+            self.assertTrue(purge.called)
+
+    @freeze_time("2024-03-15 12:00:00")
+    def test_rebuild_when_timeline_missing(self):
+        """Redis가 비워져도 DB 기준으로 타임라인을 다시 만드는지 테스트"""
+        Follow.objects.create(follower=self.user, following=self.author)
+        cache.clear()
+
+        self.assertEqual(list(self.get_timeline()), [self.old_post])
+
+    @freeze_time("2024-03-15 12:00:00")
+    def test_rebuild_when_timeline_evicted(self):
+        """타임라인 집합만 축출된 뒤 fan-out으로 일부만 채워져도 다시 만드는지 테스트"""
+        Follow.objects.create(follower=self.user, following=self.author)
+        self.get_timeline()
+
+        get_redis().delete(TimelineService._key(self.user.id))
+        with freeze_time("2024-03-15 13:00:00"):
+            new_post = self.create_post(self.author, "New Post")
+
+        self.assertEqual(list(self.get_timeline()), [new_post, self.old_post])
+
+    @freeze_time("2024-03-15 12:00:00")
+    def test_pagination_past_timeline_size(self):
+        """보관 한도를 넘어 잘린 오래된 게시글을 DB에서 이어 읽는지 테스트"""
+        Follow.objects.create(follower=self.user, following=self.author)
+        for i in range(6):
+            with freeze_time(timezone.now() + timedelta(minutes=i + 1)):
+                self.create_post(self.author, f"Post {i}")
+
+        expected = list(
+            Post.objects.order_by("-updated_at", "-id").values_list("id", flat=True)
+        )
+        with patch("blog.services.timeline_service.TIMELINE_SIZE", 3):
+            TimelineService.rebuild(self.user.id)
+            pages, token = [], None
+            while True:
+                page = self.get_timeline(token, per_page=2)
+                pages.append([post.id for post in page])
+                if not page.has_next():
+                    break
+                token = page.next_cursor
+
+            self.assertEqual([pk for page in pages for pk in page], expected)
+
+            # DB에서 읽은 페이지에서 이전 페이지로 돌아가기
+            previous = self.get_timeline(page.previous_cursor, per_page=2)
+            self.assertEqual([post.id for post in previous], pages[-2])
+
+    @freeze_time("2024-03-15 12:00:00")
+    def test_high_follower_author_is_pulled(self):
+        """팔로워가 많은 작성자의 글은 fan-out 없이 읽을 때 병합되는지 테스트"""
+        Follow.objects.create(follower=self.user, following=self.author)
+        Follow.objects.create(follower=self.user, following=self.other_author)
+        self.get_timeline()
+
+        with patch("blog.services.timeline_service.FANOUT_FOLLOWER_LIMIT", 0):
+            with freeze_time("2024-03-15 13:00:00"):
+                pulled = self.create_post(self.other_author, "Pulled Post")
+
+        self.assertIsNone(
+            get_redis().zscore(
+                TimelineService._key(self.user.id), TimelineService._member(pulled.id)
+            )
+        )
+        self.assertEqual(list(self.get_timeline()), [pulled, self.old_post])
+
+    @freeze_time("2024-03-15 12:00:00")
+    def test_cursor_pagination(self):
+        """같은 시각의 fan-out/pull 게시글을 커서로 중복 없이 순회하는지 테스트"""
+        Follow.objects.create(follower=self.user, following=self.author)
+        Follow.objects.create(follower=self.user, following=self.other_author)
+        for i in range(4):
+            self.create_post(self.author, f"Pushed {i}")
+        with patch("blog.services.timeline_service.FANOUT_FOLLOWER_LIMIT", 0):
+            for i in range(4):
+                self.create_post(self.other_author, f"Pulled {i}")
+
+        expected = list(
+            Post.objects.filter(status="published")
+            .order_by("-updated_at", "-id")
+            .values_list("id", flat=True)
+        )
+        pages, token = [], None
+        while True:
+            page = self.get_timeline(token, per_page=3)
+            pages.append([post.id for post in page])
+            if not page.has_next():
+                break
+            token = page.next_cursor
+
+        self.assertEqual([pk for page in pages for pk in page], expected)
+
+        # 이전 페이지로 돌아가기
+        previous = self.get_timeline(page.previous_cursor, per_page=3)
+        self.assertEqual([post.id for post in previous], pages[-2])
+
+
+class PostCardServiceTests(TestCase):
+    @freeze_time("2024-03-15 12:00:00")
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="testpass123"
+        )
+        self.other_user = User.objects.create_user(
+            username="otheruser", email="other@example.com", password="otherpass123"
+        )
+        self.post = Post.objects.create(
+            blog=self.user.blog,
+            author=self.user,
+            title="Test Post",
+            content="Test Content",
+            status="published",
+        )
+        self.post.tags.add("python")
+
+    def tearDown(self):
+        cache.clear()
+
+    def get_posts(self, user):
+        posts = Post.objects.published().filter(id=self.post.id)
+        return LikeService.annotate_like_status(user, posts)
+
+    def render(self, user, variant="discovery"):
+        request = RequestFactory().get("/")
+        request.user = user
+        with patch(
+            "blog.services.card_service.render_to_string", wraps=render_to_string
+        ) as render:
+            html = PostCardService.render_cards(request, self.get_posts(user), variant)
+        card_renders = [
+            call for call in render.call_args_list if "post_card" in call.args[0]
+        ]
+        return html, len(card_renders)
+
+    def test_cached_card_reused(self):
+        """두 번째 렌더링부터 카드 템플릿을 다시 렌더링하지 않는지 테스트"""
+        html, renders = self.render(self.user)
+        self.assertEqual(renders, 1)
+        self.assertIn("Test Post", html)
+        self.assertIn("#python", html)
+
+        html, renders = self.render(self.user)
+        self.assertEqual(renders, 0)
+        self.assertIn("Test Post", html)
+
+        # 목록 종류가 다르면 별도로 캐시
+        self.assertEqual(self.render(self.user, variant="blog")[1], 1)
+
+    def test_like_button_is_viewer_specific(self):
+        """캐시된 카드에 사용자별 좋아요 상태가 따로 들어가는지 테스트"""
+        PostLike.objects.toggle(self.other_user, self.post)
+        self.render(self.user)
+
+        html, renders = self.render(self.other_user)
+        self.assertEqual(renders, 0)
+        self.assertIn('aria-label="좋아요 취소"', html)
+
+        html, _ = self.render(self.user)
+        self.assertIn('aria-label="좋아요"', html)
+
+    def test_version_changes(self):
+        """수정, 태그 변경 시 카드 버전이 바뀌는지 테스트"""
+        versions = [PostCardService.get_version(self.get_posts(self.user)[0])]
+
+        with freeze_time("2024-03-15 13:00:00"):
+            self.post.title = "Edited"
+            self.post.save()
+        versions.append(PostCardService.get_version(self.get_posts(self.user)[0]))
+
+        self.post.tags.add("django")
+        versions.append(PostCardService.get_version(self.get_posts(self.user)[0]))
+
+        self.assertEqual(len(set(versions)), 3)
+        html, renders = self.render(self.user)
+        self.assertEqual(renders, 1)
+        self.assertIn("Edited", html)
+
+    def test_stats_not_cached(self):
+        """조회수/좋아요 반영은 카드 캐시를 바꾸지 않고 최신 값으로 보이는지 테스트"""
+        self.render(self.user)
+        version = PostCardService.get_version(self.get_posts(self.user)[0])
+
+        ReadService.record_read(AnonymousUser(), self.post)
+        ReadService.flush_pending_views()
+        PostLike.objects.toggle(self.other_user, self.post)
+
+        self.assertEqual(
+            PostCardService.get_version(self.get_posts(self.user)[0]), version
+        )
+        html, renders = self.render(self.user)
+        self.assertEqual(renders, 0)
+        self.assertIn("조회수 1", html)
+        self.assertIn("좋아요 1", html)
+
+
+class TagCloudServiceTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="testpass123"
+        )
+        self.blog = self.user.blog
+        self.post = Post.objects.create(
+            blog=self.blog,
+            author=self.user,
+            title="Test Post",
+            content="Test Content",
+            status="published",
+        )
+        self.post.tags.add("python", "django")
+
+    def tearDown(self):
+        cache.clear()
+
+    def get_counts(self):
+        return {
+            tag["name"]: tag["posts_count"]
+            for tag in TagCloudService.get_tags(self.blog.id)
+        }
+
+    def assertMatchesDatabase(self):
+        expected = {
+            tag.name: tag.posts_count for tag in self.blog.get_tags_with_count()
+        }
+        self.assertEqual(self.get_counts(), expected)
+
+    def test_get_tags_single_read(self):
+        """처음 읽을 때 DB에서 만들고 이후에는 쿼리 없이 읽는지 테스트"""
+        self.assertEqual(self.get_counts(), {"python": 1, "django": 1})
+        with self.assertNumQueries(0):
+            tags = TagCloudService.get_tags(self.blog.id)
+        self.assertEqual([tag["name"] for tag in tags], ["django", "python"])
+
+    def test_incremental_updates(self):
+        """태그 변경, 공개 상태 변경, 삭제가 증감으로 반영되는지 테스트"""
+        self.get_counts()
+
+        other = Post.objects.create(
+            blog=self.blog,
+            author=self.user,
+            title="Other Post",
+            content="Other Content",
+            status="published",
+        )
+        other.tags.add("python")
+        self.assertEqual(self.get_counts(), {"python": 2, "django": 1})
+
+        # 비공개 전환 후 태그를 바꿔도 집계되지 않음
+        other.status = "draft"
+        other.save()
+        other.tags.add("draft-only")
+        self.assertEqual(self.get_counts(), {"python": 1, "django": 1})
+
+        # 다시 공개하면 현재 태그 전체가 반영
+        other.status = "published"
+        other.save()
+        self.assertMatchesDatabase()
+
+        self.post.tags.remove("django")
+        other.tags.clear()
+        self.assertMatchesDatabase()
+
+        self.post.delete()
+        self.assertEqual(self.get_counts(), {})
+        self.assertMatchesDatabase()
+
+    def test_rebuild_all(self):
+        """전체 재생성 명령이 어긋난 집계를 바로잡는지 테스트"""
+        self.get_counts()
+        TagCloudService.adjust(self.blog.id, ["python", "ghost"], 5)
+        self.assertNotEqual(self.get_counts(), {"python": 1, "django": 1})
+        other_user = User.objects.create_user(
+            username="otheruser", email="other@example.com", password="otherpass123"
+        )
+
+        out = StringIO()
+        call_command("rebuild_tag_clouds", "--batch-size", "1", stdout=out)
+        self.assertIn("2개 블로그", out.getvalue())
+        self.assertEqual(self.get_counts(), {"python": 1, "django": 1})
+        self.assertEqual(TagCloudService.get_tags(other_user.blog.id), [])
+
+
+class TagIndexServiceTests(TestCase):
+    @freeze_time("2024-03-15 12:00:00")
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="testpass123"
+        )
+        self.posts = []
+        for i in range(5):
+            post = Post.objects.create(
+                blog=self.user.blog,
+                author=self.user,
+                title=f"Test Post {i}",
+                content=f"Test Content {i}",
+                status="published",
+            )
+            post.tags.add("python")
+            self.posts.append(post)
+        self.posts[0].tags.add("django")
+
+    def tearDown(self):
+        cache.clear()
+
+    def get_post_ids(self, name, per_page=2):
+        """커서를 따라 모든 페이지의 게시글 ID를 순서대로 반환"""
+        paginator = TagIndexService.get_paginator(name, per_page)
+        page = paginator.page(None)
+        post_ids = [post.id for post in page]
+        while page.has_next():
+            page = paginator.page(page.next_cursor)
+            post_ids += [post.id for post in page]
+        return post_ids
+
+    def test_posting_list_pagination(self):
+        """같은 시각에 작성된 게시글도 최신순(id 역순)으로 중복 없이 순회하는지 테스트"""
+        expected = [post.id for post in reversed(self.posts)]
+        self.assertEqual(self.get_post_ids("python"), expected)
+        self.assertEqual(TagIndexService.get_posts_count("python"), 5)
+
+        # 게시글 조회 외에 태그 조인 쿼리가 없음
+        paginator = TagIndexService.get_paginator("python", 2)
+        with self.assertNumQueries(2):  # 게시글 + 태그 prefetch
+            page = paginator.page(None)
+        self.assertEqual([post.id for post in page], expected[:2])
+
+    def test_incremental_updates(self):
+        """태그 변경, 공개 상태 변경, 삭제가 태그 목록과 인기 태그에 반영되는지 테스트"""
+        self.get_post_ids("python")
+        self.get_post_ids("django")
+
+        self.posts[1].tags.add("django")
+        self.posts[0].tags.remove("django")
+        self.assertEqual(self.get_post_ids("django"), [self.posts[1].id])
+
+        self.posts[2].status = "draft"
+        self.posts[2].save()
+        self.posts[3].delete()
+        self.assertEqual(
+            self.get_post_ids("python"),
+            [self.posts[4].id, self.posts[1].id, self.posts[0].id],
+        )
+
+        self.posts[2].status = "published"
+        self.posts[2].save()
+        self.assertEqual(TagIndexService.get_posts_count("python"), 4)
+        self.assertEqual(
+            TagIndexService.get_popular_tags(),
+            [
+                {"name": "python", "posts_count": 4},
+                {"name": "django", "posts_count": 1},
+            ],
+        )
+
+    def test_rebuild_when_evicted(self):
+        """집합만 축출된 뒤 이벤트로 일부만 채워져도 읽을 때 다시 만드는지 테스트"""
+        self.get_post_ids("python")
+        TagIndexService.get_popular_tags()
+        get_redis().delete(
+            TagIndexService._posts_key("python"), TagIndexService._popular_key()
+        )
+
+        post = Post.objects.create(
+            blog=self.user.blog,
+            author=self.user,
+            title="New Post",
+            content="New Content",
+            status="published",
+        )
+        post.tags.add("python")
+
+        self.assertEqual(TagIndexService.get_posts_count("python"), 6)
+        self.assertEqual(
+            TagIndexService.get_popular_tags(limit=1),
+            [{"name": "python", "posts_count": 6}],
+        )
+
+    def test_rebuild_all(self):
+        """전체 재생성 명령이 어긋난 목록을 바로잡는지 테스트"""
+        self.get_post_ids("python")
+        TagIndexService.adjust(self.posts[0], ["python"], -1)
+        self.assertEqual(TagIndexService.get_posts_count("python"), 4)
+
+        out = StringIO()
+        call_command("rebuild_tag_index", stdout=out)
+        self.assertIn("2개 태그", out.getvalue())
+        self.assertEqual(TagIndexService.get_posts_count("python"), 5)
+        self.assertEqual(
+            TagIndexService.get_popular_tags(limit=1),
+            [{"name": "python", "posts_count": 5}],
+        )
+
+
+class BloggerLeaderboardServiceTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.users = [
+            User.objects.create_user(
+                username=f"blogger{i}",
+                email=f"blogger{i}@example.com",
+                password="testpass123",
+            )
+            for i in range(3)
+        ]
+        self.posts = [
+            Post.objects.create(
+                blog=user.blog,
+                author=user,
+                title=f"Test Post {i}",
+                content="Test Content",
+                status="published",
+            )
+            for i, user in enumerate(self.users[:2])
+        ]
+        # 참여도: blogger0 = (10 + 2*5) / 1 = 20, blogger1 = (30 + 0) / 1 = 30
+        Blog.objects.filter(owner=self.users[0]).update(total_views=10, total_likes=5)
+        Blog.objects.filter(owner=self.users[1]).update(total_views=30)
+        Follow.objects.create(follower=self.users[2], following=self.users[0])
+
+    def tearDown(self):
+        cache.clear()
+
+    def get_usernames(self):
+        return [blog.owner.username for blog in BloggerLeaderboardService.get_top()]
+
+    def test_top_bloggers(self):
+        """참여도 순서대로 게시글이 있는 블로그만 반환하고, 순위가 있으면 쿼리 한 번으로 조회하는지 테스트"""
+        self.assertEqual(self.get_usernames(), ["blogger1", "blogger0"])
+
+        with self.assertNumQueries(1):
+            bloggers = BloggerLeaderboardService.get_top()
+            self.assertEqual(bloggers[1].owner.username, "blogger0")
+            self.assertEqual(bloggers[1].followers_count, 1)
+        self.assertEqual(bloggers[0].engagement_score, 30)
+
+    def test_incremental_updates(self):
+        """블로그 집계가 바뀌면 커밋 후 해당 블로그의 순위 점수가 갱신되는지 테스트"""
+        self.get_usernames()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            PostLike.objects.toggle(self.users[2], self.posts[0])
+            Blog.objects.adjust_views({self.users[0].blog.id: 10})
+        # blogger0 = (20 + 2*6) / 1 = 32
+        self.assertEqual(self.get_usernames(), ["blogger0", "blogger1"])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.posts[0].status = "draft"
+            self.posts[0].save()
+        self.assertEqual(self.get_usernames(), ["blogger1"])
+
+        # 삭제된 블로그는 순위에서 정리
+        self.users[1].delete()
+        self.assertEqual(self.get_usernames(), [])
+
+    def test_rebuild_when_evicted(self):
+        """순위 집합만 축출되어도 읽을 때 다시 만드는지 테스트"""
+        self.get_usernames()
+        get_redis().delete(BloggerLeaderboardService._key())
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Blog.objects.adjust_views({self.users[0].blog.id: 1})
+        self.assertEqual(self.get_usernames(), ["blogger1", "blogger0"])
+        self.assertFalse(
+            get_redis().exists(f"{BloggerLeaderboardService._key()}:rebuild")
+        )
+
+    def test_rebuild_command(self):
+        """재생성 명령이 어긋난 순위를 바로잡는지 테스트"""
+        self.get_usernames()
+        Blog.objects.filter(owner=self.users[0]).update(total_views=100)
+        self.assertEqual(self.get_usernames(), ["blogger1", "blogger0"])
+
+        out = StringIO()
+        call_command("rebuild_blogger_leaderboard", stdout=out)
+        self.assertIn("2개 블로그", out.getvalue())
+        self.assertEqual(self.get_usernames(), ["blogger0", "blogger1"])
+
+
+class CacheServiceTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        CacheService.reset_stats()
+
+    def tearDown(self):
+        cache.clear()
+
+    def test_get_or_set_counts_hits_and_misses(self):
+        """값이 없을 때만 계산하고 hit/miss/recompute 카운터가 누적되는지 테스트"""
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return 42
+
+        self.assertEqual(CacheService.get_or_set("jdl:test", compute, 60, "test"), 42)
+        self.assertEqual(CacheService.get_or_set("jdl:test", compute, 60, "test"), 42)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(
+            CacheService.get_stats()["test"], {"hit": 1, "miss": 1, "recompute": 1}
+        )
+
+    def test_legacy_entry_is_miss(self):
+        """이전 형식으로 저장된 값(정수 좋아요 수 등)은 없는 것으로 보고 다시 계산하는지 테스트"""
+        cache.set("jdl:test", 7)
+
+        self.assertEqual(CacheService.get_or_set("jdl:test", lambda: 42, 60), 42)
+        self.assertEqual(cache.get("jdl:test")["value"], 42)
+
+    def test_ttl_jitter(self):
+        """저장되는 만료 시각이 기준 TTL의 ±10% 범위에 흩어지는지 테스트"""
+        with freeze_time("2024-03-15 12:00:00"):
+            expiries = set()
+            for i in range(20):
+                CacheService.set(f"jdl:test:{i}", i, 100)
+                expiries.add(cache.get(f"jdl:test:{i}")["expiry"] - time.time())
+        self.assertTrue(all(90 <= expiry <= 110 for expiry in expiries))
+        self.assertGreater(len(expiries), 1)
+
+    def test_early_recompute_is_single_flight(self):
+        """조기 재계산 대상이면 한 워커만 다시 계산하고 나머지는 기존 값을 쓰는지 테스트"""
+        CacheService.set("jdl:test", "old", 60, delta=1)
+
+        # 만료 시각을 넘겨 조기 재계산이 확정되도록 함
+        with patch(
+            "blog.services.cache_service.CacheService._should_recompute_early",
+            return_value=True,
+        ):
+            # 다른 워커가 계산 중
+            cache.add("jdl:test:lock", 1)
+            value = CacheService.get_or_set("jdl:test", lambda: "new", 60, "test")
+            self.assertEqual(value, "old")
+
+            cache.delete("jdl:test:lock")
+            value = CacheService.get_or_set("jdl:test", lambda: "new", 60, "test")
+            self.assertEqual(value, "new")
+
+        self.assertEqual(CacheService.get_stats()["test"], {"stale": 1, "recompute": 1})
+        self.assertIsNone(cache.get("jdl:test:lock"))
+
+    def test_xfetch_probability(self):
+        """만료가 멀면 다시 계산하지 않고, 만료가 지나면 항상 다시 계산하는지 테스트"""
+        with freeze_time("2024-03-15 12:00:00"):
+            entry = {"value": 1, "delta": 0.1, "expiry": time.time() + 60}
+            self.assertFalse(CacheService._should_recompute_early(entry))
+            entry["expiry"] = time.time()
+            self.assertTrue(CacheService._should_recompute_early(entry))
+
+    @patch("blog.services.cache_service.RECOMPUTE_WAIT_INTERVAL", 0)
+    def test_miss_waits_for_other_worker(self):
+        """값이 없고 다른 워커가 계산 중이면 계산하지 않고 채워진 값을 기다리는지 테스트"""
+        cache.add("jdl:test:lock", 1)
+
+        def fill(seconds):
+            CacheService.set("jdl:test", "filled", 60)
+
+        with patch("blog.services.cache_service.time.sleep", side_effect=fill):
+            value = CacheService.get_or_set("jdl:test", lambda: "computed", 60, "test")
+        self.assertEqual(value, "filled")
+        self.assertEqual(CacheService.get_stats()["test"], {"miss": 1})
+
+    def test_likes_count_uses_cache(self):
+        """좋아요 수가 CacheService를 통해 캐시되고 토글 시 갱신되는지 테스트"""
+        user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="testpass123"
+        )
+        post = Post.objects.create(
+            blog=user.blog,
+            author=user,
+            title="Test Post",
+            content="Test Content",
+            status="published",
+        )
+        self.assertEqual(post.get_likes_count(), 0)
+        post.likes = 5
+        self.assertEqual(LikeService.get_likes_count(post), 0)
+
+        other = User.objects.create_user(
+            username="otheruser", email="other@example.com", password="testpass123"
+        )
+        LikeService.toggle_like(other, post)
+        self.assertEqual(post.get_likes_count(), 1)
+        self.assertEqual(
+            CacheService.get_stats()["likes"], {"hit": 2, "miss": 1, "recompute": 1}
+        )
+
+    def test_cache_stats_command(self):
+        """카운터 출력 및 초기화 명령 테스트"""
+        CacheService.get_or_set("jdl:test", lambda: 1, 60, "test")
+
+        out = StringIO()
+        call_command("cache_stats", "--reset", stdout=out)
+        self.assertIn("test: miss=1, recompute=1", out.getvalue())
+        self.assertEqual(CacheService.get_stats(), {})
+
+
+@override_settings(
+    AWS_S3_CUSTOM_DOMAIN="media.example.com", AWS_STORAGE_BUCKET_NAME="media"
+)
+class ImageVariantServiceTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="testpass123"
+        )
+        self.s3 = FakeS3Client(buckets=["media"])
+        patcher = patch("blog.media_store.get_s3_client", return_value=self.s3)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        cache.clear()
+
+    def upload(self, key, size, mode="RGB", fmt="JPEG"):
+        """원본 이미지를 업로드하고 변환 대기열에 넣음"""
+        buffer = io.BytesIO()
+        Image.new(mode, size).save(buffer, fmt)
+        self.s3.objects[("media", key)] = (buffer.getvalue(), f"image/{fmt.lower()}")
+        UploadedImage.objects.create(
+            key=key, uploader=self.user, content_type=f"image/{fmt.lower()}"
+        )
+        ImageVariantService.enqueue(key)
+        return f"http://media.example.com/media/{key}"
+
+    def get_width(self, key):
+        return Image.open(io.BytesIO(self.s3.objects[("media", key)][0])).width
+
+    def create_post(self, url):
+        return Post.objects.create(
+            blog=self.user.blog,
+            author=self.user,
+            title="Test Post",
+            content=f'<p>intro</p><img src="{url}" alt="photo">',
+            status="published",
+        )
+
+    def test_build_variants(self):
+        """원본을 변환본 너비별 WebP와 JPEG로 줄여 업로드하는지 테스트"""
+        self.upload("images/a.jpg", (2000, 1000))
+        self.assertEqual(ImageVariantService.process_pending(), 1)
+
+        image = UploadedImage.objects.get(key="images/a.jpg")
+        self.assertEqual(image.status, "ready")
+        self.assertEqual((image.width, image.height), (2000, 1000))
+        self.assertEqual(
+            image.variant_widths, {"thumbnail": 400, "card": 800, "content": 1600}
+        )
+        self.assertEqual(self.get_width("images/a.thumbnail.webp"), 400)
+        self.assertEqual(self.get_width("images/a.content.jpg"), 1600)
+        self.assertEqual(
+            self.s3.objects[("media", "images/a.card.webp")][1], "image/webp"
+        )
+        # 원본은 한 번만 내려받고, 내려받은 내용의 해시를 중복 인덱스에 기록
+        self.assertEqual(self.s3.calls.count("get_object"), 1)
+        self.assertEqual(
+            image.content_hash,
+            hashlib.sha256(self.s3.objects[("media", "images/a.jpg")][0]).hexdigest(),
+        )
+
+    def test_small_transparent_image(self):
+        """원본보다 크게 늘리지 않고, 투명 이미지는 PNG를 기본 형식으로 쓰는지 테스트"""
+        url = self.upload("images/b.png", (300, 200), mode="RGBA", fmt="PNG")
+        ImageVariantService.process_pending()
+
+        image = UploadedImage.objects.get(key="images/b.png")
+        self.assertEqual(image.fallback_format, "png")
+        self.assertEqual(set(image.variant_widths.values()), {300})
+
+        post = self.create_post(url)
+        self.assertIn(
+            'srcset="http://media.example.com/media/images/b.content.png 300w"',
+            post.content,
+        )
+
+    def test_rewrite_posts(self):
+        """변환 전에 저장한 글은 변환 후, 변환 후에 저장한 글은 저장 시 변환본을 쓰는지 테스트"""
+        url = self.upload("images/a.jpg", (2000, 1000))
+        post = self.create_post(url)
+        self.assertEqual(post.thumbnail, url)
+
+        ImageVariantService.process_pending()
+        post.refresh_from_db()
+        self.assertIn('<picture><source type="image/webp"', post.content)
+        self.assertIn("images/a.card.webp 800w", post.content)
+        self.assertIn(
+            'src="http://media.example.com/media/images/a.content.jpg"', post.content
+        )
+        self.assertIn('alt="photo"', post.content)
+        self.assertEqual(
+            post.thumbnail, "http://media.example.com/media/images/a.thumbnail.jpg"
+        )
+
+        # 다시 저장해도 두 번 감싸지 않음
+        content = post.content
+        post.content += "<p>more</p>"
+        post.save()
+        self.assertEqual(post.content, content + "<p>more</p>")
+
+        other = self.create_post(url)
+        self.assertEqual(other.thumbnail, post.thumbnail)
+
+    def test_skip_unsupported_images(self):
+        """애니메이션 GIF 등은 원본을 그대로 사용하는지 테스트"""
+        url = self.upload("images/c.gif", (100, 100), mode="P", fmt="GIF")
+        ImageVariantService.process_pending()
+        self.assertEqual(
+            UploadedImage.objects.get(key="images/c.gif").status, "skipped"
+        )
+        self.assertEqual(self.create_post(url).thumbnail, url)
+
+    def test_failed_image_does_not_block_queue(self):
+        """원본이 없거나 처리 중 오류가 나도 실패로 기록하고 나머지를 처리하는지 테스트"""
+        UploadedImage.objects.create(key="images/missing.jpg", uploader=self.user)
+        ImageVariantService.enqueue("images/missing.jpg")
+        self.upload("images/broken.jpg", (100, 100))
+        self.upload("images/ok.jpg", (100, 100))
+
+        original = ImageVariantService._rewrite_posts
+
+        def rewrite_posts(image):
+            if image.key == "images/broken.jpg":
+                raise RuntimeError("boom")
+            original(image)
+
+        with patch.object(ImageVariantService, "_rewrite_posts", rewrite_posts):
+            self.assertEqual(ImageVariantService.process_pending(), 3)
+
+        statuses = dict(UploadedImage.objects.values_list("key", "status"))
+        self.assertEqual(statuses["images/missing.jpg"], "failed")
+        self.assertEqual(statuses["images/ok.jpg"], "ready")
+        self.assertEqual(get_redis().smembers("jdl:images:pending"), set())
+        self.assertFalse(get_redis().exists("jdl:images:process_lock"))
+
+    def test_duplicate_hash_not_indexed_twice(self):
+        """같은 내용이 이미 인덱스에 있으면 해시를 기록하지 않고 변환은 계속하는지 테스트"""
+        self.upload("images/a.jpg", (100, 100))
+        data = self.s3.objects[("media", "images/a.jpg")][0]
+        UploadedImage.objects.create(
+            key="images/other.jpg",
+            uploader=self.user,
+            content_hash=hashlib.sha256(data).hexdigest(),
+            status="ready",
+        )
+
+        ImageVariantService.process_pending()
+        image = UploadedImage.objects.get(key="images/a.jpg")
+        self.assertEqual((image.content_hash, image.status), (None, "ready"))
+
+    @patch("blog.services.image_service.PROCESS_BATCH_SIZE", 1)
+    def test_process_batch_size(self):
+        """한 번에 PROCESS_BATCH_SIZE개까지만 처리하는지 테스트"""
+        self.upload("images/a.jpg", (100, 100))
+        self.upload("images/b.jpg", (100, 100))
+        self.assertEqual(ImageVariantService.process_pending(), 1)
+        self.assertEqual(ImageVariantService.process_pending(), 1)
+        self.assertEqual(ImageVariantService.process_pending(), 0)
+
+    def test_webp_url(self):
+        self.assertEqual(
+            ImageVariantService.webp_url("http://m/media/a.thumbnail.jpg"),
+            "http://m/media/a.thumbnail.webp",
+        )
+        self.assertIsNone(ImageVariantService.webp_url("http://m/media/a.jpg"))
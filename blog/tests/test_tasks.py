@@ -0,0 +1,173 @@
+import time
+from datetime import timedelta
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from freezegun import freeze_time
+from unittest.mock import patch
+from blog import task_queue
+from blog import tasks
+from blog.redis_store import get_redis
+from blog.services.leaderboard_service import BloggerLeaderboardService
+from blog.services.tag_index_service import TagIndexService
+
+
+class TaskQueueTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        patcher = patch.dict(task_queue.registry, clear=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.calls = []
+
+        @task_queue.task(name="tests.record")
+        def record(value, suffix=""):
+            self.calls.append(f"{value}{suffix}")
+
+        @task_queue.task(name="tests.flaky", max_retries=2, retry_backoff=10)
+        def flaky():
+            self.calls.append("flaky")
+            raise RuntimeError("boom")
+
+        self.record = record
+        self.flaky = flaky
+
+    def tearDown(self):
+        cache.clear()
+
+    def test_delay_and_run(self):
+        """대기열에 넣은 작업을 워커가 인자와 함께 한 번 실행하는지 테스트"""
+        self.assertIsNotNone(self.record.delay("a", suffix="!"))
+        self.record.apply_async(["b"], countdown=60)
+
+        self.assertEqual(task_queue.run_pending(), 1)
+        self.assertEqual(self.calls, ["a!"])
+        self.assertEqual(task_queue.run_pending(), 0)
+        self.assertEqual(task_queue.get_stats(), {"tests.record": {"succeeded": 1}})
+
+        # 직접 호출하면 바로 실행
+        self.record("c")
+        self.assertEqual(self.calls, ["a!", "c"])
+
+    def test_closes_old_connections(self):
+        """작업마다 전후로 오래된 DB 연결을 정리하는지 테스트"""
+        self.record.delay("a")
+        self.flaky.delay()
+        with patch("blog.task_queue.close_old_connections") as close:
+            # 테스트 트랜잭션 안에서는 연결을 닫지 않음
+            self.assertEqual(task_queue.run_pending(limit=1), 1)
+            close.assert_not_called()
+
+            # 워커처럼 트랜잭션 밖에서 실행
+            with patch.object(connection, "in_atomic_block", False):
+                self.assertEqual(task_queue.run_pending(limit=1), 1)
+        self.assertEqual(close.call_count, 2)
+
+    def test_idempotency_key(self):
+        """같은 멱등 키의 작업은 끝나기 전까지 한 번만 들어가는지 테스트"""
+        self.assertIsNotNone(self.record.apply_async(["a"], idempotency_key="k"))
+        self.assertIsNone(self.record.apply_async(["a"], idempotency_key="k"))
+        task_queue.run_pending()
+        self.assertEqual(self.calls, ["a"])
+
+        # 끝난 뒤에는 다시 넣을 수 있음
+        self.assertIsNotNone(self.record.apply_async(["a"], idempotency_key="k"))
+
+    def test_idempotency_key_released_when_payload_missing(self):
+        """작업 내용이 사라진 작업도 멱등 키를 해제하는지 테스트"""
+        job_id = self.record.apply_async(["a"], idempotency_key="k")
+        task_queue.get_redis().hdel(task_queue.JOBS_KEY, job_id)
+
+        self.assertEqual(task_queue.run_pending(), 1)
+        self.assertEqual(self.calls, [])
+        self.assertIsNotNone(self.record.apply_async(["a"], idempotency_key="k"))
+
+    def test_retry_with_backoff(self):
+        """실패한 작업을 간격을 늘려 재시도하고, 횟수를 넘으면 버리는지 테스트"""
+        with freeze_time("2024-01-01 00:00:00") as frozen:
+            self.flaky.delay()
+            task_queue.run_pending()
+            self.assertEqual(task_queue.run_pending(), 0)  # 10초 뒤 재시도
+
+            frozen.tick(timedelta(seconds=10))
+            task_queue.run_pending()
+            frozen.tick(timedelta(seconds=10))
+            self.assertEqual(task_queue.run_pending(), 0)  # 20초 뒤 재시도
+
+            frozen.tick(timedelta(seconds=10))
+            task_queue.run_pending()
+            frozen.tick(timedelta(days=1))
+            self.assertEqual(task_queue.run_pending(), 0)
+
+        self.assertEqual(self.calls, ["flaky"] * 3)
+        self.assertEqual(
+            task_queue.get_stats(), {"tests.flaky": {"retried": 2, "failed": 1}}
+        )
+
+    def test_schedule_periodic(self):
+        """주기 작업을 주기마다 한 번만 대기열에 넣는지 테스트"""
+        task_queue.task(name="tests.periodic", schedule=60)(lambda: None)
+
+        with freeze_time("2024-01-01 00:00:00"):
+            self.assertEqual(task_queue.schedule_periodic(), 1)
+            self.assertEqual(task_queue.schedule_periodic(), 0)
+            self.assertEqual(task_queue.run_pending(), 1)
+            # 주기가 지나기 전에는 다시 넣지 않음
+            self.assertEqual(task_queue.schedule_periodic(), 0)
+
+    def test_requeue_expired(self):
+        """임대가 끝난 작업(중단된 워커)을 다시 실행하는지 테스트"""
+        with freeze_time("2024-01-01 00:00:00") as frozen:
+            job_id = self.record.delay("a")
+            # 워커가 작업을 가져간 뒤 중단됨
+            redis = task_queue.get_redis()
+            redis.zrem(task_queue.QUEUE_KEY, job_id)
+            redis.zadd(
+                task_queue.RUNNING_KEY,
+                {job_id: time.time() + task_queue.JOB_LEASE_SECONDS},
+            )
+            self.assertEqual(task_queue.requeue_expired(), 0)
+
+            frozen.tick(timedelta(seconds=task_queue.JOB_LEASE_SECONDS + 1))
+            self.assertEqual(task_queue.requeue_expired(), 1)
+            task_queue.run_pending()
+        self.assertEqual(self.calls, ["a"])
+
+
+class BlogTasksTests(TestCase):
+    def test_periodic_tasks_registered(self):
+        """조회수 반영, 이미지 변환, 집계 보정, 캐시 예열이 주기 작업으로 등록되는지 테스트"""
+        scheduled = {
+            name for name, task in task_queue.registry.items() if task.schedule
+        }
+        self.assertEqual(
+            scheduled,
+            {
+                "blog.tasks.flush_pending_views",
+                "blog.tasks.update_blog_stats",
+                "blog.tasks.process_pending_images",
+                "blog.tasks.warm_caches",
+            },
+        )
+        self.assertIs(task_queue.registry["blog.tasks.warm_caches"], tasks.warm_caches)
+
+    def test_warm_caches_only_when_missing(self):
+        """순위 캐시가 있으면 다시 만들지 않고, 축출된 경우에만 채우는지 테스트"""
+        cache.clear()
+        self.addCleanup(cache.clear)
+        tasks.warm_caches()
+
+        with patch.object(
+            BloggerLeaderboardService, "rebuild"
+        ) as rebuild, patch.object(TagIndexService, "rebuild_popular") as popular:
+            tasks.warm_caches()
+            rebuild.assert_not_called()
+            popular.assert_not_called()
+
+            get_redis().delete(
+                BloggerLeaderboardService._key(), TagIndexService._popular_key()
+            )
+            tasks.warm_caches()
+            rebuild.assert_called_once_with()
+            popular.assert_called_once_with()
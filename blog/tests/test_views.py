@@ -1,7 +1,18 @@
-from django.test import TestCase, Client
+import hashlib
+import io
+from django.test import TestCase, Client, override_settings
+from django.core.files.uploadedfile import SimpleUploadedFile
+from botocore.exceptions import ClientError
+from unittest.mock import patch
+from blog import media_store
+from django.test.utils import CaptureQueriesContext
+from django.db import connection
+from django.core.cache import cache
 from django.urls import reverse
 from django.contrib.auth import get_user_model
-from blog.models import Post, PostRead, PostLike, Blog
+from blog.models import Post, PostRead, PostLike, Blog, UploadedImage
+from blog.services.image_service import ImageVariantService
+from blog.services.upload_service import ImageUploadService
 from user.models import Follow
 from django.utils.text import slugify
 from freezegun import freeze_time
@@ -683,3 +694,382 @@ class PostDetailViewTest(TestCase):
                 kwargs={"username": self.user.username, "slug": self.post.slug},
             ),
         )
+
+
+class RequestMemoMixinTests(TestCase):
+    """뷰가 요청당 주요 객체를 한 번만 조회하는지 테스트"""
+
+    def setUp(self):
+        cache.clear()
+        self.client = Client()
+        self.owner = User.objects.create_user(
+            username="testuser", email="test@example.com", password="testpass123"
+        )
+        self.viewer = User.objects.create_user(
+            username="viewer", email="viewer@example.com", password="testpass123"
+        )
+        Follow.objects.create(follower=self.viewer, following=self.owner)
+        for i in range(12):
+            self.post = Post.objects.create(
+                blog=self.owner.blog,
+                author=self.owner,
+                title=f"Test Post {i}",
+                content=f"Test Content {i}",
+                status="published",
+            )
+            self.post.tags.add("python")
+
+    def tearDown(self):
+        cache.clear()
+
+    def count_queries(self, url, *patterns):
+        """요청 중 각 패턴으로 시작하는 쿼리 수"""
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return [
+            sum(query["sql"].startswith(pattern) for query in ctx.captured_queries)
+            for pattern in patterns
+        ]
+
+    def test_blog_main_queries(self):
+        """블로그 메인: 블로그, 팔로우 관계, 게시글 페이지를 한 번씩만 조회"""
+        self.client.login(username="viewer", password="testpass123")
+        url = reverse("user_blog_main", kwargs={"username": self.owner.username})
+        self.client.get(url)  # 태그 클라우드 생성
+
+        blog, follow, posts, liked = self.count_queries(
+            url,
+            'SELECT "blog_blog"',
+            'SELECT 1 AS "a" FROM "user_follow"',
+            'SELECT "blog_post"',
+            'SELECT "blog_postlike"',
+        )
+        self.assertEqual((blog, follow, posts, liked), (1, 1, 1, 1))
+
+        # 전체 목록이 아닌 현재 페이지 게시글만 컨텍스트에 전달
+        response = self.client.get(url)
+        self.assertEqual(len(response.context["posts"]), 10)
+        self.assertTrue(response.context["is_following"])
+
+    def test_post_detail_queries(self):
+        """게시글 상세: 게시글, 팔로우 관계를 한 번씩 조회하고 좋아요 여부는 prefetch 사용"""
+        self.client.login(username="viewer", password="testpass123")
+        url = reverse(
+            "user_post_detail",
+            kwargs={"username": self.owner.username, "slug": self.post.slug},
+        )
+        post, follow, liked = self.count_queries(
+            url,
+            'SELECT "blog_post".',
+            'SELECT 1 AS "a" FROM "user_follow"',
+            'SELECT 1 AS "a" FROM "blog_postlike"',
+        )
+        self.assertEqual((post, follow, liked), (1, 1, 0))
+
+        PostLike.objects.create(user=self.viewer, post=self.post)
+        response = self.client.get(url)
+        self.assertTrue(response.context["has_liked"])
+        self.assertTrue(response.context["is_following"])
+        self.assertEqual(PostRead.objects.filter(user=self.viewer).count(), 1)
+
+    def test_post_update_queries(self):
+        """게시글 수정: 소유자 확인과 게시글 조회를 한 번씩만 수행"""
+        self.client.login(username="testuser", password="testpass123")
+        url = reverse(
+            "user_post_update",
+            kwargs={"username": self.owner.username, "slug": self.post.slug},
+        )
+        owner, post = self.count_queries(
+            url,
+            'SELECT "user_customuser"',
+            'SELECT "blog_post"',
+        )
+        # 로그인 사용자 조회 1회 + 블로그 소유자 조회 1회
+        self.assertEqual((owner, post), (2, 1))
+
+
+class FakeS3Client:
+    """객체를 메모리에 저장하고 호출을 기록하는 S3 클라이언트 대역"""
+
+    def __init__(self, buckets=()):
+        self.buckets = set(buckets)
+        self.objects = {}
+        self.policies = {}
+        self.calls = []
+
+    def upload_fileobj(self, fileobj, bucket, key, ExtraArgs=None):
+        self.calls.append("upload_fileobj")
+        self.objects[(bucket, key)] = (fileobj.read(), ExtraArgs["ContentType"])
+
+    def get_object(self, Bucket, Key):
+        self.calls.append("get_object")
+        if (Bucket, Key) not in self.objects:
+            raise ClientError({"Error": {"Code": "NoSuchKey"}}, "GetObject")
+        return {"Body": io.BytesIO(self.objects[(Bucket, Key)][0])}
+
+    def generate_presigned_post(self, Bucket, Key, Fields, Conditions, ExpiresIn):
+        self.calls.append("generate_presigned_post")
+        self.policies[Key] = Conditions
+        return {
+            "url": f"http://minio:9000/{Bucket}",
+            "fields": {**Fields, "key": Key, "policy": "signed"},
+        }
+
+    def head_object(self, Bucket, Key):
+        self.calls.append("head_object")
+        if (Bucket, Key) not in self.objects:
+            raise ClientError({"Error": {"Code": "404"}}, "HeadObject")
+        body, content_type = self.objects[(Bucket, Key)]
+        return {"ContentLength": len(body), "ContentType": content_type}
+
+    def delete_object(self, Bucket, Key):
+        self.calls.append("delete_object")
+        self.objects.pop((Bucket, Key), None)
+
+    def head_bucket(self, Bucket):
+        self.calls.append("head_bucket")
+        if Bucket not in self.buckets:
+            raise ClientError({"Error": {"Code": "404"}}, "HeadBucket")
+
+    def create_bucket(self, Bucket):
+        self.calls.append("create_bucket")
+        self.buckets.add(Bucket)
+
+
+@override_settings(
+    AWS_S3_CUSTOM_DOMAIN="media.example.com", AWS_STORAGE_BUCKET_NAME="media"
+)
+class ImageUploadTests(TestCase):
+    def setUp(self):
+        self.client = Client()
+        self.user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="testpass123"
+        )
+        self.client.login(username="testuser", password="testpass123")
+        self.s3 = FakeS3Client(buckets=["media"])
+        patcher = patch("blog.media_store.get_s3_client", return_value=self.s3)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def upload(self, **files):
+        return self.client.post(
+            reverse("upload_image", kwargs={"username": "testuser"}), files
+        )
+
+    def test_single_upload(self):
+        """버킷 조회 없이 Content-Type과 함께 한 번만 업로드하는지 테스트"""
+        image = SimpleUploadedFile("photo.png", b"png-bytes", content_type="image/png")
+        response = self.upload(images=image)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.s3.calls, ["upload_fileobj"])
+        [((bucket, key), (body, content_type))] = self.s3.objects.items()
+        self.assertEqual(bucket, "media")
+        self.assertTrue(key.startswith("blog/posts/images/") and key.endswith(".png"))
+        self.assertEqual((body, content_type), (b"png-bytes", "image/png"))
+        self.assertEqual(
+            response.json()["location"], f"http://media.example.com/media/{key}"
+        )
+        # 변환본은 워커가 만들도록 대기열에만 넣음
+        image = UploadedImage.objects.get(key=key)
+        self.assertEqual((image.uploader, image.status), (self.user, "pending"))
+
+    def test_rejects_invalid_upload(self):
+        """파일이 없거나 이미지가 아니면 업로드하지 않는지 테스트"""
+        self.assertEqual(self.upload().status_code, 400)
+        text = SimpleUploadedFile("notes.txt", b"text", content_type="text/plain")
+        self.assertEqual(self.upload(file=text).status_code, 400)
+        self.assertEqual(self.s3.calls, [])
+
+    def test_upload_error(self):
+        """업로드 실패 시 500 응답을 반환하는지 테스트"""
+        image = SimpleUploadedFile("photo.png", b"png-bytes", content_type="image/png")
+        error = ClientError({"Error": {"Code": "500"}}, "PutObject")
+        with patch.object(self.s3, "upload_fileobj", side_effect=error):
+            response = self.upload(images=image)
+        self.assertEqual(response.status_code, 500)
+
+    def test_duplicate_upload(self):
+        """같은 내용은 해시 키로 한 번만 올리고 이후에는 기존 URL을 반환하는지 테스트"""
+        first = self.upload(
+            images=SimpleUploadedFile("a.png", b"png-bytes", content_type="image/png")
+        )
+        second = self.upload(
+            images=SimpleUploadedFile("b.png", b"png-bytes", content_type="image/png")
+        )
+
+        content_hash = hashlib.sha256(b"png-bytes").hexdigest()
+        key = f"blog/posts/images/sha256/{content_hash[:2]}/{content_hash}.png"
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(first.json()["location"], second.json()["location"])
+        self.assertEqual(
+            second.json()["location"], f"http://media.example.com/media/{key}"
+        )
+        self.assertEqual(self.s3.calls, ["upload_fileobj"])
+        image = UploadedImage.objects.get(content_hash=content_hash)
+        self.assertEqual(image.key, key)
+
+    def test_duplicate_hash_race(self):
+        """확인 뒤 같은 해시가 다른 키로 기록되었으면 그 원본을 반환하는지 테스트"""
+        content_hash = hashlib.sha256(b"png-bytes").hexdigest()
+        existing = UploadedImage.objects.create(
+            key="blog/posts/images/2024/01/direct.png",
+            content_type="image/png",
+            content_hash=content_hash,
+        )
+        with patch.object(ImageUploadService, "find_existing", return_value=None):
+            response = self.upload(
+                images=SimpleUploadedFile(
+                    "a.png", b"png-bytes", content_type="image/png"
+                )
+            )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.json()["location"],
+            f"http://media.example.com/media/{existing.key}",
+        )
+        # 새로 올린 객체는 지움
+        self.assertEqual(self.s3.calls, ["upload_fileobj", "delete_object"])
+        self.assertEqual(UploadedImage.objects.count(), 1)
+
+    def test_failed_upload_is_requeued(self):
+        """변환에 실패한 원본과 같은 내용을 다시 올리면 다시 변환하는지 테스트"""
+        content_hash = hashlib.sha256(b"png-bytes").hexdigest()
+        failed = UploadedImage.objects.create(
+            key="blog/posts/images/2024/01/direct.png",
+            content_type="image/png",
+            content_hash=content_hash,
+            status="failed",
+        )
+        with patch.object(ImageVariantService, "enqueue") as enqueue:
+            first = self.upload(
+                images=SimpleUploadedFile(
+                    "a.png", b"png-bytes", content_type="image/png"
+                )
+            )
+            # 실패한 행에서 해시를 넘겨받은 새 원본이 변환 대기열에 들어감
+            image = UploadedImage.objects.get(content_hash=content_hash)
+            self.assertNotEqual(image.key, failed.key)
+            self.assertEqual(
+                first.json()["location"], f"http://media.example.com/media/{image.key}"
+            )
+            enqueue.assert_called_once_with(image.key)
+
+            # 같은 키로 다시 올리면 실패한 행을 다시 대기열에 넣음
+            UploadedImage.objects.filter(pk=image.pk).update(status="failed")
+            second = self.upload(
+                images=SimpleUploadedFile(
+                    "b.png", b"png-bytes", content_type="image/png"
+                )
+            )
+        self.assertEqual(second.json()["location"], first.json()["location"])
+        self.assertEqual(UploadedImage.objects.get(pk=image.pk).status, "pending")
+        self.assertEqual(enqueue.call_count, 2)
+
+    def test_presign_duplicate(self):
+        """브라우저가 보낸 해시가 이미 있으면 정책 없이 기존 URL을 반환하는지 테스트"""
+        self.upload(
+            images=SimpleUploadedFile("a.png", b"png-bytes", content_type="image/png")
+        )
+        content_hash = hashlib.sha256(b"png-bytes").hexdigest()
+
+        response = self.presign(
+            filename="a.png", content_type="image/png", sha256=content_hash
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.json()["location"].endswith(f"{content_hash}.png"))
+        self.assertNotIn("generate_presigned_post", self.s3.calls)
+
+        # 모르는 해시는 평소처럼 정책을 발급하고, 형식이 잘못된 해시는 거부
+        response = self.presign(
+            filename="a.png", content_type="image/png", sha256="0" * 64
+        )
+        self.assertIn("fields", response.json())
+        response = self.presign(filename="a.png", content_type="image/png", sha256="x")
+        self.assertEqual(response.status_code, 400)
+
+    def presign(self, **data):
+        return self.client.post(
+            reverse("presign_image_upload", kwargs={"username": "testuser"}), data
+        )
+
+    def complete(self, key):
+        return self.client.post(
+            reverse("complete_image_upload", kwargs={"username": "testuser"}),
+            {"key": key},
+        )
+
+    def test_presigned_upload(self):
+        """정책을 발급받아 직접 올린 뒤 완료 요청으로 등록하는지 테스트"""
+        response = self.presign(
+            filename="photo.png", content_type="image/png", size=1024
+        )
+        self.assertEqual(response.status_code, 200)
+        policy = response.json()
+        key = policy["key"]
+        self.assertRegex(key, r"^blog/posts/images/\d{4}/\d{2}/[0-9a-f-]+\.png$")
+        self.assertEqual(policy["url"], "http://media.example.com/media")
+        self.assertEqual(policy["fields"]["Content-Type"], "image/png")
+        self.assertIn(
+            ["content-length-range", 1, 5 * 1024 * 1024], self.s3.policies[key]
+        )
+
+        # 브라우저가 MinIO에 직접 업로드
+        self.s3.objects[("media", key)] = (b"png-bytes", "image/png")
+
+        response = self.complete(key)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.json()["location"], f"http://media.example.com/media/{key}"
+        )
+        self.assertEqual(UploadedImage.objects.get(key=key).uploader, self.user)
+
+        # 같은 키로 다시 완료할 수 없음
+        self.assertEqual(self.complete(key).status_code, 400)
+
+    def test_presign_validation(self):
+        """이미지가 아니거나 너무 큰 파일은 정책을 발급하지 않는지 테스트"""
+        response = self.presign(filename="a.txt", content_type="text/plain", size=10)
+        self.assertEqual(response.status_code, 400)
+        response = self.presign(
+            filename="a.png", content_type="image/png", size=6 * 1024 * 1024
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertNotIn("generate_presigned_post", self.s3.calls)
+
+        response = self.client.post(
+            reverse("presign_image_upload", kwargs={"username": "otheruser"}),
+            {"filename": "a.png", "content_type": "image/png"},
+        )
+        self.assertEqual(response.status_code, 403)
+
+    def test_complete_validation(self):
+        """발급하지 않은 키, 없는 객체, 정책과 다른 객체는 등록하지 않는지 테스트"""
+        self.assertEqual(self.complete("blog/posts/images/x.png").status_code, 400)
+
+        key = self.presign(filename="a.png", content_type="image/png").json()["key"]
+        self.assertEqual(self.complete(key).status_code, 400)  # 아직 업로드 전
+
+        self.s3.objects[("media", key)] = (b"<html>", "text/html")
+        self.assertEqual(self.complete(key).status_code, 400)
+        self.assertNotIn(("media", key), self.s3.objects)
+        self.assertFalse(UploadedImage.objects.exists())
+
+    def test_ensure_bucket(self):
+        """버킷이 없을 때만 만드는지 테스트"""
+        self.assertFalse(media_store.ensure_bucket())
+        self.s3.buckets.clear()
+        self.assertTrue(media_store.ensure_bucket())
+        self.assertEqual(self.s3.calls, ["head_bucket", "head_bucket", "create_bucket"])
+
+
+class MediaStoreTests(TestCase):
+    def test_client_is_pooled(self):
+        """S3 클라이언트를 한 번만 만들고 재사용하는지 테스트"""
+        with patch.object(media_store, "_client", None), patch(
+            "blog.media_store.boto3.client"
+        ) as client:
+            self.assertIs(media_store.get_s3_client(), media_store.get_s3_client())
+        client.assert_called_once()
@@ -19,6 +19,16 @@ urlpatterns = [
         views.upload_image,
         name="upload_image",
     ),
+    path(
+        "@<str:username>/posts/new/upload_image/presign",
+        views.presign_image_upload,
+        name="presign_image_upload",
+    ),
+    path(
+        "@<str:username>/posts/new/upload_image/complete",
+        views.complete_image_upload,
+        name="complete_image_upload",
+    ),
     path(
         "@<str:username>/posts/drafts/",
         views.UserPostDraftListView.as_view(),
@@ -12,36 +12,48 @@ from django.urls import reverse, reverse_lazy
 from django.http import JsonResponse, Http404, HttpResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.contrib.auth.decorators import login_required
-from django.db import models
-import uuid
-from datetime import datetime
-from .models import Blog, Post, PostRead, PostLike
+import logging
+from botocore.exceptions import BotoCoreError, ClientError
+from django.core.exceptions import ValidationError
+from .models import Blog, Post, PostRead, PostLike, LIST_DEFERRED_FIELDS
 from user.models import CustomUser, Follow
 from django.core.paginator import Paginator, PageNotAnInteger, EmptyPage
 from django.views.decorators.http import require_POST
-from .mixins import PaginatedListMixin, UserContextMixin, HtmxResponseMixin
+from .mixins import (
+    PaginatedListMixin,
+    RequestMemoMixin,
+    UserContextMixin,
+    HtmxResponseMixin,
+)
 import json
+from .media_store import get_media_url, upload_media
 from .services.like_service import LikeService
 from .services.read_service import ReadService
 from .services.post_service import PostService
+from .services.upload_service import ImageUploadService
+from .services.tag_cloud_service import TagCloudService
+
+logger = logging.getLogger(__name__)
 
 
-class BlogOwnerRequiredMixin(UserPassesTestMixin):
+class BlogOwnerRequiredMixin(RequestMemoMixin, UserPassesTestMixin):
     """블로그 소유자 확인 믹스인"""
 
     def test_func(self):
-        blog_owner = get_object_or_404(CustomUser, username=self.kwargs["username"])
-        return self.request.user == blog_owner
+        return self.request.user == self.get_owner()
 
 
-class PostGetObjectMixin:
+class PostGetObjectMixin(RequestMemoMixin):
     """Post 객체 조회 믹스인"""
 
     def get_object(self):
-        return get_object_or_404(
-            Post,
-            blog__owner__username=self.kwargs["username"],
-            slug=self.kwargs["slug"],
+        return self.memoize(
+            "post",
+            lambda: get_object_or_404(
+                Post,
+                blog__owner__username=self.kwargs["username"],
+                slug=self.kwargs["slug"],
+            ),
         )
 
 
@@ -51,10 +63,14 @@ class UserBlogMainView(PaginatedListMixin, UserContextMixin, DetailView):
     context_object_name = "blog"
 
     def get_object(self):
-        return get_object_or_404(Blog, owner__username=self.kwargs["username"])
+        return self.get_blog()
 
     def get_queryset(self):
-        blog = self.get_object()
+        # 페이지네이션과 좋아요 상태 계산이 같은 queryset을 쓰도록 한 번만 생성
+        return self.memoize("posts", self._build_posts_queryset)
+
+    def _build_posts_queryset(self):
+        blog = self.get_blog()
 
         # 선택된 태그 확인
         selected_tag = self.request.GET.get("tag")
@@ -72,31 +88,22 @@ class UserBlogMainView(PaginatedListMixin, UserContextMixin, DetailView):
         # N+1 쿼리 최적화
         return (
             posts.select_related("author", "blog")
-            .prefetch_related(
-                "tags",
-                models.Prefetch(
-                    "liked_by",
-                    queryset=(
-                        CustomUser.objects.filter(id=self.request.user.id)
-                        if self.request.user.is_authenticated
-                        else CustomUser.objects.none()
-                    ),
-                    to_attr="user_likes",
-                ),
-            )
+            .defer(*LIST_DEFERRED_FIELDS)
+            .prefetch_related("tags")
             .order_by("-created_at")
         )
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        blog = self.get_object()
 
-        # 태그 정보 추가
-        context["tags"] = blog.get_tags_with_count()
+        # 태그 정보 추가 (블로그별 태그 클라우드 해시 하나만 읽음)
+        context["tags"] = TagCloudService.get_tags(self.object.id)
         context["selected_tag"] = self.request.GET.get("tag")
 
-        # 게시글 목록 추가
-        context["posts"] = self.get_queryset()
+        # 현재 페이지 게시글 (좋아요 상태는 한 번의 쿼리로 조회)
+        context["posts"] = LikeService.annotate_like_status(
+            self.request.user, context["object_list"]
+        )
 
         return context
 
@@ -105,30 +112,20 @@ class UserPostDetailView(PostGetObjectMixin, UserContextMixin, DetailView):
     model = Post
     template_name = "blog/user_post_detail.html"
     context_object_name = "post"
-    _cached_object = None
 
     def get_object(self):
-        if self._cached_object is None:
-            try:
-                self._cached_object = PostService.get_post_detail(
-                    username=self.kwargs["username"],
-                    slug=self.kwargs["slug"],
-                    user=self.request.user,
-                )
-            except Post.DoesNotExist as e:
-                raise Http404(str(e))
-        return self._cached_object
+        # 조회 기록도 함께 저장되므로 요청당 한 번만 호출
+        return self.memoize("post", self._get_post_detail)
 
-    def get_context_data(self, **kwargs):
-        context = super().get_context_data(**kwargs)
-        if self.request.user.is_authenticated:
-            context["is_following"] = self.request.user.following.filter(
-                following=context["post"].blog.owner
-            ).exists()
-            context["has_liked"] = LikeService.get_like_status(
-                self.request.user, context["post"]
+    def _get_post_detail(self):
+        try:
+            return PostService.get_post_detail(
+                username=self.kwargs["username"],
+                slug=self.kwargs["slug"],
+                user=self.request.user,
             )
-        return context
+        except Post.DoesNotExist as e:
+            raise Http404(str(e))
 
 
 class UserPostCreateView(LoginRequiredMixin, BlogOwnerRequiredMixin, CreateView):
@@ -184,144 +181,91 @@ def upload_image(request, username):
     if request.method != "POST":
         return JsonResponse({"error": "Method not allowed"}, status=405)
 
-    print("\n==== Image Upload Debug ====")
-    print(f"Files in request: {request.FILES}")
-
     # TinyMCE는 'images' 키를 사용
     if "images" not in request.FILES and "file" not in request.FILES:
         return JsonResponse({"error": "No file uploaded"}, status=400)
 
     # TinyMCE의 'images' 키나 일반적인 'file' 키 중 하나를 사용
     file = request.FILES.get("images") or request.FILES.get("file")
-    print(f"File name: {file.name}")
-    print(f"File size: {file.size}")
-    print(f"Content type: {file.content_type}")
 
     if not file.content_type.startswith("image/"):
         return JsonResponse({"error": "File type not supported"}, status=400)
 
-    # 파일 이름 생성 (UUID + 원본 확장자)
-    ext = file.name.split(".")[-1]
-    filename = f"{uuid.uuid4()}.{ext}"
+    # 같은 내용이 이미 있으면 다시 올리지 않고 기존 URL을 반환
+    content_hash = ImageUploadService.hash_file(file)
+    file_url = ImageUploadService.find_existing(content_hash)
+    if file_url:
+        return JsonResponse({"location": file_url, "success": True})
 
-    # 연/월 기반 폴더 구조
-    today = datetime.now()
-    filepath = f"blog/posts/images/{today.year}/{today.month:02d}/{filename}"
+    # 내용 해시로 만든 키 (같은 이미지는 같은 객체와 CDN 캐시를 공유)
+    filepath = ImageUploadService.content_key(
+        content_hash, file.name, file.content_type
+    )
 
+    # 버킷은 배포 시 ensure_media_bucket 명령으로 준비되어 있음
     try:
-        from django.core.files.storage import default_storage
-        from django.conf import settings
-        import boto3
-        from botocore.client import Config
-
-        print("\n==== Storage Configuration ====")
-        print(f"Storage backend: {default_storage.__class__.__name__}")
-        print(f"MinIO endpoint URL: {settings.AWS_S3_ENDPOINT_URL}")
-        print(f"MinIO bucket name: {settings.AWS_STORAGE_BUCKET_NAME}")
-        print(f"AWS access key ID: {settings.AWS_ACCESS_KEY_ID}")
-        print(f"Target filepath: {filepath}")
-
-        # MinIO 클라이언트 초기화
-        s3_client = boto3.client(
-            "s3",
-            endpoint_url=settings.AWS_S3_ENDPOINT_URL,
-            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-            config=Config(signature_version="s3v4"),
-            region_name="us-east-1",
-            verify=False,
-        )
+        file_url = upload_media(file, filepath, file.content_type)
+    except (BotoCoreError, ClientError) as e:
+        logger.exception("Image upload failed: %s", filepath)
+        return JsonResponse({"error": str(e)}, status=500)
 
-        # 버킷 존재 여부 확인
-        try:
-            print("\n==== Checking Bucket ====")
-            s3_client.head_bucket(Bucket=settings.AWS_STORAGE_BUCKET_NAME)
-            print(
-                f"Bucket '{settings.AWS_STORAGE_BUCKET_NAME}' exists and is accessible"
-            )
+    # 반응형 변환본은 process_images 워커가 만든 뒤 게시글 본문에 반영
+    image = ImageUploadService.register(
+        request.user, filepath, file.content_type, content_hash
+    )
+    if image.key != filepath:
+        # 그 사이 같은 내용이 다른 키로 기록되었으면 기존 원본을 사용
+        file_url = get_media_url(image.key)
 
-            # 버킷 내용물 나열
-            print("\n==== Current Bucket Contents ====")
-            response = s3_client.list_objects_v2(
-                Bucket=settings.AWS_STORAGE_BUCKET_NAME
-            )
-            for obj in response.get("Contents", []):
-                print(f"Found object: {obj['Key']}, Size: {obj['Size']} bytes")
-        except Exception as e:
-            print(f"Error checking bucket: {str(e)}")
-            # 버킷이 없으면 생성 시도
-            try:
-                print(
-                    f"Attempting to create bucket '{settings.AWS_STORAGE_BUCKET_NAME}'"
-                )
-                s3_client.create_bucket(Bucket=settings.AWS_STORAGE_BUCKET_NAME)
-                print("Bucket created successfully")
-            except Exception as create_error:
-                print(f"Error creating bucket: {str(create_error)}")
-                return JsonResponse(
-                    {"error": f"Bucket error: {str(create_error)}"}, status=500
-                )
-
-        # 파일 저장
-        print("\n==== Saving File ====")
-        saved_path = default_storage.save(filepath, file)
-        print(f"Saved path: {saved_path}")
-
-        # 직접 파일 업로드 시도
-        try:
-            print("\n==== Direct Upload Attempt ====")
-            file.seek(0)  # 파일 포인터를 처음으로 되돌림
-            s3_client.upload_fileobj(
-                file,
-                settings.AWS_STORAGE_BUCKET_NAME,
-                saved_path,
-                ExtraArgs={"ContentType": file.content_type},
-            )
-            print("Direct upload successful")
-        except Exception as upload_error:
-            print(f"Direct upload error: {str(upload_error)}")
+    return JsonResponse({"location": file_url, "success": True})
 
-        # 파일이 실제로 존재하는지 확인
-        try:
-            print("\n==== Verifying Upload ====")
-            print(f"Checking path: {saved_path}")
-            obj = s3_client.head_object(
-                Bucket=settings.AWS_STORAGE_BUCKET_NAME, Key=saved_path
-            )
-            print(f"File exists in MinIO: Yes")
-            print(f"File size in MinIO: {obj['ContentLength']} bytes")
-            print(f"File content type: {obj['ContentType']}")
-            print(f"File metadata: {obj.get('Metadata', {})}")
-        except Exception as e:
-            print(f"Error verifying file in MinIO: {str(e)}")
-            # 파일 목록 다시 확인
-            try:
-                print("\n==== Updated Bucket Contents ====")
-                response = s3_client.list_objects_v2(
-                    Bucket=settings.AWS_STORAGE_BUCKET_NAME
-                )
-                for obj in response.get("Contents", []):
-                    print(f"Found object: {obj['Key']}, Size: {obj['Size']} bytes")
-            except Exception as list_error:
-                print(f"Error listing bucket contents: {str(list_error)}")
-            return JsonResponse(
-                {"error": f"File verification failed: {str(e)}"}, status=500
-            )
 
-        # URL 생성 (버킷명 포함)
-        file_url = f"http://{settings.AWS_S3_CUSTOM_DOMAIN}/{settings.AWS_STORAGE_BUCKET_NAME}/{saved_path}"
-        print(f"\nGenerated URL: {file_url}")
+@login_required
+@require_POST
+def presign_image_upload(request, username):
+    """브라우저가 MinIO에 직접 올릴 수 있는 업로드 정책 발급"""
+    if request.user.username != username:
+        return JsonResponse({"error": "Permission denied"}, status=403)
 
-        return JsonResponse({"location": file_url, "success": True})
-    except Exception as e:
-        import traceback
+    try:
+        size = int(request.POST["size"]) if request.POST.get("size") else None
+        policy = ImageUploadService.presign(
+            request.user,
+            request.POST.get("filename", ""),
+            request.POST.get("content_type", ""),
+            size,
+            request.POST.get("sha256", "").lower() or None,
+        )
+    except ValueError:
+        return JsonResponse({"error": "Invalid size"}, status=400)
+    except ValidationError as e:
+        return JsonResponse({"error": e.message}, status=400)
+    except (BotoCoreError, ClientError) as e:
+        logger.exception("Image upload presign failed")
+        return JsonResponse({"error": str(e)}, status=500)
 
-        print(f"\n==== Error Details ====")
-        print(f"Error type: {type(e).__name__}")
-        print(f"Error message: {str(e)}")
-        print(f"Traceback:\n{traceback.format_exc()}")
+    return JsonResponse(policy)
+
+
+@login_required
+@require_POST
+def complete_image_upload(request, username):
+    """직접 업로드가 끝난 이미지를 확인하고 등록 (TinyMCE에 돌려줄 URL 반환)"""
+    if request.user.username != username:
+        return JsonResponse({"error": "Permission denied"}, status=403)
+
+    try:
+        file_url = ImageUploadService.complete(
+            request.user, request.POST.get("key", "")
+        )
+    except ValidationError as e:
+        return JsonResponse({"error": e.message}, status=400)
+    except (BotoCoreError, ClientError) as e:
+        logger.exception("Image upload completion failed")
         return JsonResponse({"error": str(e)}, status=500)
 
+    return JsonResponse({"location": file_url, "success": True})
+
 
 class UserPostDraftListView(LoginRequiredMixin, ListView):
     model = Post
@@ -360,9 +304,6 @@ class PostLikeToggleView(LoginRequiredMixin, View):
             return HttpResponse(response_html + count_html)
 
         except Exception as e:
-            import logging
-
-            logger = logging.getLogger(__name__)
             logger.error(f"Like toggle error: {str(e)}")
             return HttpResponse(
                 status=500,
@@ -55,6 +55,7 @@ MIDDLEWARE = [
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     "allauth.account.middleware.AccountMiddleware",
+    "discovery.middleware.AnonymousPageCacheMiddleware",
 ]
 
 ROOT_URLCONF = "config.urls"
@@ -213,12 +214,16 @@ TINYMCE_DEFAULT_CONFIG = {
     "codesample_global_prismjs": True,
     # 이미지 업로드 관련 설정
     "images_upload_url": "upload_image",
+    # 브라우저에서 MinIO로 직접 업로드 (user_post_form.html에 정의)
+    "images_upload_handler": "presignedImageUpload",
     "automatic_uploads": True,
     "images_reuse_filename": False,
     "file_picker_types": "image",
     "images_file_types": "jpg,svg,webp,png,gif",
     "image_advtab": True,
     "image_uploadtab": True,
+    # 업로드 이미지의 반응형 변환본(<picture>)을 편집 시에도 유지
+    "extended_valid_elements": "picture[class],source[type|srcset|sizes|media]",
     # URL 관련 설정
     "relative_urls": False,
     "remove_script_host": True,
@@ -309,6 +314,8 @@ POST_CACHE_TTL = 60 * 15  # 15 minutes
 BLOG_CACHE_TTL = 60 * 30  # 30 minutes
 LIKES_CACHE_TTL = 60 * 5  # 5 minutes
 VIEWS_CACHE_TTL = 60 * 5  # 5 minutes
+PAGE_CACHE_TTL = 60  # 1 minute (비로그인 discovery 페이지)
+PAGE_CACHE_STALE_TTL = 60 * 10  # 10 minutes (다시 만드는 동안 내보내는 시간)
 
 # Cache key prefix
 CACHE_KEY_PREFIX = "jdl"
@@ -0,0 +1,102 @@
+from django.http import HttpResponse
+from blog.services.page_cache_service import PageCacheService
+
+# 비로그인 사용자에게 캐시된 페이지를 내보내는 URL 이름별 설정
+# params: 응답에 영향을 주는 쿼리 파라미터 (그 외 파라미터가 있으면 캐시하지 않음)
+PAGE_CACHE_ROUTES = {
+    "trending_day": {"params": ("period", "cursor", "page")},
+    "recent_posts": {"params": ("cursor", "page")},
+    "popular_bloggers": {"params": ()},
+    "tagged_posts": {"params": ("cursor", "page")},
+}
+
+
+def get_page_tags(url_name, kwargs):
+    """페이지가 의존하는 무효화 태그 목록"""
+    if url_name == "popular_bloggers":
+        return ["bloggers"]
+    if url_name == "tagged_posts":
+        return [f"tag:{kwargs['tag_name']}"]
+    return ["posts"]
+
+
+class AnonymousPageCacheMiddleware:
+    """
+    비로그인 사용자의 discovery 목록 페이지를 통째로 캐시하는 미들웨어.
+
+    신선한 페이지는 바로 내보내고, 오래된 페이지는 한 워커만 다시 만드는 동안
+    다른 요청에 그대로 내보냅니다(stale-while-revalidate).
+    게시글 발행/수정 시 PageCacheService.purge로 관련 태그를 무효화합니다.
+    AuthenticationMiddleware 뒤에 위치해야 합니다.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+
+        pending = getattr(request, "_page_cache", None)
+        if pending is None:
+            return response
+
+        key, versions, refreshing = pending
+        try:
+            if self._is_cacheable(request, response):
+                PageCacheService.store(
+                    key, response.content, response["Content-Type"], versions
+                )
+        finally:
+            if refreshing:
+                PageCacheService.release_refresh(key)
+        response["X-Page-Cache"] = "MISS"
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        if request.method not in ("GET", "HEAD") or request.user.is_authenticated:
+            return None
+
+        url_name = request.resolver_match.url_name
+        route = PAGE_CACHE_ROUTES.get(url_name)
+        if route is None:
+            return None
+
+        # 응답에 쓰이지 않는 파라미터가 섞인 요청은 캐시를 우회
+        # (페이지 링크에 그대로 남아 다른 방문자에게 노출되므로)
+        if set(request.GET) - set(route["params"]):
+            return None
+        params = sorted(
+            (name, request.GET[name])
+            for name in route["params"]
+            if request.GET.get(name)
+        )
+
+        key, entry, fresh, versions = PageCacheService.lookup(
+            request.path, params, get_page_tags(url_name, view_kwargs)
+        )
+        if fresh:
+            return self._cached_response(entry, "HIT")
+
+        refreshing = entry is not None
+        if refreshing and not PageCacheService.acquire_refresh(key):
+            # 다른 워커가 다시 만드는 중이면 오래된 페이지를 내보냄
+            return self._cached_response(entry, "STALE")
+
+        request._page_cache = (key, versions, refreshing)
+        return None
+
+    @staticmethod
+    def _is_cacheable(request, response):
+        """방문자별 정보(쿠키, CSRF 토큰, 세션 변경)가 없는 200 응답만 캐시"""
+        if response.status_code != 200 or response.streaming or response.cookies:
+            return False
+        if request.META.get("CSRF_COOKIE_NEEDS_UPDATE"):
+            return False
+        session = getattr(request, "session", None)
+        return not (session is not None and session.modified)
+
+    @staticmethod
+    def _cached_response(entry, status):
+        response = HttpResponse(entry["content"], content_type=entry["content_type"])
+        response["X-Page-Cache"] = status
+        return response
@@ -114,14 +114,16 @@ class DiscoveryTemplateTests(TestCase):
                 status="published",
             )
 
-        # 첫 페이지 확인
+        # 첫 페이지 확인 (전체 페이지 수 없이 다음 링크만 표시)
         response = self.client.get(reverse("recent_posts"))
         self.assertContains(response, "다음")
-        self.assertContains(response, "page=2")
-        self.assertContains(response, "1 / 2")  # 현재 페이지 / 전체 페이지
+        self.assertNotContains(response, "이전")
+        self.assertNotContains(response, "1 / 2")
+        next_url = response.context["next_page_url"]
+        self.assertIn("cursor=", next_url)
 
         # 두 번째 페이지 확인
-        response = self.client.get(reverse("recent_posts") + "?page=2")
+        response = self.client.get(reverse("recent_posts") + next_url)
         self.assertContains(response, "이전")
-        self.assertContains(response, "page=1")
-        self.assertContains(response, "2 / 2")
+        self.assertNotContains(response, "다음")
+        self.assertEqual(len(response.context["posts"]), 1)
@@ -1,12 +1,14 @@
 from django.test import TestCase, Client
 from django.urls import reverse
 from django.contrib.auth import get_user_model
-from blog.models import Post, Blog
+from django.core.cache import cache
+from blog.models import Post, Blog, PostLike, PostRead
 from user.models import Follow
 from django.utils import timezone
 from datetime import timedelta
 from taggit.models import Tag
 from freezegun import freeze_time
+from unittest.mock import patch
 
 User = get_user_model()
 
@@ -15,6 +17,7 @@ class DiscoveryViewTests(TestCase):
     @freeze_time("2024-03-15 12:00:00")
     def setUp(self):
         """테스트 설정"""
+        cache.clear()
         self.client = Client()
         self.user = User.objects.create_user(
             username="testuser", email="test@example.com", password="testpass123"
@@ -103,6 +106,73 @@ class DiscoveryViewTests(TestCase):
         self.assertIn(self.post, response.context["posts"])
         self.assertIn(self.other_post, response.context["posts"])
 
+    @freeze_time("2024-03-15 12:00:00")
+    def test_list_views_defer_content(self):
+        """목록 페이지에서 content 컬럼을 불러오지 않는지 테스트"""
+        for url in [
+            reverse("recent_posts"),
+            reverse("trending_day") + "?period=week",
+            reverse("tagged_posts", kwargs={"tag_name": "python"}),
+        ]:
+            response = self.client.get(url)
+            posts = list(response.context["posts"])
+            self.assertTrue(posts)
+            for post in posts:
+                self.assertIn("content", post.get_deferred_fields())
+            self.assertContains(response, self.post.excerpt)
+
+    @freeze_time("2024-03-15 12:00:00")
+    def test_cursor_pagination(self):
+        """커서 페이지네이션으로 모든 게시글을 중복 없이 순회하는지 테스트"""
+        # 같은 시각에 작성된 게시글이 많아 id로 순서가 결정됨
+        for i in range(23):
+            post = Post.objects.create(
+                blog=self.blog,
+                author=self.user,
+                title=f"Cursor Post {i}",
+                content=f"Content {i}",
+                status="published",
+            )
+            post.tags.add("python")
+
+        for path, query in [
+            (reverse("recent_posts"), ""),
+            (reverse("trending_day"), "?period=week"),
+            (reverse("tagged_posts", kwargs={"tag_name": "python"}), ""),
+        ]:
+            pages = []
+            next_url = query
+            while next_url is not None:
+                response = self.client.get(path + next_url)
+                pages.append([post.id for post in response.context["posts"]])
+                next_url = response.context["next_page_url"]
+
+            seen = [post_id for page in pages for post_id in page]
+            self.assertEqual([len(page) for page in pages], [10, 10, 5])
+            self.assertEqual(len(set(seen)), 25)
+
+            # 이전 페이지 링크로 돌아가면 직전 페이지와 같아야 함
+            response = self.client.get(path + response.context["previous_page_url"])
+            self.assertEqual([post.id for post in response.context["posts"]], pages[1])
+
+    @freeze_time("2024-03-15 12:00:00")
+    def test_cursor_pagination_invalid_token(self):
+        """잘못된 커서는 첫 페이지로 처리되는지 테스트"""
+        response = self.client.get(reverse("recent_posts") + "?cursor=invalid!!")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.context["posts"]), 2)
+
+    @freeze_time("2024-03-15 12:00:00")
+    def test_list_views_like_status(self):
+        """목록 페이지 게시글에 좋아요 여부가 미리 계산되는지 테스트"""
+        self.other_post.liked_by.add(self.user)
+        self.client.login(username="testuser", password="testpass123")
+
+        response = self.client.get(reverse("recent_posts"))
+        liked = {post.id: post.has_liked for post in response.context["posts"]}
+        self.assertTrue(liked[self.other_post.id])
+        self.assertFalse(liked[self.post.id])
+
     @freeze_time("2024-03-15 12:00:00")
     def test_liked_posts_view(self):
         """좋아요한 포스트 뷰 테스트"""
@@ -139,6 +209,40 @@ class DiscoveryViewTests(TestCase):
         response = self.client.get(reverse("recent_read_posts"))
         self.assertIn(self.other_post, response.context["posts"])
 
+    def test_liked_and_read_posts_paginated_in_db(self):
+        """좋아요/읽은 글 목록을 공개 글만 최근 기록순으로 페이지 단위 조회하는지 테스트"""
+        posts = []
+        for i in range(12):
+            with freeze_time(f"2024-03-15 12:{i:02d}:00"):
+                posts.append(
+                    Post.objects.create(
+                        blog=self.other_blog,
+                        author=self.other_user,
+                        title=f"History Post {i}",
+                        content=f"Content {i}",
+                        status="draft" if i == 5 else "published",
+                    )
+                )
+        # 게시글 작성 순서와 반대로 좋아요/읽기 기록
+        for minute, post in enumerate(reversed(posts)):
+            with freeze_time(f"2024-03-16 09:{minute:02d}:00"):
+                PostLike.objects.create(user=self.user, post=post)
+                PostRead.objects.record_read(self.user, post)
+
+        self.client.login(username="testuser", password="testpass123")
+        expected = [post.id for post in posts if post.status == "published"]
+        for name in ["liked_posts", "recent_read_posts"]:
+            response = self.client.get(reverse(name))
+            first = [post.id for post in response.context["posts"]]
+            self.assertEqual(first, expected[:10])
+
+            response = self.client.get(
+                reverse(name) + response.context["next_page_url"]
+            )
+            second = [post.id for post in response.context["posts"]]
+            self.assertEqual(second, expected[10:])
+            self.assertIsNone(response.context["next_page_url"])
+
     @freeze_time("2024-03-15 12:00:00")
     def test_popular_bloggers_view(self):
         """인기 블로거 뷰 테스트"""
@@ -217,3 +321,102 @@ class DiscoveryViewTests(TestCase):
         )
         self.assertIn(self.post, response.context["posts"])
         self.assertNotIn(self.other_post, response.context["posts"])
+
+
+class AnonymousPageCacheTests(TestCase):
+    @freeze_time("2024-03-15 12:00:00")
+    def setUp(self):
+        cache.clear()
+        self.client = Client()
+        self.user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="testpass123"
+        )
+        self.post = Post.objects.create(
+            blog=self.user.blog,
+            author=self.user,
+            title="Test Post",
+            content="Test Content",
+            status="published",
+        )
+        self.post.tags.add("python")
+
+    def tearDown(self):
+        cache.clear()
+
+    def test_anonymous_page_cached(self):
+        """비로그인 요청의 두 번째 응답은 DB 조회 없이 캐시에서 나가는지 테스트"""
+        url = reverse("recent_posts")
+        response = self.client.get(url)
+        self.assertEqual(response["X-Page-Cache"], "MISS")
+
+        with self.assertNumQueries(0):
+            cached = self.client.get(url)
+        self.assertEqual(cached["X-Page-Cache"], "HIT")
+        self.assertEqual(cached.content, response.content)
+        self.assertContains(cached, "Test Post")
+
+    def test_query_normalized(self):
+        """쿼리 파라미터 순서와 무관하게 같은 캐시를 쓰고, 알 수 없는 파라미터는 우회하는지 테스트"""
+        url = reverse("trending_day")
+        self.client.get(url + "?period=week&cursor=")
+        self.assertEqual(self.client.get(url + "?period=week")["X-Page-Cache"], "HIT")
+        self.assertEqual(self.client.get(url + "?period=month")["X-Page-Cache"], "MISS")
+        self.assertNotIn("X-Page-Cache", self.client.get(url + "?period=week&utm=x"))
+
+    def test_authenticated_bypass(self):
+        """로그인 사용자는 페이지 캐시를 사용하지 않는지 테스트"""
+        url = reverse("recent_posts")
+        self.client.get(url)
+        self.client.login(username="testuser", password="testpass123")
+        response = self.client.get(url)
+        self.assertNotIn("X-Page-Cache", response)
+        self.assertIsNotNone(response.context)
+
+    def test_purge_on_publish(self):
+        """게시글 발행과 태그 추가 시 관련 페이지만 무효화되는지 테스트"""
+        recent = reverse("recent_posts")
+        python = reverse("tagged_posts", kwargs={"tag_name": "python"})
+        django = reverse("tagged_posts", kwargs={"tag_name": "django"})
+        for url in (recent, python, django):
+            self.client.get(url)
+
+        # 임시저장 글은 목록에 나오지 않으므로 무효화하지 않음
+        draft = Post.objects.create(
+            blog=self.user.blog,
+            author=self.user,
+            title="Draft Post",
+            content="Draft Content",
+            status="draft",
+        )
+        self.assertEqual(self.client.get(recent)["X-Page-Cache"], "HIT")
+
+        draft.status = "published"
+        draft.save()
+        response = self.client.get(recent)
+        self.assertEqual(response["X-Page-Cache"], "MISS")
+        self.assertContains(response, "Draft Post")
+
+        self.client.get(python)
+        draft.tags.add("django")
+        self.assertEqual(self.client.get(python)["X-Page-Cache"], "HIT")
+        response = self.client.get(django)
+        self.assertEqual(response["X-Page-Cache"], "MISS")
+        self.assertContains(response, "Draft Post")
+
+    def test_stale_while_revalidate(self):
+        """신선도가 지난 페이지는 한 요청만 다시 만들고 나머지는 오래된 페이지를 받는지 테스트"""
+        url = reverse("recent_posts")
+        with freeze_time("2024-03-15 12:00:00"):
+            self.client.get(url)
+
+        with freeze_time("2024-03-15 12:05:00"):
+            # 다른 워커가 다시 만드는 중
+            with patch(
+                "discovery.middleware.PageCacheService.acquire_refresh",
+                return_value=False,
+            ):
+                response = self.client.get(url)
+            self.assertEqual(response["X-Page-Cache"], "STALE")
+
+            self.assertEqual(self.client.get(url)["X-Page-Cache"], "MISS")
+            self.assertEqual(self.client.get(url)["X-Page-Cache"], "HIT")
@@ -4,60 +4,72 @@ from django.views.generic.base import View
 from django.utils import timezone
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.db.models import Q, Count, F, ExpressionWrapper, FloatField
-from django.contrib.postgres.search import SearchQuery
 from django.conf import settings
 from django.db import models
 from datetime import timedelta
-from blog.models import Post, Blog, PostLike, PostRead
+from blog.models import Post, Blog, LIST_DEFERRED_FIELDS
 from user.models import Follow
-from django.core.cache import cache
+from blog.mixins import CursorPaginationMixin, LikeStatusMixin
+from blog.services.leaderboard_service import (
+    BloggerLeaderboardService,
+    POPULAR_BLOGGERS_LIMIT,
+)
+from blog.services.tag_index_service import TagIndexService
+from blog.services.timeline_service import TimelineService
+from blog.services.trending_service import TrendingService
 
 
-class TrendingPostsView(ListView):
+class TrendingPostsView(LikeStatusMixin, CursorPaginationMixin, ListView):
     model = Post
     template_name = "discovery/trending_posts.html"
     context_object_name = "posts"
     paginate_by = 10
 
-    def get_queryset(self):
+    def get_cursor_paginator(self, queryset, page_size):
+        # Redis 정렬 집합에서 커서 이후의 ID만 읽어 게시글을 일괄 조회
         period = self.request.GET.get("period", "day")
-        days = {"day": 1, "week": 7, "month": 30, "year": 365}.get(period, 1)
-
-        return Post.objects.trending(days=days)
+        return TrendingService.get_paginator(period, page_size)
 
 
-class RecentPostsView(ListView):
+class RecentPostsView(LikeStatusMixin, CursorPaginationMixin, ListView):
     model = Post
     template_name = "discovery/recent_posts.html"
     context_object_name = "posts"
     paginate_by = 10
 
     def get_queryset(self):
-        return Post.objects.published().order_by("-created_at")
+        return Post.objects.published().defer(*LIST_DEFERRED_FIELDS)
 
 
-class LikedPostsView(LoginRequiredMixin, ListView):
+class LikedPostsView(
+    LoginRequiredMixin, LikeStatusMixin, CursorPaginationMixin, ListView
+):
     model = Post
     template_name = "discovery/liked_posts.html"
     context_object_name = "posts"
     paginate_by = 10
+    # 좋아요한 최신순 (같은 사용자의 좋아요는 게시글당 하나이므로 id로 구분)
+    cursor_ordering = ("-liked_at", "-id")
 
     def get_queryset(self):
-        # PostLike 매니저를 사용하여 사용자의 좋아요 목록 조회
-        likes = PostLike.objects.get_user_likes(self.request.user)
-        return [like.post for like in likes if like.post.status == "published"]
+        # 좋아요 기록과 조인해 공개 글만 DB에서 걸러 한 페이지씩 조회
+        return Post.objects.liked_by_user(self.request.user).defer(
+            *LIST_DEFERRED_FIELDS
+        )
 
 
-class RecentReadPostsView(LoginRequiredMixin, ListView):
+class RecentReadPostsView(
+    LoginRequiredMixin, LikeStatusMixin, CursorPaginationMixin, ListView
+):
     model = Post
     template_name = "discovery/recent_read_posts.html"
     context_object_name = "posts"
     paginate_by = 10
+    cursor_ordering = ("-read_at", "-id")
 
     def get_queryset(self):
-        # PostRead 매니저를 사용하여 사용자의 최근 읽은 글 목록 조회
-        reads = PostRead.objects.get_user_reads(self.request.user)
-        return [read.post for read in reads if read.post.status == "published"]
+        # 읽은 기록과 조인해 공개 글만 DB에서 걸러 한 페이지씩 조회
+        return Post.objects.read_by_user(self.request.user).defer(*LIST_DEFERRED_FIELDS)
 
 
 class PopularBloggersView(ListView):
@@ -65,34 +77,24 @@ class PopularBloggersView(ListView):
     context_object_name = "bloggers"
 
     def get_queryset(self):
-        # 캐시 키 생성
-        cache_key = "popular_bloggers"
-        queryset = cache.get(cache_key)
-
-        if queryset is None:
-            # 기본 쿼리 실행
-            queryset = list(Blog.objects.popular()[:10])  # list로 평가
-
-            # 결과 캐싱 (1시간)
-            cache.set(cache_key, queryset, 60 * 60)
+        # 순위 정렬 집합에서 상위 블로그 ID만 읽고 소유자와 함께 조회
+        bloggers = BloggerLeaderboardService.get_top(POPULAR_BLOGGERS_LIMIT)
 
         # 로그인한 사용자의 팔로잉 정보 처리
+        following_ids = set()
         if self.request.user.is_authenticated:
             following_ids = set(
-                Follow.objects.filter(follower=self.request.user).values_list(
-                    "following_id", flat=True
-                )
+                Follow.objects.filter(
+                    follower=self.request.user,
+                    following_id__in=[blog.owner_id for blog in bloggers],
+                ).values_list("following_id", flat=True)
             )
 
-            # 각 블로거의 팔로잉 상태를 미리 계산
-            for blog in queryset:
-                blog.is_followed = blog.owner_id in following_ids
-        else:
-            # 비로그인 사용자는 모두 False로 설정
-            for blog in queryset:
-                blog.is_followed = False
+        # 각 블로거의 팔로잉 상태를 미리 계산
+        for blog in bloggers:
+            blog.is_followed = blog.owner_id in following_ids
 
-        return queryset
+        return bloggers
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
@@ -100,7 +102,7 @@ class PopularBloggersView(ListView):
         return context
 
 
-class SearchView(ListView):
+class SearchView(LikeStatusMixin, ListView):
     model = Post
     template_name = "discovery/search.html"
     context_object_name = "posts"
@@ -111,14 +113,8 @@ class SearchView(ListView):
         if not query:
             return Post.objects.none()
 
-        # PostgreSQL FTS 사용 여부 확인
-        # if settings.DATABASES["default"]["ENGINE"] == "django.db.backends.postgresql":
-        #     search_query = SearchQuery(query, config="simple")
-        #     return Post.objects.published().filter(
-        #         search_vector=search_query
-        #     ).order_by("-created_at")
-
-        return Post.objects.search(query).order_by("-created_at")
+        # PostgreSQL에서는 전문 검색(관련도순), 그 외 DB에서는 icontains(최신순)
+        return Post.objects.search(query).defer(*LIST_DEFERRED_FIELDS)
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
@@ -126,22 +122,17 @@ class SearchView(ListView):
         return context
 
 
-class FollowingPostsView(LoginRequiredMixin, ListView):
+class FollowingPostsView(
+    LoginRequiredMixin, LikeStatusMixin, CursorPaginationMixin, ListView
+):
     model = Post
     template_name = "discovery/following_posts.html"
     context_object_name = "posts"
     paginate_by = 10
 
-    def get_queryset(self):
-        # 현재 사용자가 팔로우하는 사용자들의 ID 목록을 가져옴
-        following_users = Follow.objects.filter(follower=self.request.user).values_list(
-            "following", flat=True
-        )
-
-        # 팔로우하는 사용자들의 게시글을 최신순으로 가져옴
-        return Post.objects.filter(
-            blog__owner__in=following_users, status="published"
-        ).order_by("-updated_at")
+    def get_cursor_paginator(self, queryset, page_size):
+        # 팔로워별 타임라인 키 하나를 읽고 해당 게시글만 일괄 조회
+        return TimelineService.get_paginator(self.request.user, page_size)
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
@@ -152,17 +143,22 @@ class FollowingPostsView(LoginRequiredMixin, ListView):
         return context
 
 
-class TaggedPostsView(ListView):
+class TaggedPostsView(LikeStatusMixin, CursorPaginationMixin, ListView):
     model = Post
     template_name = "discovery/tagged_posts.html"
     context_object_name = "posts"
     paginate_by = 10
 
-    def get_queryset(self):
-        tag_name = self.kwargs.get("tag_name")
-        return Post.objects.by_tag(tag_name)
+    def get_cursor_paginator(self, queryset, page_size):
+        # 태그별 게시글 ID 정렬 집합에서 한 페이지만 읽고 게시글을 일괄 조회
+        return TagIndexService.get_paginator(self.kwargs.get("tag_name"), page_size)
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context["tag_name"] = self.kwargs.get("tag_name")
+        # 페이지네이션과 별개로 헤더에 표시할 태그 게시글 수
+        context["tag_posts_count"] = TagIndexService.get_posts_count(
+            context["tag_name"]
+        )
+        context["popular_tags"] = TagIndexService.get_popular_tags()
         return context
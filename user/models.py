@@ -15,20 +15,33 @@ def validate_image_size(file):
         raise ValidationError("이미지 크기는 5MB를 초과할 수 없습니다.")
 
 
+# 프로필 이미지 검증 시 읽는 최대 바이트 수 (형식과 크기가 담긴 헤더만 확인)
+PROFILE_IMAGE_HEADER_BYTES = 256 * 1024
+
+# 프로필 이미지 최대 픽셀 수 (디코딩 시 메모리를 폭증시키는 이미지 차단)
+PROFILE_IMAGE_MAX_PIXELS = 4096 * 4096
+
+
 def validate_image(file):
-    """이미지 파일 유효성 검사"""
+    """이미지 파일 유효성 검사 (헤더와 크기만 읽음)"""
     if file:
+        # 이미 저장된 파일은 업로드할 때 검증했으므로 스토리지에서 다시 읽지 않음
+        if getattr(file, "_committed", False):
+            return file
+        # 파일 크기 검증
+        validate_image_size(file)
         try:
-            # 파일 크기 검증
-            validate_image_size(file)
-            # 파일 포인터를 처음으로 되돌림
             file.seek(0)
-            img = Image.open(io.BytesIO(file.read()))
-            img.verify()  # 이미지 파일 검증
+            header = file.read(PROFILE_IMAGE_HEADER_BYTES)
             file.seek(0)  # 파일 포인터를 다시 처음으로
-            return file
+            # Image.open은 헤더만 파싱하고 픽셀은 디코딩하지 않음
+            with Image.open(io.BytesIO(header)) as img:
+                width, height = img.size
         except Exception:
             raise ValidationError("유효한 이미지 파일이 아닙니다.")
+        if width * height > PROFILE_IMAGE_MAX_PIXELS:
+            raise ValidationError("이미지 해상도가 너무 큽니다.")
+        return file
 
 
 def validate_url(value):
@@ -90,7 +103,8 @@ class CustomUser(AbstractUser):
         return None
 
     def save(self, *args, **kwargs):
-        if self.profile_image:
+        # 새로 지정한 파일만 검증 (로그인, 다른 필드 수정 시에는 건너뜀)
+        if self.profile_image and not self.profile_image._committed:
             validate_image(self.profile_image)
         super().save(*args, **kwargs)
 
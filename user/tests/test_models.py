@@ -4,6 +4,8 @@ from django.core.exceptions import ValidationError
 from django.core.files.uploadedfile import SimpleUploadedFile
 from unittest.mock import patch
 from ..models import Follow
+from PIL import Image
+import io
 import os
 import datetime
 
@@ -114,6 +116,32 @@ class CustomUserTests(TestCase):
         with self.assertRaises(ValidationError):
             self.user.save()
 
+    def test_unchanged_image_not_revalidated(self):
+        """저장된 이미지는 다른 필드를 수정할 때 다시 읽지 않는지 테스트"""
+        image_content = b"GIF87a\x01\x00\x01\x00\x80\x01\x00\x00\x00\x00ccc,\x00\x00\x00\x00\x01\x00\x01\x00\x00\x02\x02D\x01\x00;"
+        self.user.profile_image = SimpleUploadedFile(
+            "test_image.gif", image_content, content_type="image/gif"
+        )
+        self.user.save()
+
+        with patch("user.models.Image.open") as image_open:
+            self.user.email = "new@example.com"
+            self.user.save()
+            User.objects.get(pk=self.user.pk).save()
+        image_open.assert_not_called()
+
+    @patch("user.models.PROFILE_IMAGE_MAX_PIXELS", 100)
+    def test_oversized_dimensions(self):
+        """해상도가 제한을 넘는 이미지는 헤더만 보고 거부하는지 테스트"""
+        buffer = io.BytesIO()
+        Image.new("RGB", (20, 20)).save(buffer, "PNG")
+        self.user.profile_image = SimpleUploadedFile(
+            "big.png", buffer.getvalue(), content_type="image/png"
+        )
+
+        with self.assertRaises(ValidationError):
+            self.user.save()
+
     def test_superuser_creation(self):
         """슈퍼유저 생성 테스트"""
         admin_user = User.objects.create_superuser(